@@ -8,21 +8,263 @@ Offline behavior:
 - CSV/TSV supported via stdlib `csv`
 - XLSX/XLS supported if `openpyxl` is installed (optional)
 - JSON supported via stdlib `json`
+- Chunk cleaning is vectorized if `numpy` (and optionally `pandas`) is installed
 """
 
 from __future__ import annotations
 
+import array
+import codecs
+import collections
+import concurrent.futures
+import contextlib
 import csv
 import dataclasses
 import datetime as _dt
+import functools
+import hashlib
+import heapq
 import io
+import itertools
 import json
+import marshal
+import math
+import mmap
+import operator
 import os
+import random
 import re
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
 import typing as t
+import zipfile
+
+try:
+    import resource
+except ImportError:  # Windows: no getrusage, so no "rss" stage memory metric
+    resource = None
 
 from shared_utils import ServiceError, slugify_header, utc_now_iso
 
+# Precompiled hot-path patterns for cell normalization
+_THOUSANDS_NUMBER_RE = re.compile(r"-?\d{1,3}(,\d{3})+(\.\d+)?")
+_DATE_CANDIDATE_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}$|\d{1,2}[/-]\d{1,2}[/-]\d{2,4}$|\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}"
+)
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_SLASH_DATE_RE = re.compile(r"(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})")
+_NUMERIC_LEFT_RE = re.compile(r"^-?\d{1,3}$")
+_NUMERIC_MID_RE = re.compile(r"^\d{3}$")
+_NUMERIC_RIGHT_RE = re.compile(r"^\d{3}(\.\d+)?$")
+
+_PLAIN_NUMBER_RE = re.compile(r"-?(\d{1,3}(,\d{3})+|\d+)(\.\d+)?")
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+_PHONE_RE = re.compile(r"\+?[\d\s().-]{7,}")
+
+# Max memoized raw values per column; sized for the low-cardinality columns
+# (status, state, lead source, dates) that dominate CRM exports.
+NORMALIZER_CACHE_SIZE = 4096
+
+# Dedup index: in-memory digest table budget before spilling to disk, and
+# the number of hash-range partitions spilled digests are bucketed into.
+DEDUP_MEMORY_LIMIT = 256 * 1024 * 1024
+DEDUP_SPILL_PARTITIONS = 64
+
+# Near-duplicate detection (MinHash + LSH banding): signature length, LSH
+# bands (permutations per band = perms / bands) and the default estimated
+# Jaccard similarity two rows need to be clustered.
+NEAR_DUP_NUM_PERM = 64
+NEAR_DUP_BANDS = 16
+NEAR_DUP_THRESHOLD = 0.6
+NEAR_DUP_CELL_CACHE_SIZE = 16384
+_MINHASH_PRIME = (1 << 61) - 1
+_MINHASH_PARAMS = tuple(
+    (random.Random(seed).randrange(1, _MINHASH_PRIME), random.Random(-seed).randrange(_MINHASH_PRIME))
+    for seed in range(1, NEAR_DUP_NUM_PERM + 1)
+)
+_NEAR_DUP_TOKEN_RE = re.compile(r"[^a-z0-9]+")
+_NEAR_DUP_STOP_TOKENS = frozenset({"inc", "llc", "ltd", "co", "corp", "corporation", "company", "the"})
+
+# Column profiles, built from bounded-memory sketches in the same pass as cleaning: HyperLogLog
+# precision (2**p one-byte registers, ~1.04 / sqrt(2**p) relative error on distinct counts),
+# Space-Saving counters per column, top values reported, and reservoir sample size
+COLUMN_PROFILE_HLL_PRECISION = 12
+COLUMN_PROFILE_COUNTERS = 64
+COLUMN_PROFILE_TOP_VALUES = 10
+COLUMN_PROFILE_SAMPLE_SIZE = 20
+
+# Cleaning pipeline stages, in the order every job runs them; wall/CPU time, rows and
+# memory per stage are reported in DataCleanReport.stage_metrics (wall time alone in stage_timings)
+PIPELINE_STAGES = ("parse", "reconcile", "normalize", "filter", "dedup", "profile", "sink")
+
+# Stage memory metric: "rss" is how far a stage pass raised the process's peak RSS (nearly
+# free, but passes after the first rarely raise it), "tracemalloc" the peak of traced Python
+# allocations during the pass (exact, but slows cleaning while tracing); "off" skips it
+MEMORY_METRICS = ("off", "rss", "tracemalloc")
+
+# Sampling profiler: seconds between stack samples, and the default job duration from
+# which a profile is written to the engine's profile_dir
+PROFILE_INTERVAL = 0.005
+PROFILE_MIN_SECONDS = 30.0
+
+# Progress callbacks name the phase a streaming clean is in: chunks flowing through the
+# pipeline, the whole-table near-duplicate pass, then output generation
+PROGRESS_STAGES = ("clean", "near_duplicates", "export")
+
+# Chunk cleaning backends: "auto" vectorizes with NumPy (plus pandas, when installed)
+# and falls back to per-cell Python otherwise; every backend yields identical output
+CLEAN_BACKENDS = ("auto", "python", "numpy")
+
+# Sniffing: bytes read from the head of an upload to settle type, encoding, dialect and
+# header presence; candidate delimiters; sample rows checked for a header
+SNIFF_SAMPLE_BYTES = 64 * 1024
+SNIFF_DELIMITERS = ",;\t|"
+SNIFF_HEADER_ROWS = 20
+FILE_TYPE_EXTENSIONS = {
+    ".csv": "csv", ".tsv": "tsv", ".xlsx": "excel", ".xls": "excel",
+    ".json": "json", ".ndjson": "json", ".jsonl": "json",
+}
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, "utf-32"), (codecs.BOM_UTF32_BE, "utf-32"), (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"), (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_CP1252_UNDEFINED = frozenset(b"\x81\x8d\x8f\x90\x9d")
+_JSON_START_RE = re.compile(rb"\s*(\{\s*[\"}]|\[\s*[\[{\"\d\-tfn\]])")
+
+# Irrelevant-row filter: rows with more than this share of empty cells are dropped,
+# and the default test-data rules (row text starting or ending with an indicator)
+IRRELEVANT_MAX_EMPTY_RATIO = 0.8
+DEFAULT_TEST_DATA_INDICATORS = (
+    "test", "example", "sample", "dummy", "placeholder",
+    "lorem ipsum", "xxx", "aaa", "123", "test@test.com",
+)
+FILTER_MATCH_MODES = ("edge", "prefix", "suffix", "contains", "exact")
+
+# Columnar table: a column stays dictionary-encoded until it has at least this
+# many distinct values and more than this share of its cells are distinct.
+COLUMNAR_DICT_MIN_VALUES = 1024
+COLUMNAR_DICT_MAX_RATIO = 0.5
+
+# Schema inference: rows sampled per job, and the share of non-empty sampled
+# values that must match a type for the column to be classified as that type.
+SCHEMA_SAMPLE_ROWS = 1000
+SCHEMA_TYPE_THRESHOLD = 0.8
+
+# Local CSV files (clean_csv_file): bytes of the memory-mapped input handed to the decoder
+# per window, and the output writer's buffer size
+CSV_FILE_WINDOW_BYTES = 1 << 20
+CSV_FILE_WRITE_BUFFER = 1 << 20
+
+# JSON ingest: characters decoded per read from the upload (doubled while a single
+# record is larger than the buffer), and the spool batch size
+JSON_READ_SIZE = 1 << 20
+JSON_SPOOL_BATCH_ROWS = 1000  # flattened rows per marshal record in the header-discovery spool
+_JSON_WS_RE = re.compile(r"[ \t\n\r]*")
+
+# XLSX export: data rows per worksheet (Excel's 1,048,576-row limit less the header);
+# larger exports continue on "Cleaned Data (2)", "Cleaned Data (3)", ...
+EXCEL_MAX_DATA_ROWS = 1048575
+
+# In-memory exports (clean_file_streaming without an `output_dir`): JSON and Excel outputs
+# past these row counts are skipped rather than built in memory; with an `output_dir`
+# every format is streamed to disk and nothing is capped
+IN_MEMORY_JSON_MAX_ROWS = 100000
+IN_MEMORY_EXCEL_MAX_ROWS = 50000
+
+# Result cache: default disk budget, and a version folded into every options hash so
+# cached results are invalidated when cleaning behavior changes
+RESULT_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+RESULT_CACHE_VERSION = 2
+
+# Batch cleaning: a file's peak memory is estimated as this multiple of its size (parsed
+# rows, the cleaned table and rendered outputs), and files are cleaned concurrently only
+# while the estimates of those in flight fit the batch memory budget
+BATCH_MEMORY_PER_INPUT_BYTE = 16
+BATCH_MEMORY_BUDGET = 2 * 1024 * 1024 * 1024
+
+# Delta cleaning: snapshot layout version (a snapshot written by another version is
+# rejected, forcing a full clean) and the files a snapshot directory holds
+DELTA_SNAPSHOT_VERSION = 3
+DELTA_SNAPSHOT_FILES = {
+    "meta": "snapshot.json",  # headers, options, filter rules and column schema of the run
+    "rows": "rows.csv",  # cleaned form of every distinct source row, before dedup, no header
+    "index": "index.bin",  # _SnapshotIndex: source-row digest -> its cleaned row in rows.csv
+    "merged_index": "merged_index.bin",  # _SnapshotIndex: cleaned-row digest -> the row in cleaned.csv
+    "merged": "cleaned.csv",  # the full cleaned output
+    "inserted": "inserted.csv",
+    "updated": "updated.csv",
+    "updated_previous": "updated_previous.csv",
+    "deleted": "deleted.csv",
+}
+
+# Master outputs clean_file_streaming writes into an `output_dir` through the row sinks
+# (output name -> export format, file name), and how many leading characters of the
+# written CSV it returns as outputs["csv_preview"]
+MASTER_OUTPUT_FILES = {
+    "master_cleanse_csv": ("csv", "master_cleanse.csv"),
+    "master_cleanse_json": ("json", "master_cleanse.json"),
+    "master_cleanse_excel": ("excel", "master_cleanse.xlsx"),
+}
+CSV_PREVIEW_CHARS = 2000
+
+# Column files: formats that can be rendered per column, and their file extensions
+COLUMN_FILE_FORMATS = {"csv": "csv", "json": "json", "excel": "xlsx"}
+COLUMN_ZIP_CHUNK_SIZE = 64 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _vector_modules() -> tuple[t.Any, t.Any] | None:
+    """(numpy, pandas-or-None) for the vectorized backend, or None without NumPy."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    try:
+        import pandas
+    except ImportError:
+        pandas = None
+    return numpy, pandas
+
+
+@dataclasses.dataclass
+class StageMetrics:
+    """Resource use of one pipeline stage, summed over every pass (chunk) of a job."""
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0  # CPU time of the thread (or pool worker) running the stage
+    rows_in: int = 0
+    rows_out: int = 0
+    peak_memory_bytes: int = 0  # largest single-pass growth (see DataCleanReport.memory_metric)
+    
+    def add(self, other: "StageMetrics") -> None:
+        self.wall_seconds += other.wall_seconds
+        self.cpu_seconds += other.cpu_seconds
+        self.rows_in += other.rows_in
+        self.rows_out += other.rows_out
+        self.peak_memory_bytes = max(self.peak_memory_bytes, other.peak_memory_bytes)
+
+
+@dataclasses.dataclass
+class ColumnProfile:
+    """
+    Value profile of one output column over the cleaned rows. Counts of rows and nulls
+    are exact; the rest come from fixed-size sketches, so they are estimates.
+    """
+    column_type: str | None = None  # ColumnSchema type, when types were inferred
+    rows: int = 0
+    nulls: int = 0  # empty cells
+    null_rate: float = 0.0
+    distinct: int = 0  # HyperLogLog estimate of distinct non-empty values
+    top_values: list[tuple[str, int]] = dataclasses.field(default_factory=list)  # Space-Saving (value, count)
+    top_values_error: int = 0  # each top value's count overstates the true count by at most this
+    sample: list[str] = dataclasses.field(default_factory=list)  # uniform reservoir of non-empty values
+    min_value: str | None = None  # date columns (ISO) and numeric columns
+    max_value: str | None = None
+
 
 @dataclasses.dataclass
 class DataCleanReport:
@@ -39,6 +281,1438 @@ class DataCleanReport:
     field_mappings: dict[str, str] = dataclasses.field(default_factory=dict)
     duplicates_removed: int = 0
     irrelevant_rows_removed: int = 0
+    column_types: dict[str, str] = dataclasses.field(default_factory=dict)
+    date_conventions: dict[str, str] = dataclasses.field(default_factory=dict)
+    near_duplicate_clusters: list[list[int]] = dataclasses.field(default_factory=list)
+    near_duplicates_merged: int = 0
+    stage_timings: dict[str, float] = dataclasses.field(default_factory=dict)  # seconds per PIPELINE_STAGES entry
+    irrelevant_rows_by_rule: dict[str, int] = dataclasses.field(default_factory=dict)  # FilterRule name -> rows removed
+    stage_metrics: dict[str, StageMetrics] = dataclasses.field(default_factory=dict)  # per PIPELINE_STAGES entry
+    memory_metric: str | None = None  # how StageMetrics.peak_memory_bytes was measured (MEMORY_METRICS)
+    profile_path: str | None = None  # sampling profile, for jobs that ran at least profile_min_seconds
+    column_profiles: dict[str, ColumnProfile] = dataclasses.field(default_factory=dict)  # output header -> profile
+
+
+# Called as (stage, report) while a clean advances; stage is a PROGRESS_STAGES entry and
+# the report's row counts are live
+ProgressCallback = t.Callable[[str, DataCleanReport], None]
+
+
+@dataclasses.dataclass
+class DeltaCleanResult:
+    """Outcome of ApexDataCleanEngine.clean_delta; the row sets are CSV files in `snapshot_dir`."""
+    snapshot_dir: str  # the new snapshot; pass it as the prior snapshot of the next run
+    merged_path: str  # full cleaned output for the new export
+    inserted_path: str
+    updated_path: str  # new version of each updated row, paired by `key` ...
+    updated_previous_path: str  # ... and its prior version, at the same row position
+    deleted_path: str
+    report: DataCleanReport
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0  # cleaned rows the prior snapshot already had
+    rows_reused: int = 0  # source rows unchanged since the snapshot: cleaned form copied, not recomputed
+    rows_cleaned: int = 0
+
+
+class _StageMeter:
+    """
+    Measures stage passes into a StageMetrics dict (and, for a report, its wall-time
+    `stage_timings`). Passes with `rows_in` None add time and memory but no row counts.
+    """
+    
+    def __init__(
+        self,
+        metrics: dict[str, StageMetrics],
+        memory_metric: str | None = None,
+        timings: dict[str, float] | None = None,
+    ) -> None:
+        self.metrics = metrics
+        self.memory_metric = memory_metric
+        self.timings = timings
+    
+    @classmethod
+    def for_report(cls, report: DataCleanReport) -> "_StageMeter":
+        return cls(report.stage_metrics, report.memory_metric, report.stage_timings)
+    
+    @contextlib.contextmanager
+    def measure(self, stage: str, rows_in: int | None = None) -> t.Iterator[StageMetrics]:
+        """Time the block as one pass of `stage`; set rows_out on the yielded pass if rows are dropped"""
+        sample = StageMetrics(rows_in=rows_in or 0, rows_out=rows_in or 0)
+        if self.memory_metric == "tracemalloc":
+            tracemalloc.reset_peak()
+            memory0 = tracemalloc.get_traced_memory()[0]
+        elif self.memory_metric == "rss":
+            memory0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        wall0, cpu0 = time.perf_counter(), time.thread_time()
+        try:
+            yield sample
+        finally:
+            sample.wall_seconds = time.perf_counter() - wall0
+            sample.cpu_seconds = time.thread_time() - cpu0
+            if self.memory_metric == "tracemalloc":
+                sample.peak_memory_bytes = max(0, tracemalloc.get_traced_memory()[1] - memory0)
+            elif self.memory_metric == "rss":
+                # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+                grown = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - memory0
+                sample.peak_memory_bytes = grown if sys.platform == "darwin" else grown * 1024
+            self.add(stage, sample)
+    
+    def add(self, stage: str, sample: StageMetrics) -> None:
+        self.metrics.setdefault(stage, StageMetrics()).add(sample)
+        if self.timings is not None:
+            self.timings[stage] = self.timings.get(stage, 0.0) + sample.wall_seconds
+
+
+class _HyperLogLog:
+    """
+    Distinct-value counter (HyperLogLog) in 2**precision one-byte registers. Hashes are
+    blake2b-64, so estimates are the same in every process and run.
+    """
+    
+    def __init__(self, precision: int = COLUMN_PROFILE_HLL_PRECISION) -> None:
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+    
+    def add_many(self, values: t.Iterable[str]) -> None:
+        registers = self.registers
+        p = self.precision
+        mask = (1 << p) - 1
+        width = 64 - p
+        blake2b = hashlib.blake2b
+        for value in values:
+            h = int.from_bytes(blake2b(value.encode("utf-8", "surrogatepass"), digest_size=8).digest(), "little")
+            # Rank: position of the leftmost 1 in the bits left after the register index
+            rank = width - (h >> p).bit_length() + 1
+            if rank > registers[h & mask]:
+                registers[h & mask] = rank
+    
+    def count(self) -> int:
+        m = len(self.registers)
+        harmonic = sum(n * 2.0 ** -rank for rank, n in collections.Counter(self.registers).items())
+        estimate = 0.7213 / (1 + 1.079 / m) * m * m / harmonic
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)  # linear counting, exact-ish for small cardinalities
+        return round(estimate)
+
+
+class _SpaceSaving:
+    """
+    Top-k values (Space-Saving) in at most `capacity` counters, fed exact counts a chunk
+    at a time. Unmonitored values enter at `error`, the largest count evicted so far, so
+    every count is an upper bound that overstates the true count by at most `error`.
+    """
+    
+    def __init__(self, capacity: int = COLUMN_PROFILE_COUNTERS) -> None:
+        self.capacity = capacity
+        self.counts: dict[str, int] = {}
+        self.error = 0
+    
+    def update(self, counts: t.Mapping[str, int]) -> None:
+        table = self.counts
+        floor = self.error
+        for value, n in counts.items():
+            table[value] = table.get(value, floor) + n
+        if len(table) > self.capacity:
+            kept = heapq.nlargest(self.capacity + 1, table.items(), key=operator.itemgetter(1))
+            self.error = max(self.error, kept.pop()[1])
+            self.counts = dict(kept)
+    
+    def top(self, n: int) -> list[tuple[str, int]]:
+        return heapq.nlargest(n, self.counts.items(), key=operator.itemgetter(1))
+
+
+class _Reservoir:
+    """
+    Uniform sample of `size` values from a stream (reservoir sampling, Algorithm L):
+    random draws happen only for values that enter the sample, not for every value.
+    """
+    
+    def __init__(self, size: int = COLUMN_PROFILE_SAMPLE_SIZE, seed: int = 0) -> None:
+        self.size = size
+        self.items: list[str] = []
+        self.seen = 0
+        self._random = random.Random(seed)
+        self._weight = 1.0
+        self._next = size  # stream position of the next value to enter the sample
+    
+    def _uniform(self) -> float:
+        return self._random.random() or 2.0 ** -53  # in (0, 1)
+    
+    def _skip(self) -> None:
+        self._weight *= math.exp(math.log(self._uniform()) / self.size)
+        self._next += math.floor(math.log(self._uniform()) / math.log(1 - self._weight)) + 1
+    
+    def extend(self, values: list[str]) -> None:
+        base, end = self.seen, self.seen + len(values)
+        if len(self.items) < self.size:
+            self.items.extend(values[: self.size - len(self.items)])
+            if len(self.items) == self.size:
+                self._next = self.size - 1
+                self._skip()
+        while self._next < end:
+            self.items[self._random.randrange(self.size)] = values[self._next - base]
+            self._skip()
+        self.seen = end
+
+
+def _profile_number(value: str) -> float | None:
+    try:
+        number = float(value.replace(",", ""))
+    except ValueError:
+        return None
+    return number if math.isfinite(number) else None
+
+
+class _ColumnProfiler:
+    """
+    Builds a ColumnProfile per column over a stream of cleaned row chunks, in constant
+    memory per column. Each chunk's values are counted exactly first (collections.Counter,
+    at C speed), so the sketches only see a chunk's distinct values once each.
+    """
+    
+    def __init__(self, headers: list[str], column_types: dict[str, str]) -> None:
+        self.headers = headers
+        self.column_types = [column_types.get(header) for header in headers]
+        self.rows = 0
+        self.nulls = [0] * len(headers)
+        self.distinct = [_HyperLogLog() for _ in headers]
+        self.top = [_SpaceSaving() for _ in headers]
+        self.samples = [_Reservoir(seed=i) for i in range(len(headers))]
+        # (sort key, value) of the smallest and largest date / numeric value per column
+        self.bounds: list[tuple[tuple[t.Any, str], tuple[t.Any, str]] | None] = [None] * len(headers)
+    
+    def add(self, rows: t.Sequence[t.Sequence[str]]) -> None:
+        if not rows:
+            return
+        self.rows += len(rows)
+        for i, values in enumerate(zip(*rows)):
+            counts = collections.Counter(values)
+            self.nulls[i] += counts.pop("", 0)
+            self.distinct[i].add_many(counts)
+            self.top[i].update(counts)
+            self.samples[i].extend(list(filter(None, values)))
+            
+            column_type = self.column_types[i]
+            if column_type == "date":
+                keyed = [(value, value) for value in counts if _ISO_DATE_RE.match(value)]
+            elif column_type == "numeric":
+                keyed = [(number, value) for value in counts if (number := _profile_number(value)) is not None]
+            else:
+                continue
+            if keyed:
+                lo, hi = min(keyed), max(keyed)
+                if self.bounds[i] is not None:
+                    lo, hi = min(lo, self.bounds[i][0]), max(hi, self.bounds[i][1])
+                self.bounds[i] = (lo, hi)
+    
+    def profiles(self) -> dict[str, ColumnProfile]:
+        profiles: dict[str, ColumnProfile] = {}
+        for i, header in enumerate(self.headers):
+            bounds = self.bounds[i]
+            profiles[header] = ColumnProfile(
+                column_type=self.column_types[i],
+                rows=self.rows,
+                nulls=self.nulls[i],
+                null_rate=round(self.nulls[i] / self.rows, 6) if self.rows else 0.0,
+                distinct=self.distinct[i].count(),
+                top_values=self.top[i].top(COLUMN_PROFILE_TOP_VALUES),
+                top_values_error=self.top[i].error,
+                sample=list(self.samples[i].items),
+                min_value=bounds[0][1] if bounds else None,
+                max_value=bounds[1][1] if bounds else None,
+            )
+        return profiles
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler for one thread: a daemon thread records that thread's Python
+    stack every `interval` seconds. `dump` writes the samples as collapsed stacks
+    ("outer;inner;leaf count" lines), the input format of flamegraph.pl and speedscope.
+    """
+    
+    def __init__(self, interval: float = PROFILE_INTERVAL) -> None:
+        self.interval = interval
+        self.samples: collections.Counter[str] = collections.Counter()
+        self.elapsed = 0.0
+        self.path: str | None = None
+        self._target: int | None = None
+        self._started = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+    
+    def start(self) -> None:
+        """Start sampling the calling thread"""
+        self._target = threading.get_ident()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._sample, name="apex-sampling-profiler", daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.elapsed = time.perf_counter() - self._started
+    
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+    
+    def dump(self, path: str | os.PathLike[str]) -> str:
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+        self.path = os.fspath(path)
+        return self.path
+
+
+@dataclasses.dataclass(frozen=True)
+class ColumnSchema:
+    """Inferred type of one column, used to pick its normalizer."""
+    name: str
+    column_type: str  # date | numeric | email | phone | categorical | text
+    date_convention: str | None = None  # "M/D", "D/M" or "ISO" for date columns
+    mixed: bool = False  # sample had date/number-like values the type's normalizer doesn't cover
+
+
+@dataclasses.dataclass(frozen=True)
+class SourceFormat:
+    """How to read an upload, as settled by the sniffing stage (see sniff_source)."""
+    file_type: str  # csv | tsv | excel | json
+    encoding: str = "utf-8"
+    delimiter: str = ","
+    quotechar: str = '"'
+    has_header: bool = True
+    columns: int = 0  # widest sampled row, for synthesized headers
+
+
+@dataclasses.dataclass(frozen=True)
+class FilterRule:
+    """
+    One irrelevant-row rule. `pattern` is literal text (a regular expression with
+    `regex`), matched case-insensitively against the row text (non-empty cells,
+    lowercased and joined by spaces) or, with `columns`, against each of those
+    output columns' cells. `match` is one of FILTER_MATCH_MODES; "edge" means
+    prefix or suffix.
+    """
+    name: str
+    pattern: str
+    match: str = "edge"
+    columns: tuple[str, ...] = ()
+    regex: bool = False
+
+
+DEFAULT_FILTER_RULES = tuple(FilterRule(name=ind, pattern=ind) for ind in DEFAULT_TEST_DATA_INDICATORS)
+
+
+def parse_filter_rules(spec: t.Iterable[t.Mapping[str, t.Any]]) -> tuple[FilterRule, ...]:
+    """Validate rule dicts (e.g. a client's JSON rule set) into FilterRules."""
+    rules = []
+    for i, item in enumerate(spec):
+        if not isinstance(item, t.Mapping) or not item.get("pattern"):
+            raise ServiceError(f"Filter rule {i + 1} needs a non-empty 'pattern'.")
+        unknown = set(item) - {f.name for f in dataclasses.fields(FilterRule)}
+        if unknown:
+            raise ServiceError(f"Filter rule {i + 1} has unknown keys: {', '.join(sorted(unknown))}.")
+        columns = item.get("columns") or ()
+        rule = FilterRule(
+            name=str(item.get("name") or item["pattern"]),
+            pattern=str(item["pattern"]),
+            match=str(item.get("match", "edge")),
+            columns=(columns,) if isinstance(columns, str) else tuple(map(str, columns)),
+            regex=bool(item.get("regex", False)),
+        )
+        if rule.match not in FILTER_MATCH_MODES:
+            raise ServiceError(
+                f"Filter rule '{rule.name}' has unknown match '{rule.match}'; "
+                f"expected one of {', '.join(FILTER_MATCH_MODES)}."
+            )
+        if rule.regex:
+            try:
+                re.compile(rule.pattern)
+            except re.error as e:
+                raise ServiceError(f"Filter rule '{rule.name}' has an invalid pattern: {e}")
+        rules.append(rule)
+    return tuple(rules)
+
+
+class _RuleMatcher:
+    """Rules sharing one target (the row text or one column), compiled to a single test."""
+
+    def __init__(self, rules: list[tuple[int, FilterRule]]) -> None:
+        self.rules = rules
+        prefixes: list[str] = []
+        suffixes: list[str] = []
+        exact: set[str] = set()
+        patterns: list[str] = []
+        for _, rule in rules:
+            if not rule.regex and rule.match != "contains":
+                literal = rule.pattern.lower()
+                if rule.match in ("edge", "prefix"):
+                    prefixes.append(literal)
+                if rule.match in ("edge", "suffix"):
+                    suffixes.append(literal)
+                if rule.match == "exact":
+                    exact.add(literal)
+            else:
+                patterns.append(self._pattern(rule))
+        # Literal edge rules are one C-level startswith/endswith over a tuple; everything
+        # else is a single alternation regex
+        self._prefixes = tuple(prefixes)
+        self._suffixes = tuple(suffixes)
+        self._exact = frozenset(exact)
+        self._regex = re.compile("|".join(patterns)) if patterns else None
+        self._each = [(index, rule, re.compile(self._pattern(rule))) for index, rule in rules]
+
+    @staticmethod
+    def _pattern(rule: FilterRule) -> str:
+        body = f"(?i:{rule.pattern})" if rule.regex else re.escape(rule.pattern.lower())
+        return {
+            "edge": rf"\A(?:{body})|(?:{body})\Z",
+            "prefix": rf"\A(?:{body})",
+            "suffix": rf"(?:{body})\Z",
+            "contains": f"(?:{body})",
+            "exact": rf"\A(?:{body})\Z",
+        }[rule.match]
+
+    def hit(self, text: str) -> bool:
+        return (
+            text.startswith(self._prefixes)
+            or text.endswith(self._suffixes)
+            or text in self._exact
+            or (self._regex is not None and self._regex.search(text) is not None)
+        )
+
+    def first(self, text: str) -> int | None:
+        """Position (in the rule set) of the first rule that matches `text`"""
+        for index, _, pattern in self._each:
+            if pattern.search(text):
+                return index
+        return None
+
+
+class RowFilter:
+    """
+    Irrelevant-row rules compiled once per job against its output headers.
+    A (normalized) row is irrelevant when more than `max_empty_ratio` of its cells
+    are empty, or when any rule matches; match() names the first rule that does,
+    in rule order, so removals can be counted per rule.
+    """
+
+    MOSTLY_EMPTY = "mostly_empty"
+
+    def __init__(
+        self,
+        rules: t.Iterable[FilterRule],
+        headers: list[str],
+        max_empty_ratio: float = IRRELEVANT_MAX_EMPTY_RATIO,
+    ) -> None:
+        self.rules = tuple(rules)
+        self.num_columns = len(headers)
+        self.max_empty_ratio = max_empty_ratio
+        positions = {h: i for i, h in reversed(list(enumerate(headers)))}
+        row_rules: list[tuple[int, FilterRule]] = []
+        column_rules: dict[int, list[tuple[int, FilterRule]]] = collections.defaultdict(list)
+        for index, rule in enumerate(self.rules):
+            if not rule.columns:
+                row_rules.append((index, rule))
+            # Columns missing from this file's headers are skipped
+            for name in rule.columns:
+                if name in positions:
+                    column_rules[positions[name]].append((index, rule))
+        self._row = _RuleMatcher(row_rules) if row_rules else None
+        self._columns = [(col, _RuleMatcher(rs)) for col, rs in sorted(column_rules.items())]
+
+    def is_sparse(self, non_empty: int) -> bool:
+        return (self.num_columns - non_empty) / max(self.num_columns, 1) > self.max_empty_ratio
+
+    def match(self, row: list[str]) -> str | None:
+        """Name of the rule that makes `row` irrelevant, or None to keep it"""
+        if not row:
+            return self.MOSTLY_EMPTY
+        # Normalized cells are trimmed, so empty means ""
+        non_empty = len(row) - row.count("")
+        if non_empty == 0 or self.is_sparse(non_empty):
+            return self.MOSTLY_EMPTY
+        
+        hits: list[int] = []
+        if self._row is not None:
+            text = " ".join(filter(None, row)).lower()
+            if self._row.hit(text):
+                hits.append(self._row.first(text))
+        for col, matcher in self._columns:
+            cell = row[col].lower() if col < len(row) else ""
+            if cell and matcher.hit(cell):
+                hits.append(matcher.first(cell))
+        hits = [h for h in hits if h is not None]
+        return self.rules[min(hits)].name if hits else None
+
+
+def _mmap_windows(mm: mmap.mmap, size: int) -> t.Iterator[memoryview]:
+    """Consecutive `size`-byte views of a memory map, without copying it."""
+    view = memoryview(mm)
+    try:
+        for start in range(0, len(view), size):
+            yield view[start : start + size]
+    finally:
+        view.release()
+
+
+class _ByteBlockReader(io.RawIOBase):
+    """Readable raw stream over an iterator of byte blocks (e.g. upload chunks)."""
+
+    def __init__(self, blocks: t.Iterable[bytes]) -> None:
+        self._blocks = iter(blocks)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: t.Any) -> int:
+        while not self._pending:
+            try:
+                self._pending = memoryview(next(self._blocks))
+            except StopIteration:
+                # Drop the last block's view so a memory-mapped source can be closed
+                self._pending = memoryview(b"")
+                return 0
+        n = min(len(b), len(self._pending))
+        b[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+    def close(self) -> None:
+        # Drop the current block and finish the source, so a memory-mapped one can be closed
+        self._pending = memoryview(b"")
+        if hasattr(self._blocks, "close"):
+            self._blocks.close()
+        super().close()
+
+
+class _IncrementalJsonReader:
+    """
+    Pull parser over a text stream: yields one JSON value at a time while buffering
+    only the current value (plus one read) instead of the whole document.
+    """
+
+    def __init__(self, text: t.TextIO, read_size: int = JSON_READ_SIZE) -> None:
+        self._text = text
+        self._read_size = read_size
+        self._buf = ""
+        self._pos = 0
+        self._offset = 0  # characters dropped from the front of the buffer
+        self._eof = False
+        self._decode = json.JSONDecoder().raw_decode
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._text.read(self._read_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._offset += self._pos
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or "" at end of input."""
+        while True:
+            self._pos = _JSON_WS_RE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def take(self, expected: str) -> None:
+        if self.peek() != expected:
+            self._fail(f"Expecting {expected!r}", self._pos)
+        self._pos += 1
+
+    def finish(self) -> None:
+        if self.peek() != "":
+            self._fail("Extra data", self._pos)
+
+    def value(self) -> t.Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                if self._eof:
+                    self._fail(e.msg, e.pos)
+                if self._pos == 0:
+                    # The buffer holds only this (unfinished) value: read more per round
+                    self._read_size *= 2
+                self._fill()
+                continue
+            # A value ending exactly at the buffer edge may be a truncated number
+            if end < len(self._buf) or self._eof or not self._fill():
+                self._pos = end
+                return value
+
+    def _fail(self, msg: str, pos: int) -> t.NoReturn:
+        raise ServiceError(f"Invalid JSON: {msg} (char {self._offset + pos})")
+
+
+def _flatten_json_record(
+    record: dict[str, t.Any], prefix: str = "", out: list[tuple[str, str]] | None = None
+) -> list[tuple[str, str]]:
+    """(column, value) pairs of a JSON object; nested objects become dotted column names."""
+    if out is None:
+        out = []
+    append = out.append
+    for key, value in record.items():
+        name = prefix + key if prefix else key
+        if value.__class__ is str:
+            append((name, value))
+        elif isinstance(value, dict) and value:
+            _flatten_json_record(value, name + ".", out)
+        else:
+            append((name, str(value)))
+    return out
+
+
+class _EncodedColumn:
+    """
+    One column of a ColumnarTable: interned values plus an array of codes, widened
+    from 1 to 2 to 4 bytes per cell as cardinality grows. Columns that turn out to be
+    mostly unique switch to a plain list of strings, where a dictionary would only add overhead.
+    """
+
+    __slots__ = ("values", "index", "codes", "plain")
+
+    def __init__(self) -> None:
+        self.values: list[str] = []
+        self.index: dict[str, int] = {}
+        self.codes = array.array("B")
+        self.plain: list[str] | None = None
+
+    def __len__(self) -> int:
+        return len(self.plain) if self.plain is not None else len(self.codes)
+
+    def append(self, value: str) -> None:
+        if self.plain is not None:
+            self.plain.append(value)
+            return
+        code = self.index.get(value)
+        if code is None:
+            code = len(self.values)
+            if code >= COLUMNAR_DICT_MIN_VALUES and code > len(self.codes) * COLUMNAR_DICT_MAX_RATIO:
+                self.plain = list(self)
+                self.plain.append(value)
+                self.values, self.index, self.codes = [], {}, array.array("B")
+                return
+            self.index[value] = code
+            self.values.append(value)
+            if code == 256 and self.codes.typecode == "B":
+                self.codes = array.array("H", self.codes)
+            elif code == 65536 and self.codes.typecode == "H":
+                self.codes = array.array("I", self.codes)
+        self.codes.append(code)
+
+    def __getitem__(self, i: int) -> str:
+        if self.plain is not None:
+            return self.plain[i]
+        return self.values[self.codes[i]]
+
+    def __iter__(self) -> t.Iterator[str]:
+        if self.plain is not None:
+            return iter(self.plain)
+        return map(self.values.__getitem__, self.codes)
+
+    @property
+    def dictionary_encoded(self) -> bool:
+        return self.plain is None
+
+
+class ColumnarTable:
+    """
+    Column-oriented store for cleaned rows, used between cleaning and export (normalize,
+    filter and dedup run on row chunks before they are appended). Low-cardinality columns (status, state, lead source, dates, ...) keep each distinct
+    value once plus a compact code per cell, instead of one list and one str per row.
+    Rows are materialized on demand as lists, so the table can stand in for `list[list[str]]`.
+    """
+
+    def __init__(self, headers: list[str]) -> None:
+        self.headers = list(headers)
+        self._columns = [_EncodedColumn() for _ in self.headers]
+        self._len = 0
+
+    @classmethod
+    def from_rows(cls, headers: list[str], rows: t.Iterable[list[str]]) -> "ColumnarTable":
+        table = cls(headers)
+        table.extend(rows)
+        return table
+
+    def __len__(self) -> int:
+        return self._len
+
+    def append(self, row: list[str]) -> None:
+        width = len(self._columns)
+        if len(row) != width:
+            row = (list(row) + [""] * width)[:width]
+        for col, value in zip(self._columns, row):
+            col.append(value)
+        self._len += 1
+
+    def extend(self, rows: t.Iterable[list[str]]) -> None:
+        for row in rows:
+            self.append(row)
+
+    def __getitem__(self, i: int) -> list[str]:
+        if i < 0:
+            i += self._len
+        return [col[i] for col in self._columns]
+
+    def __iter__(self) -> t.Iterator[list[str]]:
+        return map(list, zip(*self._columns)) if self._columns else iter([[]] * self._len)
+
+    def column(self, idx: int) -> t.Iterator[str]:
+        """Iterate one column's values without materializing rows"""
+        return iter(self._columns[idx])
+
+    def cardinality(self, idx: int) -> int | None:
+        """Distinct values in a dictionary-encoded column (None once it fell back to plain storage)"""
+        col = self._columns[idx]
+        return len(col.values) if col.dictionary_encoded else None
+
+
+def row_digest(row: list[str]) -> bytes:
+    """128-bit digest of a row's dedup key (cells trimmed and lowercased)."""
+    cells = [c.strip().lower() if c else "" for c in row]
+    # Cell lengths make the key unambiguous even if a value contains the separator
+    key = "\x1f".join(cells) + "\x1e" + ",".join(map(str, map(len, cells)))
+    return hashlib.blake2b(key.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def source_row_digest(row: list[str]) -> bytes:
+    """128-bit digest of a row exactly as given; unlike row_digest, any edit changes it."""
+    key = "\x1f".join(row) + "\x1e" + ",".join(map(str, map(len, row)))
+    return hashlib.blake2b(key.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class _DigestTable:
+    """Open-addressing hash set of 16-byte digests packed into one bytearray."""
+
+    SLOT = 16
+    _EMPTY = bytes(16)
+
+    def __init__(self, capacity: int = 1 << 14) -> None:
+        self._capacity = capacity
+        self._mask = capacity - 1
+        self._slots = bytearray(capacity * self.SLOT)
+        self._count = 0
+        self._has_empty_digest = False
+
+    def __len__(self) -> int:
+        return self._count + self._has_empty_digest
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._slots)
+
+    def needs_grow(self) -> bool:
+        return self._count * 10 >= self._capacity * 7
+
+    def _probe(self, digest: bytes) -> tuple[int, bool]:
+        """Return (slot offset, found) for `digest`"""
+        slots = self._slots
+        i = int.from_bytes(digest[8:], "little") & self._mask
+        while True:
+            off = i * 16
+            cur = slots[off : off + 16]
+            if cur == digest:
+                return off, True
+            if cur == self._EMPTY:
+                return off, False
+            i = (i + 1) & self._mask
+
+    def __contains__(self, digest: bytes) -> bool:
+        if digest == self._EMPTY:
+            return self._has_empty_digest
+        return self._probe(digest)[1]
+
+    def add(self, digest: bytes) -> bool:
+        """Insert `digest`; returns False if it was already present"""
+        if digest == self._EMPTY:
+            added = not self._has_empty_digest
+            self._has_empty_digest = True
+            return added
+        if self.needs_grow():
+            self._resize(self._capacity * 2)
+        off, found = self._probe(digest)
+        if found:
+            return False
+        self._slots[off : off + 16] = digest
+        self._count += 1
+        return True
+
+    def __iter__(self) -> t.Iterator[bytes]:
+        if self._has_empty_digest:
+            yield self._EMPTY
+        slots = self._slots
+        for off in range(0, len(slots), 16):
+            cur = bytes(slots[off : off + 16])
+            if cur != self._EMPTY:
+                yield cur
+
+    def _resize(self, capacity: int) -> None:
+        old = self._slots
+        self._capacity = capacity
+        self._mask = capacity - 1
+        self._slots = bytearray(capacity * 16)
+        self._count = 0
+        for off in range(0, len(old), 16):
+            cur = bytes(old[off : off + 16])
+            if cur != self._EMPTY:
+                new_off, _ = self._probe(cur)
+                self._slots[new_off : new_off + 16] = cur
+                self._count += 1
+
+    def clear(self) -> None:
+        self._slots = bytearray(self._capacity * 16)
+        self._count = 0
+        self._has_empty_digest = False
+
+
+class _SpilledRun:
+    """One sorted on-disk run of 16-byte digests plus a Bloom filter to skip most lookups."""
+
+    _HASHES = 7
+    _BITS_PER_ITEM = 10
+
+    def __init__(self, path: str, digests: list[bytes]) -> None:
+        digests.sort()
+        self.path = path
+        self._n = len(digests)
+        self._bits = max(64, self._n * self._BITS_PER_ITEM)
+        self._bloom = bytearray((self._bits + 7) // 8)
+        with open(path, "wb") as f:
+            for d in digests:
+                f.write(d)
+                for pos in self._positions(d):
+                    self._bloom[pos >> 3] |= 1 << (pos & 7)
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self._n else None
+
+    def _positions(self, digest: bytes) -> t.Iterator[int]:
+        h1 = int.from_bytes(digest[8:], "little")
+        h2 = int.from_bytes(digest[1:8], "little") | 1
+        for i in range(self._HASHES):
+            yield (h1 + i * h2) % self._bits
+
+    def __contains__(self, digest: bytes) -> bool:
+        bloom = self._bloom
+        for pos in self._positions(digest):
+            if not bloom[pos >> 3] & (1 << (pos & 7)):
+                return False
+        lo, hi, mm = 0, self._n, self._map
+        while lo < hi:
+            mid = (lo + hi) // 2
+            cur = mm[mid * 16 : mid * 16 + 16]
+            if cur == digest:
+                return True
+            if cur < digest:
+                lo = mid + 1
+            else:
+                hi = mid
+        return False
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+
+class RowDigestIndex:
+    """
+    Set of 128-bit row digests for dedup, bounded by `memory_limit` bytes.
+    Digests live in a packed in-memory table; when it would outgrow the limit they are
+    spilled to sorted, hash-partitioned run files under `spill_dir` and looked up there
+    through per-run Bloom filters, so very large files dedup in a fixed memory budget.
+    """
+
+    def __init__(
+        self,
+        memory_limit: int = DEDUP_MEMORY_LIMIT,
+        spill_dir: str | None = None,
+        partitions: int = DEDUP_SPILL_PARTITIONS,
+    ) -> None:
+        self.memory_limit = memory_limit
+        self._spill_root = spill_dir
+        self._spill_dir: str | None = None
+        self._partitions = max(1, min(partitions, 256))
+        self._table = _DigestTable()
+        self._runs: list[list[_SpilledRun]] = [[] for _ in range(self._partitions)]
+        self._spilled = 0
+        self.spills = 0
+
+    def __len__(self) -> int:
+        return len(self._table) + self._spilled
+
+    def __enter__(self) -> "RowDigestIndex":
+        return self
+
+    def __exit__(self, *exc: t.Any) -> None:
+        self.close()
+
+    def _partition(self, digest: bytes) -> int:
+        return digest[0] * self._partitions >> 8
+
+    def __contains__(self, digest: bytes) -> bool:
+        if digest in self._table:
+            return True
+        return any(digest in run for run in self._runs[self._partition(digest)])
+
+    def add(self, digest: bytes) -> bool:
+        """Insert `digest`; returns False if it was already seen"""
+        if self._spilled and any(digest in run for run in self._runs[self._partition(digest)]):
+            return False
+        if self._table.needs_grow() and self._table.nbytes * 2 > self.memory_limit:
+            if digest in self._table:
+                return False
+            self._spill()
+        return self._table.add(digest)
+
+    def add_row(self, row: list[str]) -> bool:
+        return self.add(row_digest(row))
+
+    def _spill(self) -> None:
+        """Move every in-memory digest to one sorted run file per partition"""
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="apex-dedup-", dir=self._spill_root)
+        # Bucket into unsorted partition files in one pass, then sort one partition at a time
+        # so the extra memory needed while spilling is ~1/partitions of the table.
+        paths = [
+            os.path.join(self._spill_dir, f"p{p:03d}-r{self.spills:04d}.bin") for p in range(self._partitions)
+        ]
+        buckets = [open(path + ".tmp", "wb") for path in paths]
+        try:
+            for d in self._table:
+                buckets[self._partition(d)].write(d)
+        finally:
+            for f in buckets:
+                f.close()
+        self._table.clear()
+        for p, path in enumerate(paths):
+            with open(path + ".tmp", "rb") as f:
+                data = f.read()
+            os.remove(path + ".tmp")
+            if data:
+                digests = [data[i : i + 16] for i in range(0, len(data), 16)]
+                del data
+                self._runs[p].append(_SpilledRun(path, digests))
+                self._spilled += len(digests)
+        self.spills += 1
+
+    def close(self) -> None:
+        for runs in self._runs:
+            for run in runs:
+                run.close()
+        self._runs = [[] for _ in range(self._partitions)]
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+
+class _SnapshotIndex:
+    """
+    On-disk open-addressing map from a 128-bit row digest to a row's (offset, length)
+    in one of a delta snapshot's CSV files, length 0 for a source row the filter dropped.
+    Memory-mapped and probed in place, so looking a row up in a multi-million-row
+    snapshot touches a page or two and no index is loaded into memory.
+    """
+
+    _RECORD = struct.Struct("<16sQI")
+    SLOT = _RECORD.size
+    _EMPTY = bytes(16)
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self._mask = size // self.SLOT - 1
+
+    @classmethod
+    def write(cls, path: str, records_path: str) -> None:
+        """Build the index at `path` from a file of packed records (first one per digest wins)"""
+        count = os.path.getsize(records_path) // cls.SLOT
+        capacity = 16
+        while capacity * 7 < count * 10:
+            capacity *= 2
+        mask, slot = capacity - 1, cls.SLOT
+        with open(path, "w+b") as f, open(records_path, "rb") as records:
+            f.truncate(capacity * slot)
+            with mmap.mmap(f.fileno(), 0) as mm:
+                for block in iter(lambda: records.read(slot * 4096), b""):
+                    for pos in range(0, len(block), slot):
+                        record = block[pos : pos + slot]
+                        digest = record[:16]
+                        i = int.from_bytes(digest[8:], "little") & mask
+                        while True:
+                            cur = mm[i * slot : i * slot + 16]
+                            if cur == digest:
+                                break
+                            if cur == cls._EMPTY:
+                                mm[i * slot : i * slot + slot] = record
+                                break
+                            i = (i + 1) & mask
+                mm.flush()
+
+    @classmethod
+    def pack(cls, digest: bytes, offset: int, length: int) -> bytes:
+        return cls._RECORD.pack(digest, offset, length)
+
+    def get(self, digest: bytes) -> tuple[int, int] | None:
+        """(offset, length) recorded for `digest`, or None"""
+        mm, slot, mask = self._map, self.SLOT, self._mask
+        if mm is None:
+            return None
+        i = int.from_bytes(digest[8:], "little") & mask
+        while True:
+            off = i * slot
+            cur = mm[off : off + 16]
+            if cur == digest:
+                return self._RECORD.unpack_from(mm, off)[1:]
+            if cur == self._EMPTY:
+                return None
+            i = (i + 1) & mask
+
+    def __iter__(self) -> t.Iterator[tuple[bytes, int, int]]:
+        mm = self._map
+        if mm is None:
+            return
+        for record in self._RECORD.iter_unpack(mm):
+            if record[0] != self._EMPTY:
+                yield record
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+
+class _SourceRowReuse:
+    """
+    clean_delta's hook into the cleaning pipeline (_open_clean_job `reuse`). `split`
+    takes the source rows the prior snapshot has already cleaned out of a raw chunk, so
+    only new or edited rows are cleaned; `merge` puts the stored cleaned rows back in
+    input order. The cleaned form of every distinct source row, before dedup, is written
+    to the new snapshot's rows file and index records, for the next run to reuse.
+    """
+    
+    def __init__(
+        self,
+        prior_index: _SnapshotIndex | None,
+        prior_rows: t.Any,
+        rows_out: t.BinaryIO,
+        records: t.BinaryIO,
+        seen: RowDigestIndex,
+    ) -> None:
+        self.prior_index = prior_index
+        self.prior_rows = prior_rows  # memory map of the prior rows file
+        self.rows_out = rows_out
+        self.records = records
+        self.seen = seen
+        self.offset = 0
+        self.rows_reused = 0
+        self.rows_cleaned = 0
+        self._buf = io.StringIO()
+        self._writer = csv.writer(self._buf, lineterminator="\n")
+    
+    def split(self, chunk: list[list[str]]) -> tuple[list[list[str]], tuple[list[bytes], list[t.Any]]]:
+        """(rows to clean, plan for merge)"""
+        digests = [source_row_digest(row) for row in chunk]
+        if self.prior_index is None:
+            return chunk, (digests, [None] * len(chunk))
+        get = self.prior_index.get
+        found = [get(digest) for digest in digests]
+        fresh = [row for row, prior in zip(chunk, found) if prior is None]
+        return fresh, (digests, found)
+    
+    def merge(
+        self,
+        plan: tuple[list[bytes], list[t.Any]],
+        cleaned: list[list[str]],
+        kept: list[int],
+    ) -> list[list[str]]:
+        """The chunk's cleaned rows in input order: fresh rows as `cleaned`, the rest from the snapshot"""
+        digests, found = plan
+        cleaned_fresh = dict(zip(kept, cleaned))
+        rows: list[list[str] | None] = []
+        reused: list[tuple[int, bytes]] = []  # (position, stored cleaned row), decoded all at once
+        fresh_pos = 0
+        for digest, prior in zip(digests, found):
+            if prior is None:
+                row = cleaned_fresh.get(fresh_pos)
+                fresh_pos += 1
+                data = self._encode(row) if row is not None else b""
+                self.rows_cleaned += 1
+            else:
+                offset, length = prior
+                data = self.prior_rows[offset : offset + length] if length else b""
+                row = None
+                if data:
+                    reused.append((len(rows), data))
+                self.rows_reused += 1
+            rows.append(row)
+            if self.seen.add(digest):
+                self.records.write(_SnapshotIndex.pack(digest, self.offset, len(data)))
+                self.rows_out.write(data)
+                self.offset += len(data)
+        if reused:
+            text = b"".join(data for _, data in reused).decode("utf-8")
+            for (i, _), row in zip(reused, csv.reader(io.StringIO(text, newline=""))):
+                rows[i] = row
+        return [row for row in rows if row is not None]
+    
+    def _encode(self, row: list[str]) -> bytes:
+        buf = self._buf
+        buf.seek(0)
+        buf.truncate()
+        self._writer.writerow(row)
+        return buf.getvalue().encode("utf-8")
+
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache of clean_file_streaming results, keyed by the sha256
+    of the input bytes plus a canonical hash of the cleaning options. Each entry holds the
+    report, the output artifacts and the cleaned CSV (for column files), all copied into
+    the entry, so it never refers to files the caller owns; entries are evicted least
+    recently used first once the cache grows past `max_bytes`, and an entry with files
+    missing is dropped on lookup.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = RESULT_CACHE_MAX_BYTES) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def options_hash(options: dict[str, t.Any]) -> str:
+        canonical = json.dumps(
+            {"version": RESULT_CACHE_VERSION, **options}, sort_keys=True, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def key(self, input_sha256: str, options: dict[str, t.Any]) -> str:
+        return f"{input_sha256}-{self.options_hash(options)}"
+
+    def get(self, key: str) -> tuple[dict[str, t.Any], DataCleanReport, str] | None:
+        """(outputs, report, cleaned CSV path) for `key`, or None on a miss."""
+        path = os.path.join(self.cache_dir, key)
+        cleaned_csv_path = os.path.join(path, "cleaned.csv")
+        try:
+            with open(os.path.join(path, "entry.json"), encoding="utf-8") as f:
+                entry = json.load(f)
+            outputs = entry["outputs"]
+            for name in entry["binary"]:
+                with open(os.path.join(path, f"{name}.bin"), "rb") as f:
+                    outputs[name] = f.read()
+            report = DataCleanReport(**entry["report"])
+            report.stage_metrics = {stage: StageMetrics(**m) for stage, m in report.stage_metrics.items()}
+            report.column_profiles = {
+                header: ColumnProfile(**p) for header, p in report.column_profiles.items()
+            }
+            if "files" in outputs:
+                outputs["files"] = {name: os.path.join(path, f) for name, f in outputs["files"].items()}
+            for file_path in (cleaned_csv_path, *outputs.get("files", {}).values()):
+                if not os.path.isfile(file_path):
+                    raise FileNotFoundError(file_path)
+            os.utime(path)  # most recently used
+        except (OSError, ValueError, KeyError, TypeError):
+            # Absent, or damaged / partly deleted: the latter is dropped so the result is cached afresh
+            self.discard(key)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return outputs, report, cleaned_csv_path
+
+    def put(
+        self,
+        key: str,
+        outputs: dict[str, t.Any],
+        report: DataCleanReport,
+        cleaned_csv_path: str | os.PathLike[str],
+    ) -> None:
+        """
+        Store a result; written to a staging directory and renamed into place. Output files
+        (outputs["files"], from an `output_dir` clean) are copied into the entry.
+        """
+        staging = tempfile.mkdtemp(prefix=".staging-", dir=self.cache_dir)
+        try:
+            binary = [name for name, value in outputs.items() if isinstance(value, (bytes, bytearray))]
+            for name in binary:
+                with open(os.path.join(staging, f"{name}.bin"), "wb") as f:
+                    f.write(outputs[name])
+            files = {}
+            for name, file_path in outputs.get("files", {}).items():
+                if file_path == os.fspath(cleaned_csv_path):
+                    # A master CSV that is the cleaned CSV is stored once
+                    files[name] = "cleaned.csv"
+                    continue
+                files[name] = f"{name}{os.path.splitext(file_path)[1]}"
+                shutil.copyfile(file_path, os.path.join(staging, files[name]))
+            entry = {
+                "outputs": {
+                    name: files if name == "files" else value
+                    for name, value in outputs.items() if name not in binary
+                },
+                "binary": binary,
+                "report": dataclasses.asdict(report),
+            }
+            with open(os.path.join(staging, "entry.json"), "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            shutil.copyfile(cleaned_csv_path, os.path.join(staging, "cleaned.csv"))
+            os.rename(staging, os.path.join(self.cache_dir, key))
+        except (OSError, TypeError, ValueError):
+            # Lost a race with an identical job, disk full, or unserializable outputs: skip caching
+            shutil.rmtree(staging, ignore_errors=True)
+            return
+        self._evict()
+
+    def discard(self, key: str) -> None:
+        shutil.rmtree(os.path.join(self.cache_dir, key), ignore_errors=True)
+
+    def stats(self) -> dict[str, int]:
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "bytes": sum(size for _, _, size in entries),
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self) -> None:
+        for path, _, _ in self._entries():
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _entries(self) -> list[tuple[str, float, int]]:
+        """(path, last used, size in bytes) of every complete entry"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.startswith("."):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                size = sum(entry.stat().st_size for entry in os.scandir(path))
+                entries.append((path, os.path.getmtime(path), size))
+            except OSError:
+                continue
+        return entries
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=operator.itemgetter(1))
+        total = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            self.evictions += 1
+
+
+SinkTarget = t.Union[str, "os.PathLike[str]", t.IO[t.Any]]
+
+
+class RowSink:
+    """
+    Incremental writer for cleaned rows. `target` is a file path or a writable stream:
+    paths are opened and closed by the sink, streams are flushed but left open.
+    Text formats accept binary streams too (written as UTF-8).
+    """
+
+    binary = False
+
+    def __init__(self, target: SinkTarget, headers: list[str]) -> None:
+        self.headers = list(headers)
+        self.rows_written = 0
+        self._owned = isinstance(target, (str, os.PathLike))
+        self._detach = False
+        if self._owned:
+            if self.binary:
+                self._stream: t.IO[t.Any] = open(target, "wb")
+            else:
+                self._stream = open(target, "w", encoding="utf-8", newline="")
+        elif self.binary or self._is_text_stream(target):
+            self._stream = target
+        else:
+            self._stream = io.TextIOWrapper(target, encoding="utf-8", newline="")
+            self._detach = True
+        self._closed = False
+
+    @staticmethod
+    def _is_text_stream(stream: t.Any) -> bool:
+        return isinstance(stream, io.TextIOBase) or "b" not in getattr(stream, "mode", "b")
+
+    def write_rows(self, rows: t.Iterable[list[str]]) -> None:
+        raise NotImplementedError
+
+    def _finish(self) -> None:
+        """Write any trailer; called once by close()."""
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._finish()
+            self._stream.flush()
+        finally:
+            if self._owned:
+                self._stream.close()
+            elif self._detach:
+                self._stream.detach()
+
+    def __enter__(self) -> "RowSink":
+        return self
+
+    def __exit__(self, *exc: t.Any) -> None:
+        self.close()
+
+
+class CsvSink(RowSink):
+    """CSV writer; the header row is written up front."""
+
+    def __init__(self, target: SinkTarget, headers: list[str], delimiter: str = ",") -> None:
+        super().__init__(target, headers)
+        self._writer = csv.writer(self._stream, delimiter=delimiter, lineterminator="\n")
+        self._writer.writerow(self.headers)
+
+    def write_rows(self, rows: t.Iterable[list[str]]) -> None:
+        for row in rows:
+            self._writer.writerow(row)
+            self.rows_written += 1
+
+
+class JsonSink(RowSink):
+    """
+    JSON writer producing either one array of objects (the layout of the in-memory
+    large-file JSON export) or, with `lines=True`, newline-delimited JSON.
+    """
+
+    def __init__(self, target: SinkTarget, headers: list[str], lines: bool = False) -> None:
+        super().__init__(target, headers)
+        self._lines = lines
+        self._encode = json.JSONEncoder(ensure_ascii=False).encode
+        if not lines:
+            self._stream.write("[\n")
+
+    def write_rows(self, rows: t.Iterable[list[str]]) -> None:
+        headers, encode, write = self.headers, self._encode, self._stream.write
+        sep = "\n" if self._lines else ",\n"
+        for row in rows:
+            if self._lines:
+                write(encode(dict(zip(headers, itertools.chain(row, itertools.repeat(""))))))
+                write(sep)
+            else:
+                if self.rows_written:
+                    write(sep)
+                write(encode(dict(zip(headers, itertools.chain(row, itertools.repeat(""))))))
+            self.rows_written += 1
+
+    def _finish(self) -> None:
+        if not self._lines:
+            self._stream.write("\n]")
+
+
+class ExcelSink(RowSink):
+    """
+    XLSX writer on an openpyxl write-only workbook: rows are streamed to openpyxl's
+    temp file as they arrive and the archive is written to `target` on close.
+    """
+
+    binary = True
+
+    def __init__(self, target: SinkTarget, headers: list[str], sheet_title: str = "Cleaned Data") -> None:
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            raise ServiceError("Excel export requires 'openpyxl'. Install with: pip install openpyxl")
+        super().__init__(target, headers)
+        self._workbook = Workbook(write_only=True)
+        self._sheet_title = sheet_title
+        self._sheets = 0
+        self._sheet_rows = 0
+        self._new_sheet()
+
+    def _new_sheet(self) -> None:
+        self._sheets += 1
+        title = self._sheet_title if self._sheets == 1 else f"{self._sheet_title} ({self._sheets})"
+        self._sheet = self._workbook.create_sheet(title)
+        self._sheet.append(self.headers)
+        self._sheet_rows = 0
+
+    def write_rows(self, rows: t.Iterable[list[str]]) -> None:
+        for row in rows:
+            if self._sheet_rows >= EXCEL_MAX_DATA_ROWS:
+                self._new_sheet()
+            self._sheet.append(row)
+            self._sheet_rows += 1
+            self.rows_written += 1
+
+    def _finish(self) -> None:
+        self._workbook.save(self._stream)
+
+
+def open_sink(
+    export_format: str, target: SinkTarget, headers: list[str], *, delimiter: str = ","
+) -> RowSink:
+    """Open a row sink for "csv", "json" (array), "ndjson" or "excel"."""
+    if export_format == "csv":
+        return CsvSink(target, headers, delimiter)
+    if export_format == "json":
+        return JsonSink(target, headers)
+    if export_format == "ndjson":
+        return JsonSink(target, headers, lines=True)
+    if export_format == "excel":
+        return ExcelSink(target, headers)
+    raise ServiceError(f"Unknown export format {export_format!r}; expected csv, json, ndjson or excel.")
+
+
+
+class _ZipChunkBuffer:
+    """Write-only, unseekable target for zipfile that hands back what was written so far."""
+
+    def __init__(self) -> None:
+        self._parts: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def column_file_name(index: int, header: str, export_format: str) -> str:
+    """Stable, filesystem-safe name of one column file, e.g. "003_email.csv"."""
+    safe = re.sub(r"[^A-Za-z0-9._-]+", "_", header).strip("._") or "column"
+    return f"{index + 1:03d}_{safe}.{COLUMN_FILE_FORMATS[export_format]}"
 
 
 class ApexDataCleanEngine:
@@ -50,8 +1724,93 @@ class ApexDataCleanEngine:
     - CSV/TSV supported via stdlib `csv`
     - XLSX/XLS supported if `openpyxl` is installed (optional)
     - JSON supported via stdlib `json`
+    - Chunk cleaning is vectorized if `numpy` (and optionally `pandas`) is installed
     """
 
+    def __init__(
+        self,
+        *,
+        dedup_memory_limit: int = DEDUP_MEMORY_LIMIT,
+        spill_dir: str | None = None,
+        result_cache: ResultCache | None = None,
+        backend: str = "auto",
+        filter_rules: t.Iterable[FilterRule] | None = None,
+        memory_metric: str = "rss",
+        profile_dir: str | None = None,
+        profile_min_seconds: float = PROFILE_MIN_SECONDS,
+    ) -> None:
+        if backend not in CLEAN_BACKENDS:
+            raise ServiceError(f"Unknown backend '{backend}'; expected one of {', '.join(CLEAN_BACKENDS)}.")
+        if backend == "numpy" and _vector_modules() is None:
+            raise ServiceError("The numpy backend requires 'numpy'. Install with: pip install numpy")
+        if memory_metric not in MEMORY_METRICS:
+            raise ServiceError(
+                f"Unknown memory_metric '{memory_metric}'; expected one of {', '.join(MEMORY_METRICS)}."
+            )
+        # Chunk cleaning backend (see CLEAN_BACKENDS)
+        self.backend = backend
+        # Dedup keeps 128-bit row digests in memory up to this many bytes, then spills to `spill_dir`
+        self.dedup_memory_limit = dedup_memory_limit
+        self.spill_dir = spill_dir
+        # Optional cache of clean_file_streaming results (see ResultCache)
+        self.result_cache = result_cache
+        # Irrelevant-row rules (see FilterRule), compiled into a RowFilter per job
+        self.filter_rules = DEFAULT_FILTER_RULES if filter_rules is None else tuple(filter_rules)
+        # Per-stage memory measurement (see MEMORY_METRICS); "rss" needs the POSIX `resource` module
+        self.memory_metric = memory_metric
+        # Jobs running at least `profile_min_seconds` leave a SamplingProfiler dump in `profile_dir`
+        self.profile_dir = profile_dir
+        self.profile_min_seconds = profile_min_seconds
+    
+    def _worker_options(self) -> dict[str, t.Any]:
+        """Constructor options that process-pool workers need to clean like this engine"""
+        return {
+            "dedup_memory_limit": self.dedup_memory_limit,
+            "spill_dir": self.spill_dir,
+            "backend": self.backend,
+            "filter_rules": self.filter_rules,
+            "memory_metric": self.memory_metric,
+            "profile_dir": self.profile_dir,
+            "profile_min_seconds": self.profile_min_seconds,
+        }
+    
+    def _stage_memory_metric(self) -> str | None:
+        """The memory metric jobs can record here (tracemalloc is started on first use)"""
+        if self.memory_metric == "tracemalloc":
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            return "tracemalloc"
+        if self.memory_metric == "rss" and resource is not None:
+            return "rss"
+        return None
+    
+    @contextlib.contextmanager
+    def _profiled(self, name: str) -> t.Iterator[SamplingProfiler]:
+        """
+        Sample the calling thread while the block runs; with a `profile_dir`, blocks lasting
+        at least `profile_min_seconds` are dumped there and the profiler's `path` is set.
+        """
+        profiler = SamplingProfiler()
+        if self.profile_dir is None:
+            yield profiler
+            return
+        profiler.start()
+        try:
+            yield profiler
+        finally:
+            profiler.stop()
+        if profiler.elapsed >= self.profile_min_seconds:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            stamp = _dt.datetime.now(_dt.timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+            profiler.dump(os.path.join(
+                self.profile_dir, f"{stamp}-{slugify_header(name)}-{os.getpid()}.folded"
+            ))
+    
+    @property
+    def vectorized(self) -> bool:
+        """Whether chunks are cleaned with whole-column NumPy/pandas operations"""
+        return self.backend != "python" and _vector_modules() is not None
+
     # CRM field mappings - maps common CRM field names to standardized names
     CRM_FIELD_MAPPINGS = {
         "salesforce": {
@@ -103,15 +1862,6 @@ class ApexDataCleanEngine:
         },
     }
 
-    _date_patterns = (
-        # 2025-12-29
-        re.compile(r"^\d{4}-\d{2}-\d{2}$"),
-        # 12/29/2025, 12-29-2025
-        re.compile(r"^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}$"),
-        # Salesforce format: 2025-12-29T10:30:00.000Z
-        re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}"),
-    )
-
     def clean_csv_text(
         self,
         csv_text: str,
@@ -119,179 +1869,220 @@ class ApexDataCleanEngine:
         delimiter: str = ",",
         normalize_headers: bool = True,
         drop_empty_rows: bool = True,
+        infer_types: bool = True,
+        near_duplicates: str = "off",
     ) -> tuple[str, DataCleanReport]:
         started = utc_now_iso()
-        fixes: dict[str, int] = {
-            "trimmed_cells": 0,
-            "normalized_headers": 0,
-            "normalized_dates": 0,
-            "normalized_numbers": 0,
-            "empties_to_blank": 0,
-            "dropped_empty_rows": 0,
-            "duplicates_removed": 0,
-            "irrelevant_rows_removed": 0,
-        }
-
-        inp = io.StringIO(csv_text)
-        reader = csv.reader(inp, delimiter=delimiter)
-        rows = list(reader)
-        if not rows:
+        rows = csv.reader(io.StringIO(csv_text), delimiter=delimiter)
+        raw_headers = next(rows, None)
+        if raw_headers is None:
             raise ServiceError("CSV appears to be empty.")
-
-        raw_headers = rows[0]
-        data_rows = rows[1:]
-
-        header_map: dict[str, str] = {}
-        headers_out: list[str] = []
-        for h in raw_headers:
-            h2 = slugify_header(h) if normalize_headers else h.strip()
-            header_map[h] = h2
-            headers_out.append(h2)
-            if h2 != h:
-                fixes["normalized_headers"] += 1
-
-        def norm_cell(val: str) -> str:
-            if val is None:
-                fixes["empties_to_blank"] += 1
-                return ""
-            v = str(val)
-            v2 = v.strip()
-            if v2 != v:
-                fixes["trimmed_cells"] += 1
-            v = v2
-            if not v:
-                return ""
-
-            # numbers like "1,234.50" -> "1234.50"
-            if re.fullmatch(r"-?\d{1,3}(,\d{3})+(\.\d+)?", v):
-                fixes["normalized_numbers"] += 1
-                return v.replace(",", "")
-
-            # dates
-            for pat in self._date_patterns:
-                if pat.match(v):
-                    iso = self._try_parse_date_to_iso(v)
-                    if iso and iso != v:
-                        fixes["normalized_dates"] += 1
-                        return iso
-                    return v
-            return v
-
-        def reconcile_row_length(row: list[str], target_cols: int) -> list[str]:
-            """
-            Best-effort fix for malformed CSV rows where delimiters appear inside values
-            but the value wasn't quoted (e.g., 1,234.50).
-            """
-            if len(row) == target_cols:
-                return row
-            if len(row) < target_cols:
-                return (row + [""] * target_cols)[:target_cols]
-
-            # Attempt to merge numeric thousands separators: ["1","234.50"] -> ["1,234.50"]
-            rr = list(row)
-            numeric_left = re.compile(r"^-?\d{1,3}$")
-            numeric_mid = re.compile(r"^\d{3}$")
-            numeric_right = re.compile(r"^\d{3}(\.\d+)?$")
-
-            i = 0
-            while len(rr) > target_cols and i < len(rr) - 1:
-                a, b = rr[i].strip(), rr[i + 1].strip()
-                if numeric_left.match(a) and (numeric_mid.match(b) or numeric_right.match(b)):
-                    rr[i : i + 2] = [f"{a},{b}"]
-                    fixes["normalized_numbers"] += 1
-                    continue
-                i += 1
-
-            # If still too long, merge the tail into the last column.
-            if len(rr) > target_cols:
-                head = rr[: target_cols - 1]
-                tail = rr[target_cols - 1 :]
-                rr = head + [delimiter.join(tail)]
-            return rr[:target_cols]
-
-        # Process and clean rows
-        cleaned_rows: list[list[str]] = []
-        for r in data_rows:
-            rr = reconcile_row_length(list(r), len(raw_headers))
-            rr2 = [norm_cell(c) for c in rr]
-            
-            # Drop completely empty rows
-            if drop_empty_rows and all(c == "" for c in rr2):
-                fixes["dropped_empty_rows"] += 1
-                continue
-            
-            # Filter irrelevant rows (rows with too many empty cells or test data)
-            if self._is_irrelevant_row(rr2, len(headers_out)):
-                fixes["irrelevant_rows_removed"] += 1
-                continue
-            
-            cleaned_rows.append(rr2)
-        
-        # Remove duplicates
-        seen_rows: set[tuple[str, ...]] = set()
-        deduplicated_rows: list[list[str]] = []
-        for row in cleaned_rows:
-            # Create a tuple for hashing (normalize whitespace)
-            row_tuple = tuple(c.strip().lower() if c else "" for c in row)
-            if row_tuple not in seen_rows:
-                seen_rows.add(row_tuple)
-                deduplicated_rows.append(row)
-            else:
-                fixes["duplicates_removed"] += 1
-        
-        out_rows: list[list[str]] = [headers_out] + deduplicated_rows
-        rows_out_count = len(deduplicated_rows)
-        
-        out = io.StringIO()
-        writer = csv.writer(out, delimiter=delimiter, lineterminator="\n")
-        writer.writerows(out_rows)
         
-        finished = utc_now_iso()
-        report = DataCleanReport(
-            rows_in=len(data_rows),
-            rows_out=rows_out_count,
-            columns_in=len(raw_headers),
-            columns_out=len(headers_out),
-            header_map=header_map,
-            fixes=fixes,
-            started_at=started,
-            finished_at=finished,
-            duplicates_removed=fixes.get("duplicates_removed", 0),
-            irrelevant_rows_removed=fixes.get("irrelevant_rows_removed", 0),
-        )
-        return out.getvalue(), report
+        with self._profiled("csv_text") as profile:
+            headers_out, table, report = self._clean_to_table(
+                rows, raw_headers, "csv", delimiter, normalize_headers, drop_empty_rows,
+                apply_crm_mappings=False, started=started, infer_types=infer_types,
+                near_duplicates=near_duplicates,
+            )
+            cleaned_csv = self._timed_csv(headers_out, table, delimiter, report)
+        report.profile_path = profile.path
+        return cleaned_csv, report
 
-    def clean_csv_file(self, input_path: str, output_path: str | None = None) -> DataCleanReport:
-        with open(input_path, "r", encoding="utf-8-sig", errors="replace") as f:
-            csv_text = f.read()
-        cleaned, report = self.clean_csv_text(csv_text)
+    def clean_csv_file(
+        self,
+        input_path: str,
+        output_path: str | None = None,
+        *,
+        chunk_size: int = 10000,
+        strict_encoding: bool = False,
+    ) -> DataCleanReport:
+        """
+        Clean a local CSV file to `output_path` (default "<name>.cleaned<ext>") in constant
+        memory, exactly as clean_csv_text would clean its text. The input is memory-mapped and
+        fed to the decoder in CSV_FILE_WINDOW_BYTES windows; cleaned chunks stream through a
+        buffered CsvSink into a temp file beside the output, renamed over it once complete,
+        so a failed run never leaves a partial output behind.
+        Bytes that aren't valid UTF-8 become U+FFFD, unless `strict_encoding` is set, in
+        which case the first one fails the run with a ServiceError.
+        """
+        started = utc_now_iso()
         if output_path is None:
             base, ext = os.path.splitext(input_path)
             output_path = f"{base}.cleaned{ext or '.csv'}"
-        with open(output_path, "w", encoding="utf-8", newline="") as f:
-            f.write(cleaned)
+        with open(input_path, "rb") as f:
+            if not os.fstat(f.fileno()).st_size:
+                raise ServiceError("CSV appears to be empty.")
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            text = io.TextIOWrapper(
+                io.BufferedReader(_ByteBlockReader(_mmap_windows(mm, CSV_FILE_WINDOW_BYTES))),
+                encoding="utf-8-sig",
+                errors="strict" if strict_encoding else "replace",
+                newline="",
+            )
+            try:
+                return self._clean_csv_stream(text, output_path, started, chunk_size)
+            except UnicodeDecodeError as e:
+                raise ServiceError(f"File is not valid UTF-8 text ({e.reason}); re-export it as UTF-8.")
+            finally:
+                # Closing the reader releases its view of the current window before the map
+                text.close()
+                mm.close()
+    
+    def _clean_csv_stream(
+        self, text: t.TextIO, output_path: str, started: str, chunk_size: int
+    ) -> DataCleanReport:
+        """clean_csv_text over a text stream, written to `output_path` via a temp file and rename"""
+        rows = csv.reader(text)
+        raw_headers = next(rows, None)
+        if raw_headers is None:
+            raise ServiceError("CSV appears to be empty.")
+        
+        out_dir, out_name = os.path.split(os.path.abspath(output_path))
+        tmp_path = os.path.join(out_dir, f".{out_name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        try:
+            with self._profiled(os.path.basename(output_path)) as profile:
+                headers_out, chunks, report = self._open_clean_job(
+                    rows, raw_headers, "csv", ",", True, True, False, started, chunk_size
+                )
+                with open(
+                    tmp_path, "x", encoding="utf-8", newline="", buffering=CSV_FILE_WRITE_BUFFER
+                ) as out, CsvSink(out, headers_out) as sink:
+                    for chunk in chunks:
+                        sink.write_rows(chunk)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+        report.profile_path = profile.path
         return report
 
     def detect_file_type(self, filename: str, content: bytes | None = None) -> str:
-        """Detect file type from filename extension or content"""
+        """Detect file type from filename extension or, failing that, a sample of the content"""
         ext = os.path.splitext(filename.lower())[1] if filename else ""
-        
-        if ext in [".csv"]:
-            return "csv"
-        elif ext in [".xlsx", ".xls"]:
-            return "excel"
-        elif ext in [".json"]:
-            return "json"
-        elif ext in [".tsv"]:
-            return "tsv"
-        elif content:
-            # Try to detect from content
-            try:
-                json.loads(content.decode("utf-8")[:100])
+        if ext in FILE_TYPE_EXTENSIONS:
+            return FILE_TYPE_EXTENSIONS[ext]
+        if content:
+            head = bytes(content[:SNIFF_SAMPLE_BYTES])
+            if head.startswith(b"PK\x03\x04"):
+                return "excel"
+            for bom, encoding in _BOM_ENCODINGS:
+                if head.startswith(bom):
+                    head = head.decode(encoding, "ignore").encode("utf-8")
+                    break
+            if _JSON_START_RE.match(head):
                 return "json"
-            except:
-                pass
         return "csv"  # Default to CSV
+    
+    def sniff_source(
+        self,
+        source: bytes | t.BinaryIO | t.Iterable[bytes],
+        filename: str = "",
+        *,
+        file_type: str | None = None,
+        delimiter: str | None = None,
+    ) -> tuple[bytes | t.BinaryIO | t.Iterable[bytes], SourceFormat]:
+        """
+        Sniffing stage: read at most SNIFF_SAMPLE_BYTES from the head of `source` to settle
+        its file type, then for delimited text its encoding (BOM, else UTF-8/UTF-16/cp1252
+        heuristics), delimiter and quote character (unless `delimiter` is given) and whether
+        the first row is a header. Returns a source that still yields every byte, and the format.
+        """
+        ext = os.path.splitext(filename.lower())[1] if filename else ""
+        detected_type = file_type or FILE_TYPE_EXTENSIONS.get(ext)
+        if detected_type in ("excel", "json"):
+            return source, SourceFormat(detected_type, delimiter=delimiter or ",")
+        
+        stream = self._open_binary_stream(source)
+        sample = bytearray()
+        if getattr(stream, "seekable", lambda: False)():
+            start = stream.tell()
+            self._read_sample(stream, sample)
+            stream.seek(start)
+            replay: bytes | t.BinaryIO | t.Iterable[bytes] = stream
+        else:
+            self._read_sample(stream, sample)
+            replay = itertools.chain([bytes(sample)], iter(lambda: stream.read(1 << 20), b""))
+        at_eof = len(sample) < SNIFF_SAMPLE_BYTES
+        
+        detected_type = detected_type or self.detect_file_type(filename, sample)
+        if detected_type in ("excel", "json"):
+            return replay, SourceFormat(detected_type, delimiter=delimiter or ",")
+        
+        encoding = self._sniff_encoding(sample, at_eof)
+        text = codecs.getincrementaldecoder(encoding)("replace").decode(bytes(sample), final=at_eof)
+        if not at_eof and "\n" in text:
+            text = text[: text.rindex("\n") + 1]  # whole lines only
+        
+        quotechar = '"'
+        if detected_type == "tsv":
+            delimiter = "\t"
+        elif delimiter is None:
+            delimiter = ","
+            try:
+                dialect = csv.Sniffer().sniff(text, delimiters=SNIFF_DELIMITERS)
+                delimiter, quotechar = dialect.delimiter, dialect.quotechar or '"'
+            except csv.Error:
+                pass  # single column or too little text to tell; keep the CSV defaults
+        
+        rows = list(itertools.islice(
+            csv.reader(io.StringIO(text, newline=""), delimiter=delimiter, quotechar=quotechar), SNIFF_HEADER_ROWS
+        ))
+        return replay, SourceFormat(
+            detected_type,
+            encoding=encoding,
+            delimiter=delimiter,
+            quotechar=quotechar,
+            has_header=self._sniff_has_header(rows),
+            columns=max(map(len, rows), default=0),
+        )
+    
+    def _read_sample(self, stream: t.BinaryIO, sample: bytearray) -> None:
+        """Fill `sample` with up to SNIFF_SAMPLE_BYTES from `stream` (raw streams may return short reads)"""
+        while len(sample) < SNIFF_SAMPLE_BYTES:
+            block = stream.read(SNIFF_SAMPLE_BYTES - len(sample))
+            if not block:
+                break
+            sample += block
+    
+    def _sniff_encoding(self, sample: bytes, at_eof: bool) -> str:
+        """Text encoding of a sample: a BOM wins, then NUL-byte layout (UTF-16), UTF-8, cp1252"""
+        for bom, encoding in _BOM_ENCODINGS:
+            if sample.startswith(bom):
+                return encoding
+        nuls = sample.count(0)
+        if nuls and nuls * 4 >= len(sample):
+            # ASCII-heavy UTF-16: every other byte is NUL
+            odd_nuls = sample[1::2].count(0)
+            return "utf-16-le" if odd_nuls * 2 >= nuls else "utf-16-be"
+        try:
+            codecs.getincrementaldecoder("utf-8")().decode(bytes(sample), final=at_eof)
+            return "utf-8"
+        except UnicodeDecodeError:
+            # Windows exports: cp1252, unless the sample has bytes cp1252 leaves undefined
+            return "latin-1" if _CP1252_UNDEFINED.intersection(sample) else "cp1252"
+    
+    def _sniff_has_header(self, rows: list[list[str]]) -> bool:
+        """
+        Header heuristic: column labels are never typed values, so a first row holding a
+        number, date, email or phone number (in a column whose next row is typed too) is data.
+        """
+        if len(rows) < 2:
+            return True
+        first, second = rows[0], rows[1]
+        for i, cell in enumerate(first):
+            v = cell.strip()
+            if v and self._looks_typed(v) and i < len(second) and self._looks_typed(second[i].strip()):
+                return False
+        return True
+    
+    def _looks_typed(self, value: str) -> bool:
+        return bool(
+            _PLAIN_NUMBER_RE.fullmatch(value)
+            or _DATE_CANDIDATE_RE.match(value)
+            or _EMAIL_RE.fullmatch(value)
+            or (_PHONE_RE.fullmatch(value) and sum(c.isdigit() for c in value) >= 7)
+        )
 
     def detect_crm_type(self, headers: list[str]) -> str | None:
         """Detect CRM type from column headers"""
@@ -337,63 +2128,291 @@ class ApexDataCleanEngine:
 
     def parse_excel(self, file_content: bytes, sheet_name: str | None = None) -> tuple[list[list[str]], str]:
         """Parse Excel file (XLSX/XLS)"""
+        return list(self.iter_excel_rows(file_content, sheet_name)), "excel"
+    
+    def iter_excel_rows(
+        self,
+        source: bytes | str | os.PathLike[str] | t.BinaryIO | t.Iterable[bytes],
+        sheet_name: str | None = None,
+    ) -> t.Iterator[list[str]]:
+        """
+        Stream the rows (header first) of one worksheet with openpyxl's read-only mode,
+        stringifying cells one row at a time. Defaults to the active sheet.
+        """
+        workbook = self._open_excel_workbook(source)
+        try:
+            if sheet_name is not None and sheet_name not in workbook.sheetnames:
+                raise ServiceError(f"Sheet {sheet_name!r} not found; workbook has {', '.join(workbook.sheetnames)}.")
+            sheet = workbook.active if sheet_name is None else workbook[sheet_name]
+            # Sheets without a usable <dimension> record (missing, or a bare A1) are sized with an
+            # extra streaming pass, so rows are padded to the sheet width exactly as a full load would
+            width = sheet.max_column
+            if not width or (sheet.max_row == 1 and width == 1):
+                sheet.reset_dimensions()
+                width = max((len(row) for row in sheet.iter_rows(values_only=True)), default=0) or None
+            for row in sheet.iter_rows(max_col=width, values_only=True):
+                yield [str(cell) if cell is not None else "" for cell in row]
+        finally:
+            workbook.close()
+    
+    def excel_sheet_names(self, source: bytes | str | os.PathLike[str] | t.BinaryIO) -> list[str]:
+        """Worksheet names of a workbook, in workbook order"""
+        workbook = self._open_excel_workbook(source)
+        try:
+            return list(workbook.sheetnames)
+        finally:
+            workbook.close()
+    
+    def clean_workbook(
+        self,
+        source: bytes | str | os.PathLike[str] | t.BinaryIO | t.Iterable[bytes],
+        filename: str = "",
+        *,
+        sheet_names: list[str] | None = None,
+        workers: int | None = None,
+        normalize_headers: bool = True,
+        drop_empty_rows: bool = True,
+        apply_crm_mappings: bool = True,
+        chunk_size: int = 10000,
+        export_formats: list[str] | None = None,
+        infer_types: bool = True,
+        near_duplicates: str = "off",
+        result_paths: dict[str, str] | None = None,
+        output_dirs: dict[str, str] | None = None,
+    ) -> dict[str, tuple[dict[str, t.Any], DataCleanReport]]:
+        """
+        Clean every sheet of a workbook (or just `sheet_names`), each as its own job with
+        its own report, keyed by sheet name in workbook order. Sheets are cleaned concurrently
+        in a process pool of `workers` (None for one per CPU); every worker streams its sheet
+        from the workbook in read-only mode. `result_paths` and `output_dirs` map sheet
+        names to the `result_path` and `output_dir` of clean_file_streaming.
+        """
+        with contextlib.ExitStack() as stack:
+            if isinstance(source, (str, os.PathLike)):
+                path = os.fspath(source)
+            else:
+                # Spool to disk once so each worker can open the workbook itself
+                fd, path = tempfile.mkstemp(prefix="apex-workbook-", suffix=".xlsx", dir=self.spill_dir)
+                stack.callback(os.remove, path)
+                with os.fdopen(fd, "wb") as f:
+                    shutil.copyfileobj(self._open_binary_stream(source), f)
+            
+            names = sheet_names if sheet_names is not None else self.excel_sheet_names(path)
+            if not names:
+                raise ServiceError(f"Workbook {filename or path!r} has no sheets.")
+            options = {
+                "normalize_headers": normalize_headers,
+                "drop_empty_rows": drop_empty_rows,
+                "apply_crm_mappings": apply_crm_mappings,
+                "chunk_size": chunk_size,
+                "export_formats": export_formats,
+                "infer_types": infer_types,
+                "near_duplicates": near_duplicates,
+            }
+            result_paths = result_paths or {}
+            output_dirs = output_dirs or {}
+            
+            max_workers = min(len(names), workers or os.cpu_count() or 1)
+            if max_workers <= 1:
+                return {
+                    name: _clean_sheet_worker(
+                        path, name, options, result_paths.get(name), self._worker_options(), output_dirs.get(name)
+                    )
+                    for name in names
+                }
+            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = {
+                    name: pool.submit(
+                        _clean_sheet_worker, path, name, options, result_paths.get(name), self._worker_options(),
+                        output_dirs.get(name),
+                    )
+                    for name in names
+                }
+                return {name: future.result() for name, future in futures.items()}
+    
+    def iter_clean_files(
+        self,
+        paths: list[str],
+        filenames: list[str] | None = None,
+        *,
+        workers: int | None = None,
+        memory_budget: int = BATCH_MEMORY_BUDGET,
+        file_type: str | None = None,
+        delimiter: str | None = None,
+        normalize_headers: bool = True,
+        drop_empty_rows: bool = True,
+        apply_crm_mappings: bool = True,
+        sheet_name: str | None = None,
+        chunk_size: int = 10000,
+        export_formats: list[str] | None = None,
+        infer_types: bool = True,
+        near_duplicates: str = "off",
+        result_paths: list[str | None] | None = None,
+        output_dirs: list[str | None] | None = None,
+    ) -> t.Iterator[tuple[int, tuple[dict[str, t.Any], DataCleanReport] | None, Exception | None]]:
+        """
+        Clean a batch of independent files with clean_file_streaming, yielding
+        (index, (outputs, report), None) or (index, None, error) as each one finishes, so
+        one bad file never fails the batch. Files run in a process pool of `workers`
+        (None for one per CPU), started in order while their estimated peak memory
+        (BATCH_MEMORY_PER_INPUT_BYTE x size) fits `memory_budget`; a file larger than the
+        budget runs alone. `result_paths` and `output_dirs` give each file's `result_path`
+        and `output_dir`.
+        """
+        filenames = filenames or [os.path.basename(path) for path in paths]
+        result_paths = result_paths or [None] * len(paths)
+        output_dirs = output_dirs or [None] * len(paths)
+        options = {
+            "file_type": file_type,
+            "delimiter": delimiter,
+            "normalize_headers": normalize_headers,
+            "drop_empty_rows": drop_empty_rows,
+            "apply_crm_mappings": apply_crm_mappings,
+            "sheet_name": sheet_name,
+            "chunk_size": chunk_size,
+            "export_formats": export_formats,
+            "infer_types": infer_types,
+            "near_duplicates": near_duplicates,
+        }
+        # Workers share the on-disk result cache (its hit/miss counters stay in the worker)
+        engine_options = {**self._worker_options(), "result_cache": self.result_cache}
+        jobs = [
+            (i, (path, filenames[i], options, result_paths[i], engine_options, output_dirs[i]))
+            for i, path in enumerate(paths)
+        ]
+        
+        max_workers = min(len(jobs), workers or os.cpu_count() or 1)
+        if max_workers <= 1:
+            for i, args in jobs:
+                try:
+                    yield i, _clean_file_worker(*args), None
+                except Exception as e:
+                    yield i, None, e
+            return
+        
+        estimates = [os.path.getsize(path) * BATCH_MEMORY_PER_INPUT_BYTE for path in paths]
+        queue = collections.deque(jobs)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as pool:
+            running: dict[concurrent.futures.Future, int] = {}
+            in_flight = 0
+            while queue or running:
+                # Admit files in order while they fit the budget (and always at least one)
+                while queue and len(running) < max_workers and (
+                    not running or in_flight + estimates[queue[0][0]] <= memory_budget
+                ):
+                    i, args = queue.popleft()
+                    running[pool.submit(_clean_file_worker, *args)] = i
+                    in_flight += estimates[i]
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    i = running.pop(future)
+                    in_flight -= estimates[i]
+                    try:
+                        yield i, future.result(), None
+                    except Exception as e:
+                        yield i, None, e
+    
+    def _open_excel_workbook(self, source: bytes | str | os.PathLike[str] | t.BinaryIO | t.Iterable[bytes]) -> t.Any:
+        """Open a workbook in read-only mode; XLSX is a ZIP archive, so unseekable streams are spooled first"""
         try:
-            import openpyxl
             from openpyxl import load_workbook
         except ImportError:
             raise ServiceError(
                 "Excel support requires 'openpyxl'. Install with: pip install openpyxl"
             )
         
-        workbook = load_workbook(io.BytesIO(file_content), data_only=True)
-        sheet = workbook.active if sheet_name is None else workbook[sheet_name]
-        
-        rows = []
-        for row in sheet.iter_rows(values_only=True):
-            rows.append([str(cell) if cell is not None else "" for cell in row])
-        
-        return rows, "excel"
+        if isinstance(source, (str, os.PathLike)):
+            target: t.Any = source
+        else:
+            stream = self._open_binary_stream(source)
+            if getattr(stream, "seekable", lambda: False)():
+                target = stream
+            else:
+                target = tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024, dir=self.spill_dir)
+                shutil.copyfileobj(stream, target)
+                target.seek(0)
+        return load_workbook(target, read_only=True, data_only=True)
     
     def parse_json(self, file_content: bytes | str) -> tuple[list[list[str]], str]:
         """Parse JSON file and convert to tabular format"""
-        if isinstance(file_content, bytes):
-            content_str = file_content.decode("utf-8")
-        else:
-            content_str = file_content
-        
+        if isinstance(file_content, str):
+            file_content = file_content.encode("utf-8")
+        return list(self.iter_json_rows(file_content)), "json"
+    
+    def iter_json_records(self, source: bytes | t.BinaryIO | t.Iterable[bytes]) -> t.Iterator[dict[str, t.Any]]:
+        """
+        Incrementally yield the objects of a JSON array, a single JSON object, or
+        NDJSON / JSON Lines (any whitespace-separated sequence of objects).
+        Non-object array items are skipped.
+        """
+        binary = self._open_binary_stream(source)
+        text = io.TextIOWrapper(binary, encoding="utf-8-sig")
         try:
-            data = json.loads(content_str)
-        except json.JSONDecodeError as e:
-            raise ServiceError(f"Invalid JSON: {e}")
-        
-        if not isinstance(data, list):
-            # If it's a single object or dict, wrap it
-            if isinstance(data, dict):
-                data = [data]
-            else:
-                raise ServiceError("JSON must be an array of objects or a single object")
-        
-        if not data:
-            raise ServiceError("JSON appears to be empty")
-        
-        # Extract all unique keys as headers
-        headers = []
-        seen_keys = set()
-        for item in data:
-            if isinstance(item, dict):
-                for key in item.keys():
-                    if key not in seen_keys:
-                        headers.append(str(key))
-                        seen_keys.add(key)
-        
-        # Build rows
-        rows = [headers]
-        for item in data:
-            if isinstance(item, dict):
-                row = [str(item.get(h, "")) for h in headers]
-                rows.append(row)
-        
-        return rows, "json"
+            reader = _IncrementalJsonReader(text)
+            first = reader.peek()
+            if first == "":
+                raise ServiceError("JSON appears to be empty")
+            if first == "[":
+                reader.take("[")
+                if reader.peek() == "]":
+                    reader.take("]")
+                else:
+                    while True:
+                        item = reader.value()
+                        if isinstance(item, dict):
+                            yield item
+                        if reader.peek() == ",":
+                            reader.take(",")
+                            continue
+                        reader.take("]")
+                        break
+                reader.finish()
+                return
+            while reader.peek() != "":
+                item = reader.value()
+                if not isinstance(item, dict):
+                    raise ServiceError("JSON must be an array of objects or a single object")
+                yield item
+        finally:
+            text.detach()
+    
+    def iter_json_rows(self, source: bytes | t.BinaryIO | t.Iterable[bytes]) -> t.Iterator[list[str]]:
+        """
+        Yield rows (header first) from JSON/NDJSON input, with nested objects flattened to
+        dotted column names. Keys may first appear anywhere in the stream, so records are
+        spooled to a temp file in one parsing pass and replayed once the header is complete.
+        """
+        headers: list[str] = []
+        index: dict[str, int] = {}
+        batch_sizes: list[int] = []
+        with tempfile.TemporaryFile(dir=self.spill_dir) as spool:
+            records = self.iter_json_records(source)
+            while True:
+                batch = []
+                for record in itertools.islice(records, JSON_SPOOL_BATCH_ROWS):
+                    pairs = _flatten_json_record(record)
+                    for key, _ in pairs:
+                        if key not in index:
+                            index[key] = len(headers)
+                            headers.append(key)
+                    row = [""] * len(headers)
+                    for key, value in pairs:
+                        row[index[key]] = value
+                    batch.append(row)
+                if not batch:
+                    break
+                batch_sizes.append(spool.write(marshal.dumps(batch)))
+            if not batch_sizes:
+                raise ServiceError("JSON appears to be empty")
+            
+            yield headers
+            spool.seek(0)
+            width = len(headers)
+            for size in batch_sizes:
+                for row in marshal.loads(spool.read(size)):
+                    if len(row) < width:
+                        row.extend([""] * (width - len(row)))
+                    yield row
     
     def parse_tsv(self, file_content: bytes | str) -> tuple[list[list[str]], str]:
         """Parse TSV (Tab-Separated Values) file"""
@@ -416,223 +2435,357 @@ class ApexDataCleanEngine:
         filename: str,
         *,
         file_type: str | None = None,
-        delimiter: str = ",",
+        delimiter: str | None = None,
         normalize_headers: bool = True,
         drop_empty_rows: bool = True,
         apply_crm_mappings: bool = True,
         sheet_name: str | None = None,
+        infer_types: bool = True,
+        near_duplicates: str = "off",
     ) -> tuple[str, DataCleanReport]:
         """
         Clean a file of any supported type.
+        With `infer_types`, a sample of rows decides each column's type and only
+        that type's normalizer runs on the column.
+        `near_duplicates` is "off", "report" (clusters in the report) or "merge".
+        `delimiter` None sniffs the input dialect (see sniff_source); output uses "," then.
         Returns cleaned CSV text and report.
         """
         started = utc_now_iso()
+        if isinstance(file_content, str):
+            file_content = file_content.encode("utf-8")
+        rows, raw_headers, fmt = self._open_source(file_content, filename, file_type, delimiter, sheet_name)
+        delimiter = delimiter or ","
         
-        # Detect file type
-        detected_type = file_type or self.detect_file_type(filename, file_content)
-        
-        # Parse file based on type
-        if detected_type == "excel":
-            rows, _ = self.parse_excel(file_content, sheet_name)
-        elif detected_type == "json":
-            rows, _ = self.parse_json(file_content)
-        elif detected_type == "tsv":
-            rows, _ = self.parse_tsv(file_content)
-        else:  # CSV or default
-            content_str = file_content.decode("utf-8") if isinstance(file_content, bytes) else file_content
-            rows = self._parse_delimited(content_str, delimiter=delimiter)
+        with self._profiled(filename) as profile:
+            headers_out, table, report = self._clean_to_table(
+                rows, raw_headers, fmt.file_type, delimiter, normalize_headers, drop_empty_rows,
+                apply_crm_mappings=apply_crm_mappings, started=started, infer_types=infer_types,
+                near_duplicates=near_duplicates,
+            )
+            cleaned_csv = self._timed_csv(headers_out, table, delimiter, report)
+        report.profile_path = profile.path
+        return cleaned_csv, report
+    
+    def clean_delta(
+        self,
+        file_content: bytes | t.BinaryIO | t.Iterable[bytes],
+        filename: str,
+        output_dir: str | os.PathLike[str],
+        snapshot_dir: str | os.PathLike[str] | None = None,
+        *,
+        key: str | None = None,
+        file_type: str | None = None,
+        delimiter: str | None = None,
+        normalize_headers: bool = True,
+        drop_empty_rows: bool = True,
+        apply_crm_mappings: bool = True,
+        sheet_name: str | None = None,
+        infer_types: bool = True,
+        chunk_size: int = 10000,
+        workers: int | None = 1,
+    ) -> DeltaCleanResult:
+        """
+        Clean a new export of a dataset against the snapshot a previous run left in
+        `snapshot_dir`, and write the new snapshot to `output_dir` (see DELTA_SNAPSHOT_FILES).
+        Source rows the snapshot has already seen reuse their cleaned form byte for byte;
+        only new or edited rows go through the cleaning pipeline, with the snapshot's column
+        schema, so the cleaning work scales with the size of the change. Dedup and profiling
+        still run over every row, in input order. The change sets compare cleaned output:
+        rows now present that weren't (inserted), rows no longer present (deleted), and,
+        with a `key` output column, inserted/deleted pairs sharing a key value (updated).
+        Without `snapshot_dir` the whole export is cleaned and every row is inserted.
+        The snapshot must come from the same headers, options and filter rules; otherwise
+        run without it. Report fixes and filter counts cover the rows cleaned in this run.
+        """
+        started = utc_now_iso()
+        options = {
+            "normalize_headers": normalize_headers,
+            "drop_empty_rows": drop_empty_rows,
+            "apply_crm_mappings": apply_crm_mappings,
+            "infer_types": infer_types,
+        }
+        # Round-tripped through JSON so they compare equal to the snapshot's copy
+        filter_rules = json.loads(json.dumps([dataclasses.asdict(rule) for rule in self.filter_rules]))
+        paths = {name: os.path.join(output_dir, fname) for name, fname in DELTA_SNAPSHOT_FILES.items()}
         
-        if not rows:
-            raise ServiceError(f"{detected_type.upper()} file appears to be empty.")
+        prior_meta: dict[str, t.Any] | None = None
+        if snapshot_dir is not None:
+            if os.path.realpath(snapshot_dir) == os.path.realpath(output_dir):
+                raise ServiceError("The new snapshot must be written to a different directory than the prior one.")
+            try:
+                with open(os.path.join(snapshot_dir, DELTA_SNAPSHOT_FILES["meta"]), encoding="utf-8") as f:
+                    prior_meta = json.load(f)
+            except (OSError, ValueError) as e:
+                raise ServiceError(f"Cannot read the prior snapshot: {e}") from e
+            # Older layouts are not migrated: a version 1 or 2 snapshot lacks the row files this
+            # version reuses, so it is refused and the next run starts a new snapshot
+            version = prior_meta.get("version")
+            if version != DELTA_SNAPSHOT_VERSION:
+                raise ServiceError(
+                    f"The prior snapshot uses layout version {version}, and this engine reads version "
+                    f"{DELTA_SNAPSHOT_VERSION}; run a full clean without a prior snapshot to start a new one."
+                )
+            missing = [
+                fname for fname in DELTA_SNAPSHOT_FILES.values()
+                if not os.path.isfile(os.path.join(snapshot_dir, fname))
+            ]
+            if missing:
+                raise ServiceError(
+                    f"The prior snapshot is incomplete (missing {', '.join(missing)}); run a full clean."
+                )
+            if prior_meta["options"] != options or prior_meta["filter_rules"] != filter_rules:
+                raise ServiceError(
+                    "The prior snapshot was cleaned with different options or filter rules; run a full clean."
+                )
         
-        raw_headers = rows[0]
-        data_rows = rows[1:]
+        if isinstance(file_content, str):
+            file_content = file_content.encode("utf-8")
+        rows, raw_headers, fmt = self._open_source(file_content, filename, file_type, delimiter, sheet_name)
+        delimiter = delimiter or ","
+        if prior_meta is not None and prior_meta["raw_headers"] != raw_headers:
+            raise ServiceError("The export's columns differ from the prior snapshot's; run a full clean.")
         
-        # Detect CRM type
-        crm_type = self.detect_crm_type(raw_headers) if apply_crm_mappings else None
+        headers_out = self._map_headers(
+            raw_headers, normalize_headers, apply_crm_mappings, collections.defaultdict(int)
+        )[0]
+        key_idx = None
+        if key is not None:
+            if key not in headers_out:
+                raise ServiceError(f"Key column '{key}' is not among the output headers.")
+            key_idx = headers_out.index(key)
         
-        # Apply CRM mappings if detected
-        if crm_type and apply_crm_mappings:
-            headers_out, field_mappings = self.apply_crm_mappings(raw_headers, crm_type)
-        else:
-            headers_out = [slugify_header(h) if normalize_headers else h.strip() for h in raw_headers]
-            field_mappings = {h: headers_out[i] for i, h in enumerate(raw_headers)}
+        # Unchanged rows must clean like they did before, so the schema is the snapshot's;
+        # a first run infers it here, as the pipeline would, to record it in the snapshot
+        schema = None
+        if prior_meta is not None:
+            schema = [ColumnSchema(**c) for c in prior_meta["schema"]] if prior_meta["schema"] is not None else None
+        elif infer_types:
+            first_chunk = list(itertools.islice(rows, chunk_size))
+            schema = self.infer_column_types(
+                headers_out, self._schema_sample(first_chunk, len(raw_headers), delimiter)
+            )
+            rows = itertools.chain(first_chunk, rows)
         
-        # Use existing cleaning logic
-        fixes: dict[str, int] = {
-            "trimmed_cells": 0,
-            "normalized_headers": 0,
-            "normalized_dates": 0,
-            "normalized_numbers": 0,
-            "empties_to_blank": 0,
-            "dropped_empty_rows": 0,
-            "duplicates_removed": 0,
-            "irrelevant_rows_removed": 0,
-        }
+        buf = io.StringIO()
+        buf_writer = csv.writer(buf, lineterminator="\n")
         
-        header_map: dict[str, str] = {h: headers_out[i] for i, h in enumerate(raw_headers)}
-        for h in raw_headers:
-            h2 = header_map[h]
-            if h2 != h:
-                fixes["normalized_headers"] += 1
+        def encode(row: list[str]) -> bytes:
+            buf.seek(0)
+            buf.truncate()
+            buf_writer.writerow(row)
+            return buf.getvalue().encode("utf-8")
         
-        def norm_cell(val: str) -> str:
-            if val is None:
-                fixes["empties_to_blank"] += 1
-                return ""
-            v = str(val)
-            v2 = v.strip()
-            if v2 != v:
-                fixes["trimmed_cells"] += 1
-            v = v2
-            if not v:
-                return ""
-            
-            # numbers like "1,234.50" -> "1234.50"
-            if re.fullmatch(r"-?\d{1,3}(,\d{3})+(\.\d+)?", v):
-                fixes["normalized_numbers"] += 1
-                return v.replace(",", "")
-            
-            # dates
-            for pat in self._date_patterns:
-                if pat.match(v):
-                    iso = self._try_parse_date_to_iso(v)
-                    if iso and iso != v:
-                        fixes["normalized_dates"] += 1
-                        return iso
-                    return v
-            return v
+        def decode(data: bytes) -> list[str]:
+            return next(csv.reader(io.StringIO(data.decode("utf-8"))))
         
-        def reconcile_row_length(row: list[str], target_cols: int) -> list[str]:
-            if len(row) == target_cols:
-                return row
-            if len(row) < target_cols:
-                return (row + [""] * target_cols)[:target_cols]
+        os.makedirs(output_dir, exist_ok=True)
+        header = encode(headers_out)
+        records_paths = {name: paths[name] + ".records" for name in ("index", "merged_index")}
+        with contextlib.ExitStack() as stack, self._profiled(f"delta-{filename}") as profile:
+            def map_prior(name: str) -> mmap.mmap | None:
+                f = stack.enter_context(open(os.path.join(snapshot_dir, DELTA_SNAPSHOT_FILES[name]), "rb"))
+                if not os.fstat(f.fileno()).st_size:
+                    return None
+                return stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
             
-            rr = list(row)
-            numeric_left = re.compile(r"^-?\d{1,3}$")
-            numeric_mid = re.compile(r"^\d{3}$")
-            numeric_right = re.compile(r"^\d{3}(\.\d+)?$")
+            prior_index = prior_merged_index = prior_rows = prior_merged = None
+            if prior_meta is not None:
+                prior_index = _SnapshotIndex(os.path.join(snapshot_dir, DELTA_SNAPSHOT_FILES["index"]))
+                stack.callback(prior_index.close)
+                prior_merged_index = _SnapshotIndex(os.path.join(snapshot_dir, DELTA_SNAPSHOT_FILES["merged_index"]))
+                stack.callback(prior_merged_index.close)
+                prior_rows = map_prior("rows")
+                prior_merged = map_prior("merged")
             
-            i = 0
-            while len(rr) > target_cols and i < len(rr) - 1:
-                a, b = rr[i].strip(), rr[i + 1].strip()
-                if numeric_left.match(a) and (numeric_mid.match(b) or numeric_right.match(b)):
-                    rr[i : i + 2] = [f"{a},{b}"]
-                    fixes["normalized_numbers"] += 1
-                    continue
-                i += 1
+            source_records = stack.enter_context(open(records_paths["index"], "wb"))
+            reuse = _SourceRowReuse(
+                prior_index, prior_rows, stack.enter_context(open(paths["rows"], "wb")), source_records,
+                stack.enter_context(self._new_dedup_index()),
+            )
+            _, chunks, report = self._open_clean_job(
+                rows, raw_headers, fmt.file_type, delimiter, normalize_headers, drop_empty_rows,
+                apply_crm_mappings, started, chunk_size, workers, infer_types, schema=schema, reuse=reuse,
+            )
+            result = DeltaCleanResult(
+                snapshot_dir=os.fspath(output_dir),
+                merged_path=paths["merged"],
+                inserted_path=paths["inserted"],
+                updated_path=paths["updated"],
+                updated_previous_path=paths["updated_previous"],
+                deleted_path=paths["deleted"],
+                report=report,
+            )
             
-            if len(rr) > target_cols:
-                head = rr[: target_cols - 1]
-                tail = rr[target_cols - 1 :]
-                rr = head + [delimiter.join(tail)]
-            return rr[:target_cols]
-        
-        # Process and clean rows
-        cleaned_rows: list[list[str]] = []
-        for r in data_rows:
-            rr = reconcile_row_length(list(r), len(raw_headers))
-            rr2 = [norm_cell(c) for c in rr]
+            seen = stack.enter_context(self._new_dedup_index())
+            merged_records = stack.enter_context(open(records_paths["merged_index"], "wb"))
+            merged = stack.enter_context(open(paths["merged"], "wb"))
+            inserted = stack.enter_context(open(paths["inserted"], "wb"))
+            merged.write(header)
+            inserted.write(header)
+            # With a key, inserted rows wait for the deleted scan to pair them into updates
+            pending_by_key: dict[str, list[bytes]] | None = {} if key_idx is not None and prior_index else None
+            offset = len(header)
             
-            # Drop completely empty rows
-            if drop_empty_rows and all(c == "" for c in rr2):
-                fixes["dropped_empty_rows"] += 1
-                continue
+            for chunk in chunks:
+                for row in chunk:
+                    data = encode(row)
+                    digest = source_row_digest(row)
+                    seen.add(digest)
+                    merged_records.write(_SnapshotIndex.pack(digest, offset, len(data)))
+                    merged.write(data)
+                    offset += len(data)
+                    if prior_merged_index is not None and prior_merged_index.get(digest) is not None:
+                        result.unchanged += 1
+                    elif pending_by_key is not None:
+                        pending_by_key.setdefault(row[key_idx], []).append(data)
+                    else:
+                        inserted.write(data)
+                        result.inserted += 1
+            result.rows_reused = reuse.rows_reused
+            result.rows_cleaned = reuse.rows_cleaned
             
-            # Filter irrelevant rows (rows with too many empty cells or test data)
-            if self._is_irrelevant_row(rr2, len(headers_out)):
-                fixes["irrelevant_rows_removed"] += 1
-                continue
+            deleted = stack.enter_context(open(paths["deleted"], "wb"))
+            updated = stack.enter_context(open(paths["updated"], "wb"))
+            updated_previous = stack.enter_context(open(paths["updated_previous"], "wb"))
+            for f in (deleted, updated, updated_previous):
+                f.write(header)
+            if prior_merged_index is not None:
+                for digest, prior_offset, length in prior_merged_index:
+                    if digest in seen:
+                        continue
+                    data = prior_merged[prior_offset : prior_offset + length]
+                    pending = pending_by_key.get(decode(data)[key_idx]) if pending_by_key is not None else None
+                    if pending:
+                        updated.write(pending.pop(0))
+                        updated_previous.write(data)
+                        result.updated += 1
+                    else:
+                        deleted.write(data)
+                        result.deleted += 1
+            for pending in (pending_by_key or {}).values():
+                for data in pending:
+                    inserted.write(data)
+                    result.inserted += 1
             
-            cleaned_rows.append(rr2)
-        
-        # Remove duplicates
-        seen_rows: set[tuple[str, ...]] = set()
-        deduplicated_rows: list[list[str]] = []
-        for row in cleaned_rows:
-            # Create a tuple for hashing (normalize whitespace)
-            row_tuple = tuple(c.strip().lower() if c else "" for c in row)
-            if row_tuple not in seen_rows:
-                seen_rows.add(row_tuple)
-                deduplicated_rows.append(row)
-            else:
-                fixes["duplicates_removed"] += 1
+            source_records.close()
+            merged_records.close()
+            for name, records_path in records_paths.items():
+                _SnapshotIndex.write(paths[name], records_path)
+                os.remove(records_path)
         
-        out_rows: list[list[str]] = [headers_out] + deduplicated_rows
-        rows_out_count = len(deduplicated_rows)
-        
-        out = io.StringIO()
-        writer = csv.writer(out, delimiter=delimiter, lineterminator="\n")
-        writer.writerows(out_rows)
-        
-        finished = utc_now_iso()
-        report = DataCleanReport(
-            rows_in=len(data_rows),
-            rows_out=rows_out_count,
-            columns_in=len(raw_headers),
-            columns_out=len(headers_out),
-            header_map=header_map,
-            fixes=fixes,
-            started_at=started,
-            finished_at=finished,
-            file_type=detected_type,
-            crm_detected=crm_type,
-            field_mappings=field_mappings,
-            duplicates_removed=fixes.get("duplicates_removed", 0),
-            irrelevant_rows_removed=fixes.get("irrelevant_rows_removed", 0),
-        )
-        return out.getvalue(), report
+        report.profile_path = profile.path
+        report.finished_at = utc_now_iso()
+        with open(paths["meta"], "w", encoding="utf-8") as f:
+            json.dump({
+                "version": DELTA_SNAPSHOT_VERSION,
+                "created_at": report.finished_at,
+                "raw_headers": raw_headers,
+                "headers": headers_out,
+                "options": options,
+                "filter_rules": filter_rules,
+                "schema": [dataclasses.asdict(c) for c in schema] if schema is not None else None,
+                "rows_in": report.rows_in,
+                "rows_out": report.rows_out,
+            }, f, ensure_ascii=False)
+        return result
     
-    def _is_irrelevant_row(self, row: list[str], num_columns: int) -> bool:
+    def infer_column_types(self, headers: list[str], sample_rows: list[list[str]]) -> list[ColumnSchema]:
         """
-        Determine if a row is irrelevant and should be removed.
-        Criteria:
-        - More than 80% empty cells
-        - Contains common test data indicators
-        - Only contains whitespace or special characters
+        Classify each column (date, numeric, email, phone, categorical, text) from a
+        sample of raw rows, and detect the M/D vs D/M convention of date columns.
         """
-        if not row:
-            return True
-        
-        # Count non-empty cells
-        non_empty_count = sum(1 for cell in row if cell and cell.strip())
-        empty_percentage = (num_columns - non_empty_count) / max(num_columns, 1)
-        
-        # Remove rows with more than 80% empty cells
-        if empty_percentage > 0.8:
-            return True
-        
-        # Check for test data indicators
-        test_indicators = [
-            "test", "example", "sample", "dummy", "placeholder",
-            "lorem ipsum", "xxx", "aaa", "123", "test@test.com"
+        schema: list[ColumnSchema] = []
+        for col_idx, header in enumerate(headers):
+            values = []
+            for row in sample_rows:
+                if col_idx < len(row) and row[col_idx] is not None:
+                    v = str(row[col_idx]).strip()
+                    if v:
+                        values.append(v)
+            schema.append(self._classify_column(header, values))
+        return schema
+    
+    def _schema_sample(self, rows: list[list[str]], width: int, delimiter: str) -> list[list[str]]:
+        """Length-reconciled copy of the first SCHEMA_SAMPLE_ROWS rows (fix counters untouched)"""
+        scratch: dict[str, int] = collections.defaultdict(int)
+        return [
+            self._reconcile_row_length(list(r), width, delimiter, scratch)
+            for r in itertools.islice(rows, SCHEMA_SAMPLE_ROWS)
         ]
-        row_text = " ".join(cell.lower() for cell in row if cell)
-        if any(indicator in row_text for indicator in test_indicators):
-            # Only remove if it's clearly test data (not just containing the word)
-            if any(row_text.startswith(ind) or row_text.endswith(ind) for ind in test_indicators):
-                return True
+    
+    def _classify_column(self, name: str, values: list[str]) -> ColumnSchema:
+        """Classify one column from its non-empty sampled values"""
+        if not values:
+            return ColumnSchema(name, "text")
         
-        # Remove rows that are only whitespace/special characters
-        if non_empty_count == 0:
-            return True
+        n = len(values)
+        dates = [v for v in values if _DATE_CANDIDATE_RE.match(v)]
+        numbers = sum(1 for v in values if _PLAIN_NUMBER_RE.fullmatch(v))
+        has_separators = any(_THOUSANDS_NUMBER_RE.fullmatch(v) for v in values)
         
-        return False
-
-    def _try_parse_date_to_iso(self, value: str) -> str | None:
+        if len(dates) >= n * SCHEMA_TYPE_THRESHOLD:
+            return ColumnSchema(
+                name, "date",
+                date_convention=self._detect_date_convention(dates),
+                mixed=has_separators,
+            )
+        if numbers >= n * SCHEMA_TYPE_THRESHOLD:
+            return ColumnSchema(name, "numeric", mixed=bool(dates))
+        
+        # Anything below is only trimmed, unless the sample shows dates or
+        # separated numbers that still need the full normalizer.
+        mixed = bool(dates) or has_separators
+        if sum(1 for v in values if _EMAIL_RE.fullmatch(v)) >= n * SCHEMA_TYPE_THRESHOLD:
+            return ColumnSchema(name, "email", mixed=mixed)
+        phones = sum(
+            1 for v in values
+            if _PHONE_RE.fullmatch(v) and 7 <= sum(ch.isdigit() for ch in v) <= 15
+        )
+        if phones >= n * SCHEMA_TYPE_THRESHOLD:
+            return ColumnSchema(name, "phone", mixed=mixed)
+        distinct = len(set(values))
+        if distinct <= 50 and distinct <= max(1, n // 2):
+            return ColumnSchema(name, "categorical", mixed=mixed)
+        return ColumnSchema(name, "text", mixed=mixed)
+    
+    def _detect_date_convention(self, dates: list[str]) -> str:
+        """Pick "M/D" or "D/M" from sampled slash/dash dates ("ISO" if there are none)"""
+        first_over_12 = second_over_12 = False
+        seen_slash_date = False
+        for v in dates:
+            m = _SLASH_DATE_RE.fullmatch(v)
+            if not m:
+                continue
+            seen_slash_date = True
+            first_over_12 = first_over_12 or int(m.group(1)) > 12
+            second_over_12 = second_over_12 or int(m.group(2)) > 12
+        if not seen_slash_date:
+            return "ISO"
+        # Ambiguous or conflicting samples keep the historical M/D reading
+        return "D/M" if first_over_12 and not second_over_12 else "M/D"
+    
+    def _schema_column_types(self, schema: list[ColumnSchema] | None) -> dict[str, str]:
+        return {col.name: col.column_type for col in schema or []}
+    
+    def _schema_date_conventions(self, schema: list[ColumnSchema] | None) -> dict[str, str]:
+        return {col.name: col.date_convention for col in schema or [] if col.date_convention}
+    
+    def _try_parse_date_to_iso(self, value: str, day_first: bool = False) -> str | None:
         value = value.strip()
         # YYYY-MM-DD
         try:
-            if re.fullmatch(r"\d{4}-\d{2}-\d{2}", value):
+            if _ISO_DATE_RE.fullmatch(value):
                 d = _dt.date.fromisoformat(value)
                 return d.isoformat()
         except ValueError:
             pass
-        # M/D/YYYY or M-D-YYYY
-        m = re.fullmatch(r"(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})", value)
+        # M/D/YYYY or M-D-YYYY (D/M/YYYY with day_first)
+        m = _SLASH_DATE_RE.fullmatch(value)
         if m:
             mm, dd, yy = int(m.group(1)), int(m.group(2)), int(m.group(3))
+            if day_first:
+                mm, dd = dd, mm
             if yy < 100:
                 yy += 2000
             try:
@@ -643,7 +2796,7 @@ class ApexDataCleanEngine:
         try:
             if "T" in value:
                 dt_str = value.split("T")[0]
-                if re.fullmatch(r"\d{4}-\d{2}-\d{2}", dt_str):
+                if _ISO_DATE_RE.fullmatch(dt_str):
                     d = _dt.date.fromisoformat(dt_str)
                     return d.isoformat()
         except ValueError:
@@ -652,79 +2805,365 @@ class ApexDataCleanEngine:
     
     def clean_file_streaming(
         self,
-        file_content: bytes,
+        file_content: bytes | t.BinaryIO | t.Iterable[bytes],
         filename: str,
         *,
         file_type: str | None = None,
-        delimiter: str = ",",
+        delimiter: str | None = None,
         normalize_headers: bool = True,
         drop_empty_rows: bool = True,
         apply_crm_mappings: bool = True,
         sheet_name: str | None = None,
         chunk_size: int = 10000,
         export_formats: list[str] | None = None,
+        workers: int | None = 1,
+        infer_types: bool = True,
+        near_duplicates: str = "off",
+        result_path: str | os.PathLike[str] | None = None,
+        output_dir: str | os.PathLike[str] | None = None,
+        progress: ProgressCallback | None = None,
+        cache: bool = True,
     ) -> tuple[dict[str, t.Any], DataCleanReport]:
         """
         Clean large files using streaming/chunked processing to handle millions of rows.
-        Returns a dict with multiple output formats and column-based files.
+        `file_content` may be bytes, a binary file-like object, or an iterator of byte blocks;
+        CSV/TSV input is decoded and parsed incrementally instead of being loaded up front,
+        after a bounded sample settles its encoding, header row and (with `delimiter` None)
+        its delimiter and quoting; output CSV uses `delimiter`, or "," when sniffed.
+        `workers` > 1 (or None for one per CPU) cleans chunks in a process pool.
+        `near_duplicates` is "off", "report" or "merge" (see find_near_duplicates).
+        `result_path`, if given, receives the cleaned rows as CSV; column files listed in
+        the returned "column_manifest" are rendered from it on demand.
+        With an `output_dir`, the requested master outputs are streamed chunk by chunk into
+        files there (MASTER_OUTPUT_FILES) instead of being built in memory, so memory stays
+        bounded by `chunk_size` whatever the file size (near-duplicate detection, a pass over
+        the whole table, still holds the table); outputs["files"] maps output names to the
+        paths written and outputs["csv_preview"] holds the head of the CSV. A comma-delimited
+        master CSV is not written twice: with a `result_path` it is that file.
+        `progress`, if given, is called after every chunk and at each later stage.
+        With a `profile_dir`, long runs leave a sampling profile (report.profile_path).
+        Otherwise returns a dict with multiple output formats and the column file manifest.
+        With a `result_cache`, identical input and options return the stored result
+        (outputs["_cache_hit"] tells which). Hashing for the cache reads the whole input
+        before cleaning starts; `cache=False` skips it, for input still arriving.
         """
         started = utc_now_iso()
         
-        # Detect file type
-        detected_type = file_type or self.detect_file_type(filename, file_content)
+        input_sha256 = None
+        if self.result_cache is not None and cache:
+            file_content, input_sha256 = self._hash_source(file_content)
         
-        # Parse file based on type
-        if detected_type == "excel":
-            rows, _ = self.parse_excel(file_content, sheet_name)
-        elif detected_type == "json":
-            rows, _ = self.parse_json(file_content)
-        elif detected_type == "tsv":
-            rows, _ = self.parse_tsv(file_content)
-        else:  # CSV or default
-            content_str = file_content.decode("utf-8") if isinstance(file_content, bytes) else file_content
-            rows = self._parse_delimited(content_str, delimiter=delimiter)
+        file_content, fmt = self.sniff_source(file_content, filename, file_type=file_type, delimiter=delimiter)
+        detected_type = fmt.file_type
         
-        if not rows:
-            raise ServiceError(f"{detected_type.upper()} file appears to be empty.")
+        cache_key = None
+        if input_sha256 is not None:
+            cache_key = self.result_cache.key(input_sha256, {
+                "file_type": detected_type,
+                "delimiter": delimiter,
+                "normalize_headers": normalize_headers,
+                "drop_empty_rows": drop_empty_rows,
+                "apply_crm_mappings": apply_crm_mappings,
+                "sheet_name": sheet_name,
+                "chunk_size": chunk_size,
+                "export_formats": sorted(set(export_formats or ['csv', 'json', 'excel', 'columns'])),
+                "infer_types": infer_types,
+                "near_duplicates": near_duplicates,
+                "filter_rules": [dataclasses.asdict(rule) for rule in self.filter_rules],
+                "output_files": output_dir is not None,
+            })
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                outputs, report, cleaned_csv_path = cached
+                try:
+                    if result_path is not None:
+                        shutil.copyfile(cleaned_csv_path, result_path)
+                    if output_dir is not None:
+                        files = {}
+                        for name, cached_path in outputs["files"].items():
+                            if cached_path == cleaned_csv_path and result_path is not None:
+                                # The master CSV was the result file, copied above
+                                files[name] = os.fspath(result_path)
+                                continue
+                            files[name] = os.path.join(output_dir, MASTER_OUTPUT_FILES[name][1])
+                            shutil.copyfile(cached_path, files[name])
+                        outputs["files"] = files
+                except FileNotFoundError:
+                    # Evicted by another job between lookup and copy: clean as on a miss
+                    self.result_cache.discard(cache_key)
+                else:
+                    outputs["_cache_hit"] = True
+                    return outputs, report
         
-        raw_headers = rows[0]
-        data_rows = rows[1:]
+        rows = self._iter_source_rows(file_content, fmt, sheet_name)
+        raw_headers = next(rows, None)
+        if raw_headers is None:
+            raise ServiceError(f"{detected_type.upper()} file appears to be empty.")
+        delimiter = delimiter or ","
         
-        # For very large files, process in chunks
-        if len(data_rows) > chunk_size:
-            return self._process_large_file_chunked(
-                rows, raw_headers, detected_type, delimiter, normalize_headers,
-                drop_empty_rows, apply_crm_mappings, started, chunk_size, export_formats
-            )
+        with contextlib.ExitStack() as stack:
+            if (
+                cache_key is not None and result_path is None and output_dir is not None
+                and delimiter == "," and "csv" in (export_formats or ['csv'])
+            ):
+                # The master CSV doubles as the cleaned CSV; the cache keeps its own copy
+                result_path = os.path.join(output_dir, MASTER_OUTPUT_FILES["master_cleanse_csv"][1])
+            elif cache_key is not None and result_path is None:
+                # The cache keeps the cleaned CSV for column files even if the caller doesn't
+                fd, result_path = tempfile.mkstemp(prefix="apex-result-", suffix=".csv", dir=self.spill_dir)
+                os.close(fd)
+                stack.callback(os.remove, result_path)
+            
+            with self._profiled(filename) as profile:
+                outputs, report = self._process_large_file_chunked(
+                    rows, raw_headers, detected_type, delimiter, normalize_headers,
+                    drop_empty_rows, apply_crm_mappings, started, chunk_size, export_formats, workers,
+                    infer_types, near_duplicates, result_path, progress, output_dir,
+                )
+            report.profile_path = profile.path
+            if cache_key is not None:
+                self.result_cache.put(cache_key, outputs, report, result_path)
+                outputs["_cache_hit"] = False
+        return outputs, report
+    
+    def _hash_source(
+        self, source: bytes | t.BinaryIO | t.Iterable[bytes]
+    ) -> tuple[bytes | t.BinaryIO, str]:
+        """
+        sha256 of a source's bytes, plus a source that can still be read from the start:
+        bytes and seekable streams are rewound, anything else is spooled while hashing.
+        """
+        digest = hashlib.sha256()
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            digest.update(source)
+            return source, digest.hexdigest()
+        stream = self._open_binary_stream(source)
+        if getattr(stream, "seekable", lambda: False)():
+            start = stream.tell()
+            for block in iter(lambda: stream.read(1 << 20), b""):
+                digest.update(block)
+            stream.seek(start)
+            return stream, digest.hexdigest()
+        spool = tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024, dir=self.spill_dir)
+        for block in iter(lambda: stream.read(1 << 20), b""):
+            digest.update(block)
+            spool.write(block)
+        spool.seek(0)
+        return spool, digest.hexdigest()
+    
+    def iter_clean_chunks(
+        self,
+        source: bytes | t.BinaryIO | t.Iterable[bytes],
+        filename: str = "",
+        *,
+        file_type: str | None = None,
+        delimiter: str | None = None,
+        normalize_headers: bool = True,
+        drop_empty_rows: bool = True,
+        apply_crm_mappings: bool = True,
+        sheet_name: str | None = None,
+        chunk_size: int = 10000,
+        workers: int | None = 1,
+        infer_types: bool = True,
+    ) -> tuple[list[str], t.Iterator[list[list[str]]], DataCleanReport]:
+        """
+        Open a streaming clean job over `source` (sniffed like clean_file_streaming).
+        Returns the output headers, a generator of cleaned row chunks (at most `chunk_size`
+        rows each) and a report that is filled in as the generator is consumed.
+        """
+        started = utc_now_iso()
+        rows, raw_headers, fmt = self._open_source(source, filename, file_type, delimiter, sheet_name)
         
-        # Use regular processing for smaller files
-        cleaned_csv, report = self.clean_file(
-            file_content, filename,
+        headers_out, chunks, report = self._open_clean_job(
+            rows, raw_headers, fmt.file_type, delimiter or ",", normalize_headers,
+            drop_empty_rows, apply_crm_mappings, started, chunk_size, workers, infer_types
+        )
+        return headers_out, chunks, report
+    
+    def clean_stream(
+        self,
+        source: bytes | t.BinaryIO | t.Iterable[bytes],
+        output: SinkTarget,
+        filename: str = "",
+        *,
+        output_format: str = "csv",
+        file_type: str | None = None,
+        delimiter: str | None = None,
+        normalize_headers: bool = True,
+        drop_empty_rows: bool = True,
+        apply_crm_mappings: bool = True,
+        sheet_name: str | None = None,
+        chunk_size: int = 10000,
+        workers: int | None = 1,
+        infer_types: bool = True,
+    ) -> DataCleanReport:
+        """
+        Clean `source` and write the result to `output` (a path or writable stream)
+        chunk by chunk, so memory is bounded by `chunk_size` rather than file size.
+        `output_format` is "csv" (default), "json", "ndjson" or "excel".
+        """
+        return self.clean_to_sinks(
+            source, {output_format: output}, filename,
+            file_type=file_type,
+            delimiter=delimiter,
+            normalize_headers=normalize_headers,
+            drop_empty_rows=drop_empty_rows,
+            apply_crm_mappings=apply_crm_mappings,
+            sheet_name=sheet_name,
+            chunk_size=chunk_size,
+            workers=workers,
+            infer_types=infer_types,
+        )
+    
+    def clean_to_sinks(
+        self,
+        source: bytes | t.BinaryIO | t.Iterable[bytes],
+        sinks: dict[str, SinkTarget],
+        filename: str = "",
+        *,
+        file_type: str | None = None,
+        delimiter: str | None = None,
+        normalize_headers: bool = True,
+        drop_empty_rows: bool = True,
+        apply_crm_mappings: bool = True,
+        sheet_name: str | None = None,
+        chunk_size: int = 10000,
+        workers: int | None = 1,
+        infer_types: bool = True,
+    ) -> DataCleanReport:
+        """
+        Clean `source` once and stream every cleaned chunk to each sink in `sinks`,
+        a mapping of export format ("csv", "json", "ndjson", "excel") to a path or
+        writable stream. No format holds more than one chunk in memory, so every
+        format is available regardless of row count.
+        """
+        headers_out, chunks, report = self.iter_clean_chunks(
+            source, filename,
             file_type=file_type,
             delimiter=delimiter,
             normalize_headers=normalize_headers,
             drop_empty_rows=drop_empty_rows,
             apply_crm_mappings=apply_crm_mappings,
             sheet_name=sheet_name,
+            chunk_size=chunk_size,
+            workers=workers,
+            infer_types=infer_types,
         )
+        with contextlib.ExitStack() as stack:
+            opened = [
+                stack.enter_context(open_sink(fmt, target, headers_out, delimiter=delimiter or ","))
+                for fmt, target in sinks.items()
+            ]
+            for chunk in chunks:
+                for sink in opened:
+                    sink.write_rows(chunk)
+        return report
+    
+    def export_rows(
+        self,
+        rows: ColumnarTable | t.Iterable[list[str]],
+        headers: list[str],
+        export_format: str,
+        target: SinkTarget,
+        delimiter: str = ",",
+    ) -> int:
+        """Write already-cleaned rows to a path or stream; returns the number of rows written."""
+        with open_sink(export_format, target, headers, delimiter=delimiter) as sink:
+            sink.write_rows(rows)
+        return sink.rows_written
+    
+    def _iter_source_rows(
+        self,
+        source: bytes | t.BinaryIO | t.Iterable[bytes],
+        fmt: SourceFormat,
+        sheet_name: str | None = None,
+    ) -> t.Iterator[list[str]]:
+        """
+        Yield raw rows (header first) from any supported source; delimited text goes
+        through an incremental decoder, and headerless files get column_1..column_N headers
+        """
+        if fmt.file_type == "excel":
+            yield from self.iter_excel_rows(source, sheet_name)
+            return
+        if fmt.file_type == "json":
+            yield from self.iter_json_rows(source)
+            return
         
-        # Parse cleaned CSV to get rows for multiple outputs
-        reader = csv.reader(io.StringIO(cleaned_csv))
-        rows_list = list(reader)
-        headers_out = rows_list[0] if rows_list else raw_headers
-        cleaned_rows = rows_list[1:] if len(rows_list) > 1 else []
+        binary = self._open_binary_stream(source)
+        text = io.TextIOWrapper(binary, encoding=fmt.encoding, newline="")
+        try:
+            reader = csv.reader(text, delimiter=fmt.delimiter, quotechar=fmt.quotechar)
+            if not fmt.has_header:
+                first = next(reader, None)
+                if first is None:
+                    return
+                yield [f"column_{i + 1}" for i in range(max(fmt.columns, len(first)))]
+                yield first
+            yield from reader
+        except UnicodeDecodeError as e:
+            raise ServiceError(
+                f"File is not valid {fmt.encoding} text past the sniffed sample ({e.reason}); "
+                "re-export it as UTF-8."
+            )
+        finally:
+            # Don't close a stream the caller handed us
+            text.detach()
+    
+    def _open_source(
+        self,
+        source: bytes | t.BinaryIO | t.Iterable[bytes],
+        filename: str,
+        file_type: str | None,
+        delimiter: str | None,
+        sheet_name: str | None,
+    ) -> tuple[t.Iterator[list[str]], list[str], SourceFormat]:
+        """Sniff `source`, then return its row iterator (past the header), the header row and the format"""
+        source, fmt = self.sniff_source(source, filename, file_type=file_type, delimiter=delimiter)
+        rows = self._iter_source_rows(source, fmt, sheet_name)
+        raw_headers = next(rows, None)
+        if raw_headers is None:
+            raise ServiceError(f"{fmt.file_type.upper()} file appears to be empty.")
+        return rows, raw_headers, fmt
+    
+    def _open_binary_stream(self, source: bytes | t.BinaryIO | t.Iterable[bytes]) -> t.BinaryIO:
+        """Adapt bytes, a binary file-like object, or an iterator of byte blocks to a binary stream"""
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return io.BytesIO(source)
+        if hasattr(source, "read") and hasattr(source, "readable"):
+            return source
+        if hasattr(source, "read"):
+            # Duck-typed reader without the io.IOBase interface
+            reader = source
+            return io.BufferedReader(_ByteBlockReader(iter(lambda: reader.read(1 << 20), b"")))
+        return io.BufferedReader(_ByteBlockReader(source))
+    
+    def _map_headers(
+        self,
+        raw_headers: list[str],
+        normalize_headers: bool,
+        apply_crm_mappings: bool,
+        fixes: dict[str, int],
+    ) -> tuple[list[str], str | None, dict[str, str], dict[str, str]]:
+        """Resolve output headers: (headers_out, crm_type, field_mappings, header_map)"""
+        # Detect CRM type
+        crm_type = self.detect_crm_type(raw_headers) if apply_crm_mappings else None
         
-        # Generate multiple output formats (only requested ones)
-        export_formats = export_formats or ['csv', 'json', 'excel', 'columns']
-        outputs = self._generate_multiple_outputs(
-            cleaned_csv, raw_headers, detected_type, report, cleaned_rows, headers_out, export_formats
-        )
+        # Apply CRM mappings if detected
+        if crm_type and apply_crm_mappings:
+            headers_out, field_mappings = self.apply_crm_mappings(raw_headers, crm_type)
+        else:
+            headers_out = [slugify_header(h) if normalize_headers else h.strip() for h in raw_headers]
+            field_mappings = {h: headers_out[i] for i, h in enumerate(raw_headers)}
         
-        return outputs, report
+        header_map: dict[str, str] = {h: headers_out[i] for i, h in enumerate(raw_headers)}
+        for h in raw_headers:
+            if header_map[h] != h:
+                fixes["normalized_headers"] += 1
+        return headers_out, crm_type, field_mappings, header_map
     
-    def _process_large_file_chunked(
+    def _open_clean_job(
         self,
-        rows: list[list[str]],
+        data_rows: t.Iterable[list[str]],
         raw_headers: list[str],
         detected_type: str,
         delimiter: str,
@@ -733,9 +3172,26 @@ class ApexDataCleanEngine:
         apply_crm_mappings: bool,
         started: str,
         chunk_size: int = 10000,
-        export_formats: list[str] | None = None,
-    ) -> tuple[dict[str, t.Any], DataCleanReport]:
-        """Process very large files in chunks to avoid memory issues"""
+        workers: int | None = 1,
+        infer_types: bool = True,
+        progress: ProgressCallback | None = None,
+        schema: list[ColumnSchema] | None = None,
+        reuse: _SourceRowReuse | None = None,
+    ) -> tuple[list[str], t.Iterator[list[list[str]]], DataCleanReport]:
+        """
+        Compile one cleaning job and return its output headers, the lazy cleaned-chunk
+        generator and the report. Every entry point runs its rows through here:
+        headers, CRM mapping and the schema-specialized normalizers are resolved once,
+        then each chunk flows parse -> reconcile -> normalize -> filter -> dedup -> profile
+        -> sink, with wall/CPU time, rows and memory per stage accumulated in
+        `report.stage_metrics` and wall time in `report.stage_timings` (summed across
+        workers for the pooled stages; "sink" is the time the consumer spends between
+        chunks). `report.column_profiles` is filled in once the generator is exhausted.
+        `progress` is called with stage "clean" once each chunk is counted, kept rows or not.
+        A given `schema` is used as is instead of being inferred from the first chunk.
+        With `reuse`, only the rows of each chunk it doesn't already have cleaned rows for
+        are reconciled, normalized and filtered; dedup and profiling still see every row.
+        """
         fixes: dict[str, int] = {
             "trimmed_cells": 0,
             "normalized_headers": 0,
@@ -747,103 +3203,663 @@ class ApexDataCleanEngine:
             "irrelevant_rows_removed": 0,
         }
         
-        data_rows = rows[1:]
-        
-        # Detect CRM type
-        crm_type = self.detect_crm_type(raw_headers) if apply_crm_mappings else None
-        
-        # Apply CRM mappings if detected
-        if crm_type and apply_crm_mappings:
-            headers_out, field_mappings = self.apply_crm_mappings(raw_headers, crm_type)
-        else:
-            headers_out = [slugify_header(h) if normalize_headers else h.strip() for h in raw_headers]
-            field_mappings = {h: headers_out[i] for i, h in enumerate(raw_headers)}
-        
-        header_map: dict[str, str] = {h: headers_out[i] for i, h in enumerate(raw_headers)}
-        
-        # Process in chunks
-        all_cleaned_rows: list[list[str]] = []
-        seen_rows: set[tuple[str, ...]] = set()
-        
-        total_chunks = (len(data_rows) + chunk_size - 1) // chunk_size
-        
-        for chunk_idx in range(total_chunks):
-            start_idx = chunk_idx * chunk_size
-            end_idx = min(start_idx + chunk_size, len(data_rows))
-            chunk = data_rows[start_idx:end_idx]
-            
-            # Process chunk
-            for r in chunk:
-                rr = self._reconcile_row_length(list(r), len(raw_headers), delimiter, fixes)
-                rr2 = [self._norm_cell(c, fixes) for c in rr]
-                
-                if drop_empty_rows and all(c == "" for c in rr2):
-                    fixes["dropped_empty_rows"] += 1
-                    continue
-                
-                if self._is_irrelevant_row(rr2, len(headers_out)):
-                    fixes["irrelevant_rows_removed"] += 1
-                    continue
-                
-                # Check for duplicates
-                row_tuple = tuple(c.strip().lower() if c else "" for c in rr2)
-                if row_tuple not in seen_rows:
-                    seen_rows.add(row_tuple)
-                    all_cleaned_rows.append(rr2)
-                else:
-                    fixes["duplicates_removed"] += 1
+        headers_out, crm_type, field_mappings, header_map = self._map_headers(
+            raw_headers, normalize_headers, apply_crm_mappings, fixes
+        )
         
-        # Generate outputs
-        cleaned_csv = self._rows_to_csv([headers_out] + all_cleaned_rows, delimiter)
+        memory_metric = self._stage_memory_metric()
         report = DataCleanReport(
-            rows_in=len(data_rows),
-            rows_out=len(all_cleaned_rows),
+            rows_in=0,
+            rows_out=0,
             columns_in=len(raw_headers),
             columns_out=len(headers_out),
             header_map=header_map,
             fixes=fixes,
             started_at=started,
-            finished_at=utc_now_iso(),
+            finished_at=started,
             file_type=detected_type,
             crm_detected=crm_type,
             field_mappings=field_mappings,
-            duplicates_removed=fixes.get("duplicates_removed", 0),
-            irrelevant_rows_removed=fixes.get("irrelevant_rows_removed", 0),
+            stage_timings=dict.fromkeys(PIPELINE_STAGES, 0.0),
+            stage_metrics={stage: StageMetrics() for stage in PIPELINE_STAGES},
+            memory_metric=memory_metric,
         )
+        meter = _StageMeter.for_report(report)
+        rule_hits = report.irrelevant_rows_by_rule
+        row_filter = RowFilter(self.filter_rules, headers_out)
         
-        # For very large files, optimize export generation
-        export_formats = export_formats or ['csv', 'json', 'excel', 'columns']
-        num_rows = len(all_cleaned_rows)
-        
-        # For files with 50k+ rows, limit exports to prevent memory issues
-        # But always keep 'columns' in the list - we'll generate CSV-only column files
-        if num_rows > 50000:
-            # Only generate CSV and skip memory-intensive formats unless explicitly requested
-            safe_formats = ['csv']
-            if 'json' in export_formats and num_rows <= 100000:
-                safe_formats.append('json')
-            # Excel is too memory-intensive for very large files
-            if 'excel' in export_formats and num_rows <= 50000:
-                safe_formats.append('excel')
-            # Always include 'columns' - we'll generate CSV-only column files for large files
-            if 'columns' in export_formats:
-                safe_formats.append('columns')
+        rows_iter = iter(data_rows)
+        
+        def read_chunk() -> list[list[str]]:
+            with meter.measure("parse") as parsed:
+                chunk = list(itertools.islice(rows_iter, chunk_size))
+                parsed.rows_in = parsed.rows_out = len(chunk)
+            return chunk
+        
+        def cleaned_chunks() -> t.Iterator[
+            tuple[int, list[list[str]], dict[str, int], dict[str, StageMetrics], dict[str, int]]
+        ]:
+            """Yield (rows_in, cleaned_rows, chunk_fixes, chunk_metrics, chunk_rule_hits) per chunk, in input order"""
+            nonlocal schema
+            raw_chunks = iter(read_chunk, [])
+            
+            # The first chunk doubles as the schema-inference sample
+            first_chunk = next(raw_chunks, [])
+            if schema is None and infer_types:
+                schema = self.infer_column_types(
+                    headers_out, self._schema_sample(first_chunk, len(raw_headers), delimiter)
+                )
+            if schema is not None:
+                report.column_types = self._schema_column_types(schema)
+                report.date_conventions = self._schema_date_conventions(schema)
+            raw_chunks = itertools.chain([first_chunk] if first_chunk else [], raw_chunks)
+            
+            def split(chunk: list[list[str]]) -> tuple[list[list[str]], t.Any]:
+                return reuse.split(chunk) if reuse is not None else (chunk, None)
+            
+            if workers == 1:
+                normalizers = self._make_column_normalizers(schema, len(raw_headers))
+                for chunk in raw_chunks:
+                    chunk_fixes = dict.fromkeys(fixes, 0)
+                    chunk_metrics: dict[str, StageMetrics] = {}
+                    chunk_rule_hits: dict[str, int] = collections.defaultdict(int)
+                    fresh, plan = split(chunk)
+                    kept: list[int] | None = [] if reuse is not None else None
+                    cleaned = self._clean_chunk(
+                        fresh, len(raw_headers), row_filter, delimiter, drop_empty_rows, chunk_fixes,
+                        normalizers, _StageMeter(chunk_metrics, memory_metric), chunk_rule_hits, kept,
+                    )
+                    if reuse is not None:
+                        cleaned = reuse.merge(plan, cleaned, kept)
+                    yield len(chunk), cleaned, chunk_fixes, chunk_metrics, chunk_rule_hits
+                return
+            
+            def finish(n: int, plan: t.Any, done: concurrent.futures.Future) -> tuple[
+                int, list[list[str]], dict[str, int], dict[str, StageMetrics], dict[str, int]
+            ]:
+                cleaned, chunk_fixes, chunk_metrics, chunk_rule_hits, kept = done.result()
+                if reuse is not None:
+                    cleaned = reuse.merge(plan, cleaned, kept)
+                return n, cleaned, chunk_fixes, chunk_metrics, chunk_rule_hits
+            
+            max_workers = workers or os.cpu_count() or 1
+            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as pool:
+                # Keep a bounded window of chunks in flight so memory doesn't grow with file size
+                pending: collections.deque[tuple[int, t.Any, concurrent.futures.Future]] = collections.deque()
+                for chunk in raw_chunks:
+                    fresh, plan = split(chunk)
+                    future = pool.submit(
+                        _clean_chunk_worker, fresh, len(raw_headers), row_filter, delimiter,
+                        drop_empty_rows, schema, self.backend, self.memory_metric, reuse is not None,
+                    )
+                    pending.append((len(chunk), plan, future))
+                    if len(pending) >= max_workers * 2:
+                        yield finish(*pending.popleft())
+                while pending:
+                    yield finish(*pending.popleft())
+        
+        def chunks() -> t.Iterator[list[list[str]]]:
+            # Dedup and profiling run here, in input order, so results are the same for any worker count
+            profiler = None
+            with self._new_dedup_index() as seen_rows:
+                for rows_in, chunk, chunk_fixes, chunk_metrics, chunk_rule_hits in cleaned_chunks():
+                    report.rows_in += rows_in
+                    for key, count in chunk_fixes.items():
+                        fixes[key] = fixes.get(key, 0) + count
+                    for stage, sample in chunk_metrics.items():
+                        meter.add(stage, sample)
+                    for name, count in chunk_rule_hits.items():
+                        rule_hits[name] = rule_hits.get(name, 0) + count
+                    
+                    with meter.measure("dedup", len(chunk)) as deduped:
+                        add_row = seen_rows.add_row
+                        cleaned = [rr2 for rr2 in chunk if add_row(rr2)]
+                        deduped.rows_out = len(cleaned)
+                    fixes["duplicates_removed"] += len(chunk) - len(cleaned)
+                    
+                    with meter.measure("profile", len(cleaned)):
+                        if profiler is None:
+                            profiler = _ColumnProfiler(headers_out, report.column_types)
+                        profiler.add(cleaned)
+                    
+                    report.rows_out += len(cleaned)
+                    report.duplicates_removed = fixes["duplicates_removed"]
+                    report.irrelevant_rows_removed = fixes["irrelevant_rows_removed"]
+                    report.finished_at = utc_now_iso()
+                    if progress is not None:
+                        progress("clean", report)
+                    if cleaned:
+                        with meter.measure("sink", len(cleaned)):
+                            yield cleaned
+            with meter.measure("profile"):
+                profiler = profiler or _ColumnProfiler(headers_out, report.column_types)
+                report.column_profiles = profiler.profiles()
+            report.finished_at = utc_now_iso()
+        
+        return headers_out, chunks(), report
+    
+    def _clean_to_table(
+        self,
+        data_rows: t.Iterable[list[str]],
+        raw_headers: list[str],
+        detected_type: str,
+        delimiter: str,
+        normalize_headers: bool,
+        drop_empty_rows: bool,
+        *,
+        apply_crm_mappings: bool,
+        started: str,
+        chunk_size: int = 10000,
+        workers: int | None = 1,
+        infer_types: bool = True,
+        near_duplicates: str = "off",
+        progress: ProgressCallback | None = None,
+    ) -> tuple[list[str], ColumnarTable, DataCleanReport]:
+        """Run a compiled job into a columnar table, then the optional near-duplicate pass"""
+        headers_out, chunks, report = self._open_clean_job(
+            data_rows, raw_headers, detected_type, delimiter, normalize_headers,
+            drop_empty_rows, apply_crm_mappings, started, chunk_size, workers, infer_types, progress
+        )
+        table = ColumnarTable(headers_out)
+        for chunk in chunks:
+            table.extend(chunk)
+        
+        if progress is not None and near_duplicates != "off":
+            progress("near_duplicates", report)
+        with _StageMeter.for_report(report).measure("dedup"):
+            clusters, merged = self._near_duplicate_pass(table, headers_out, report.column_types, near_duplicates)
+            report.near_duplicate_clusters = clusters
+            if merged is not None:
+                rows_before = len(table)
+                table = ColumnarTable.from_rows(headers_out, merged)
+                report.near_duplicates_merged = rows_before - len(table)
+                report.rows_out = len(table)
+        if merged is not None:
+            # Merging rewrote rows after the streaming pass profiled them
+            with _StageMeter.for_report(report).measure("profile", len(table)):
+                profiler = _ColumnProfiler(headers_out, report.column_types)
+                rows_iter = iter(table)
+                for chunk in iter(lambda: list(itertools.islice(rows_iter, chunk_size)), []):
+                    profiler.add(chunk)
+                report.column_profiles = profiler.profiles()
+        return headers_out, table, report
+    
+    def _timed_csv(
+        self, headers: list[str], rows: ColumnarTable, delimiter: str, report: DataCleanReport
+    ) -> str:
+        """Render cleaned rows as CSV text, counted as sink time"""
+        with _StageMeter.for_report(report).measure("sink"):
+            return self._rows_to_csv(itertools.chain([headers], rows), delimiter)
+    
+    def find_near_duplicates(
+        self,
+        rows: list[list[str]],
+        columns: list[int] | None = None,
+        *,
+        threshold: float = NEAR_DUP_THRESHOLD,
+    ) -> list[list[int]]:
+        """
+        Find clusters of near-duplicate rows (e.g. "Jon Smith / ACME Inc." vs
+        "John Smith / Acme, Inc") in roughly linear time.
+        Rows are shingled into character 3-grams of their `columns` (default: all),
+        summarized with MinHash signatures and bucketed by LSH bands;
+        only rows sharing a band are compared. Returns clusters of row indexes, each
+        sorted, ordered by their first row.
+        """
+        bins = NEAR_DUP_NUM_PERM
+        rows_per_band = bins // NEAR_DUP_BANDS
+        shingle_cache: dict[str, array.array] = {}
+        # Names, companies and cities repeat a lot; memoize whole-cell signatures
+        cell_signature = functools.lru_cache(maxsize=NEAR_DUP_CELL_CACHE_SIZE)(
+            functools.partial(self._cell_minhash, shingle_cache=shingle_cache)
+        )
+        
+        signatures = array.array("I")
+        indexes: list[int] = []
+        for idx, row in enumerate(rows):
+            sig = self._minhash_signature(row, columns, cell_signature)
+            if sig is not None:
+                signatures.extend(sig)
+                indexes.append(idx)
+        
+        n = len(indexes)
+        parent = array.array("I", range(n))
+        
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        min_same = threshold * bins
+        
+        def similar(i: int, j: int) -> bool:
+            a, b = i * bins, j * bins
+            return sum(map(operator.eq, signatures[a : a + bins], signatures[b : b + bins])) >= min_same
+        
+        for band in range(NEAR_DUP_BANDS):
+            lo = band * rows_per_band
+            keys = array.array("q", (
+                hash(signatures[i * bins + lo : i * bins + lo + rows_per_band].tobytes()) for i in range(n)
+            ))
+            order = sorted(range(n), key=keys.__getitem__)
+            # Walk runs of equal band keys; compare each member to the run's anchor
+            # and to its predecessor so large buckets stay linear
+            start = 0
+            for pos in range(1, n + 1):
+                if pos < n and keys[order[pos]] == keys[order[start]]:
+                    continue
+                anchor = order[start]
+                for k in range(start + 1, pos):
+                    i = order[k]
+                    for j in (anchor, order[k - 1]):
+                        if find(i) != find(j) and similar(i, j):
+                            parent[find(i)] = find(j)
+                start = pos
+        
+        groups: dict[int, list[int]] = {}
+        for i in range(n):
+            groups.setdefault(find(i), []).append(indexes[i])
+        clusters = [sorted(g) for g in groups.values() if len(g) > 1]
+        clusters.sort(key=lambda g: g[0])
+        return clusters
+    
+    def merge_near_duplicates(
+        self, rows: ColumnarTable | t.Sequence[list[str]], clusters: list[list[int]]
+    ) -> t.Iterator[list[str]]:
+        """
+        Collapse each cluster into its first row, filling that row's empty cells from
+        the other members in order. Yields the merged rows in original order; only
+        cluster members are looked up by index, so `rows` is never copied as a whole.
+        """
+        drop: set[int] = set()
+        heads: dict[int, list[str]] = {}
+        for cluster in clusters:
+            keep = list(rows[cluster[0]])
+            for idx in cluster[1:]:
+                for col, val in enumerate(rows[idx]):
+                    if col < len(keep) and not keep[col] and val:
+                        keep[col] = val
+                drop.add(idx)
+            heads[cluster[0]] = keep
+        for idx, row in enumerate(rows):
+            if idx not in drop:
+                yield heads.get(idx, row)
+    
+    def _near_duplicate_pass(
+        self,
+        rows: ColumnarTable | list[list[str]],
+        headers: list[str],
+        column_types: dict[str, str],
+        mode: str,
+    ) -> tuple[list[list[int]], t.Iterator[list[str]] | None]:
+        """Run near-duplicate detection per `mode`; returns (clusters, merged rows or None)"""
+        if mode not in ("off", "report", "merge"):
+            raise ServiceError(f"Unknown near_duplicates mode: {mode!r} (use 'off', 'report' or 'merge')")
+        if mode == "off" or len(rows) < 2:
+            return [], None
+        # Dates, amounts and contact channels are often missing or different between copies
+        # of the same contact; compare the free-text identity columns (names, company, ...)
+        columns = [
+            i for i, h in enumerate(headers)
+            if column_types.get(h) not in ("date", "numeric", "email", "phone")
+        ] or None
+        clusters = self.find_near_duplicates(rows, columns)
+        if mode == "merge" and clusters:
+            return clusters, self.merge_near_duplicates(rows, clusters)
+        return clusters, None
+    
+    def _minhash_signature(
+        self,
+        row: list[str],
+        columns: list[int] | None,
+        cell_signature: t.Callable[[int, str], tuple[int, ...] | None],
+    ) -> list[int] | None:
+        """MinHash signature of a row: element-wise min of its cells' signatures (None if no text)"""
+        cells = []
+        for col in range(len(row)) if columns is None else columns:
+            if col < len(row) and row[col]:
+                sig = cell_signature(col, row[col])
+                if sig is not None:
+                    cells.append(sig)
+        if not cells:
+            return None
+        return list(map(min, *cells)) if len(cells) > 1 else list(cells[0])
+    
+    def _cell_minhash(
+        self, col: int, value: str, shingle_cache: dict[str, array.array]
+    ) -> tuple[int, ...] | None:
+        """MinHash of one cell's character 3-gram shingles, tagged with the column index"""
+        tokens = [
+            tok for tok in _NEAR_DUP_TOKEN_RE.split(value.lower())
+            if tok and tok not in _NEAR_DUP_STOP_TOKENS
+        ]
+        if not tokens:
+            return None
+        text = f" {' '.join(tokens)} "
+        hashed: list[array.array] = []
+        for k in range(len(text) - 2):
+            shingle = f"{col}:{text[k:k + 3]}"
+            values = shingle_cache.get(shingle)
+            if values is None:
+                # Permuted hashes are computed once per distinct shingle, then reused
+                h = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "little")
+                values = array.array(
+                    "I", [((a * h + b) % _MINHASH_PRIME) & 0xFFFFFFFF for a, b in _MINHASH_PARAMS]
+                )
+                shingle_cache[shingle] = values
+            hashed.append(values)
+        return tuple(map(min, *hashed)) if len(hashed) > 1 else tuple(hashed[0])
+    
+    def _new_dedup_index(self) -> RowDigestIndex:
+        return RowDigestIndex(self.dedup_memory_limit, self.spill_dir)
+    
+    def _clean_chunk(
+        self,
+        chunk: list[list[str]],
+        target_cols: int,
+        row_filter: RowFilter,
+        delimiter: str,
+        drop_empty_rows: bool,
+        fixes: dict[str, int],
+        normalizers: list[t.Callable[[str, dict[str, int]], str]] | None = None,
+        meter: _StageMeter | None = None,
+        rule_hits: dict[str, int] | None = None,
+        kept: list[int] | None = None,
+    ) -> list[list[str]]:
+        """
+        Reconcile, normalize and filter one chunk of rows (dedup is done by the caller).
+        Each stage is one pass over the whole chunk, measured by `meter`, and irrelevant
+        rows are counted per matching rule in `rule_hits`. With `kept`, the chunk
+        positions of the returned rows are appended to it.
+        """
+        if normalizers is None:
+            normalizers = self._make_column_normalizers(None, target_cols)
+        if rule_hits is None:
+            rule_hits = collections.defaultdict(int)
+        if meter is None:
+            meter = _StageMeter({})
+        reconcile = self._reconcile_row_length
+        
+        with meter.measure("reconcile", len(chunk)):
+            rows = [
+                r if len(r) == target_cols else reconcile(list(r), target_cols, delimiter, fixes)
+                for r in chunk
+            ]
+        
+        if self.vectorized and target_cols and rows:
+            with meter.measure("normalize", len(rows)):
+                table = self._normalize_columns(rows, normalizers, fixes)
+            with meter.measure("filter", len(rows)) as filtered:
+                cleaned = self._filter_columns(table, row_filter, drop_empty_rows, fixes, rule_hits, kept)
+                filtered.rows_out = len(cleaned)
+        else:
+            with meter.measure("normalize", len(rows)):
+                rows = [[norm(c, fixes) for norm, c in zip(normalizers, r)] for r in rows]
+            with meter.measure("filter", len(rows)) as filtered:
+                cleaned = self._filter_rows(rows, row_filter, drop_empty_rows, fixes, rule_hits, kept)
+                filtered.rows_out = len(cleaned)
+        return cleaned
+    
+    def _filter_rows(
+        self,
+        rows: t.Iterable[list[str]],
+        row_filter: RowFilter,
+        drop_empty_rows: bool,
+        fixes: dict[str, int],
+        rule_hits: dict[str, int],
+        kept: list[int] | None = None,
+    ) -> list[list[str]]:
+        """Filter stage: drop empty rows, then rows `row_filter` deems irrelevant (positions of the rest go to `kept`)"""
+        match = row_filter.match
+        cleaned: list[list[str]] = []
+        for i, rr2 in enumerate(rows):
+            # Drop completely empty rows
+            if drop_empty_rows and not any(rr2):
+                fixes["dropped_empty_rows"] += 1
+                continue
+            
+            # Filter irrelevant rows (rows with too many empty cells or test data)
+            rule = match(rr2)
+            if rule is not None:
+                fixes["irrelevant_rows_removed"] += 1
+                rule_hits[rule] += 1
+                continue
             
-            export_formats = safe_formats
+            cleaned.append(rr2)
+            if kept is not None:
+                kept.append(i)
+        return cleaned
+    
+    def _normalize_columns(
+        self,
+        rows: list[list[str]],
+        normalizers: list[t.Callable[[str, dict[str, int]], str]],
+        fixes: dict[str, int],
+    ) -> t.Any:
+        """
+        Vectorized normalize stage: factorize each column, run its normalizer once per
+        distinct value, and broadcast the results (and fix counts) back to every cell.
+        Returns the normalized chunk as a 2-D object array.
+        """
+        np, _ = _vector_modules()
+        table = np.empty((len(rows), len(normalizers)), dtype=object)
+        table[:] = rows
+        scratch: dict[str, int] = collections.defaultdict(int)
+        for j, norm in enumerate(normalizers):
+            codes, uniques = self._factorize(table[:, j])
+            counts = np.bincount(codes, minlength=len(uniques))
+            values = np.empty(len(uniques), dtype=object)
+            for i, value in enumerate(uniques):
+                values[i] = norm(value, scratch)
+                if scratch:
+                    n = int(counts[i])
+                    for key, count in scratch.items():
+                        fixes[key] += count * n
+                    scratch.clear()
+            table[:, j] = values[codes]
+        return table
+    
+    def _factorize(self, column: t.Any) -> tuple[t.Any, list[t.Any]]:
+        """(codes, uniques) of an object array; uniques keep their original Python values"""
+        np, pd = _vector_modules()
+        if pd is not None:
+            all_str = pd.api.types.infer_dtype(column, skipna=False) in ("string", "empty")
+        else:
+            all_str = all(type(v) is str for v in column)
+        if all_str:
+            if pd is not None:
+                codes, uniques = pd.factorize(column)
+            else:
+                uniques, codes = np.unique(column, return_inverse=True)
+            return codes, list(uniques)
+        
+        # None/int/float cells (rows handed in directly rather than parsed) are keyed by
+        # type too, so 1, 1.0 and "1" keep their distinct str() forms
+        index: dict[tuple[type, t.Any], int] = {}
+        codes = np.fromiter(
+            (index.setdefault((type(v), v), len(index)) for v in column), dtype=np.intp, count=len(column)
+        )
+        return codes, [v for _, v in index]
+    
+    def _filter_columns(
+        self,
+        table: t.Any,
+        row_filter: RowFilter,
+        drop_empty_rows: bool,
+        fixes: dict[str, int],
+        rule_hits: dict[str, int],
+        kept: list[int] | None = None,
+    ) -> list[list[str]]:
+        """
+        Vectorized filter stage over a normalized chunk: empty and mostly-empty rows are
+        masked out column-wise; only the rest are matched against the filter rules.
+        Positions of the rows kept go to `kept`, as in _filter_rows.
+        """
+        np, _ = _vector_modules()
+        # Normalized cells are already trimmed, so non-empty means != ""
+        non_empty = (table != "").sum(axis=1)
+        keep = np.ones(len(table), dtype=bool)
+        if drop_empty_rows:
+            empty = non_empty == 0
+            fixes["dropped_empty_rows"] += int(empty.sum())
+            keep &= ~empty
+        sparse = (non_empty == 0) | row_filter.is_sparse(non_empty)
+        sparse_count = int((keep & sparse).sum())
+        if sparse_count:
+            fixes["irrelevant_rows_removed"] += sparse_count
+            rule_hits[RowFilter.MOSTLY_EMPTY] += sparse_count
+        keep &= ~sparse
+        if kept is None:
+            return self._filter_rows(table[keep].tolist(), row_filter, False, fixes, rule_hits)
+        matched: list[int] = []
+        cleaned = self._filter_rows(table[keep].tolist(), row_filter, False, fixes, rule_hits, matched)
+        kept.extend(np.flatnonzero(keep)[matched].tolist())
+        return cleaned
+    
+    def _process_large_file_chunked(
+        self,
+        data_rows: t.Iterable[list[str]],
+        raw_headers: list[str],
+        detected_type: str,
+        delimiter: str,
+        normalize_headers: bool,
+        drop_empty_rows: bool,
+        apply_crm_mappings: bool,
+        started: str,
+        chunk_size: int = 10000,
+        export_formats: list[str] | None = None,
+        workers: int | None = 1,
+        infer_types: bool = True,
+        near_duplicates: str = "off",
+        result_path: str | os.PathLike[str] | None = None,
+        progress: ProgressCallback | None = None,
+        output_dir: str | os.PathLike[str] | None = None,
+    ) -> tuple[dict[str, t.Any], DataCleanReport]:
+        """
+        Process (possibly very large) row streams in chunks to avoid memory issues.
+        With `workers` != 1 chunks are cleaned in a process pool; output order and
+        dedup results are identical to the serial path. With an `output_dir` the outputs
+        are written there by _write_master_files.
+        """
+        export_formats = export_formats or ['csv', 'json', 'excel', 'columns']
+        if output_dir is not None:
+            targets = {
+                name: os.path.join(output_dir, file_name)
+                for name, (export_format, file_name) in MASTER_OUTPUT_FILES.items()
+                if export_format in export_formats
+            }
+            if near_duplicates == "off":
+                # Nothing needs the whole table: chunks go from the pipeline straight to the files
+                headers_out, chunks, report = self._open_clean_job(
+                    data_rows, raw_headers, detected_type, delimiter, normalize_headers, drop_empty_rows,
+                    apply_crm_mappings, started, chunk_size, workers, infer_types, progress,
+                )
+                outputs = self._write_master_files(headers_out, chunks, targets, result_path, delimiter, report)
+                if progress is not None:
+                    progress("export", report)
+            else:
+                headers_out, table, report = self._clean_to_table(
+                    data_rows, raw_headers, detected_type, delimiter, normalize_headers, drop_empty_rows,
+                    apply_crm_mappings=apply_crm_mappings, started=started, chunk_size=chunk_size,
+                    workers=workers, infer_types=infer_types, near_duplicates=near_duplicates, progress=progress,
+                )
+                if progress is not None:
+                    progress("export", report)
+                outputs = self._write_master_files(
+                    headers_out, [table], targets, result_path, delimiter, report, measure_writes=True
+                )
+            outputs["column_manifest"] = self.column_file_manifest(headers_out, export_formats)
+            return outputs, report
         
-        outputs = self._generate_multiple_outputs_optimized(
-            cleaned_csv, raw_headers, detected_type, report, all_cleaned_rows, headers_out, export_formats, num_rows
+        headers_out, all_cleaned_rows, report = self._clean_to_table(
+            data_rows, raw_headers, detected_type, delimiter, normalize_headers, drop_empty_rows,
+            apply_crm_mappings=apply_crm_mappings, started=started, chunk_size=chunk_size,
+            workers=workers, infer_types=infer_types, near_duplicates=near_duplicates, progress=progress,
         )
         
+        if progress is not None:
+            progress("export", report)
+        with _StageMeter.for_report(report).measure("sink"):
+            # Store the cleaned result for on-demand column files
+            if result_path is not None:
+                self.export_rows(all_cleaned_rows, headers_out, "csv", result_path)
+            
+            # Generate outputs
+            cleaned_csv = self._rows_to_csv(itertools.chain([headers_out], all_cleaned_rows), delimiter)
+            num_rows = len(all_cleaned_rows)
+            
+            # Small inputs get every requested format
+            if report.rows_in <= chunk_size:
+                outputs = self._generate_multiple_outputs(
+                    cleaned_csv, raw_headers, detected_type, report, all_cleaned_rows, headers_out, export_formats
+                )
+            else:
+                outputs = self._generate_multiple_outputs_optimized(
+                    cleaned_csv, raw_headers, detected_type, report, all_cleaned_rows, headers_out, export_formats,
+                    num_rows,
+                )
         return outputs, report
     
+    def _write_master_files(
+        self,
+        headers: list[str],
+        chunks: t.Iterable[t.Iterable[list[str]]],
+        targets: dict[str, str],
+        result_path: str | os.PathLike[str] | None,
+        delimiter: str,
+        report: DataCleanReport,
+        measure_writes: bool = False,
+    ) -> dict[str, t.Any]:
+        """
+        Stream cleaned row chunks into the master output files `targets` (output name -> path)
+        and, with a `result_path`, the CSV column files are rendered from; a comma-delimited
+        master CSV is written only to `result_path`, which stands in for its target. Returns
+        outputs naming the files written ("files") and the head of the CSV ("csv_preview").
+        Writes count as sink time with `measure_writes`; chunks from _open_clean_job are
+        already timed by the job.
+        """
+        meter = _StageMeter.for_report(report)
+        outputs: dict[str, t.Any] = {}
+        files: dict[str, str] = {}
+        if result_path is not None and delimiter == "," and "master_cleanse_csv" in targets:
+            targets = {**targets, "master_cleanse_csv": os.fspath(result_path)}
+            result_path = None
+        with contextlib.ExitStack() as stack:
+            sinks: list[RowSink] = []
+            for name, path in targets.items():
+                export_format = MASTER_OUTPUT_FILES[name][0]
+                try:
+                    sinks.append(stack.enter_context(open_sink(export_format, path, headers, delimiter=delimiter)))
+                except ServiceError as e:
+                    # Excel export without openpyxl; the other formats still go out
+                    outputs[f"_{export_format}_error"] = str(e)
+                    continue
+                files[name] = path
+            if result_path is not None:
+                sinks.append(stack.enter_context(CsvSink(result_path, headers)))
+            for chunk in chunks:
+                with meter.measure("sink") if measure_writes else contextlib.nullcontext():
+                    for sink in sinks:
+                        sink.write_rows(chunk)
+            # Closing writes trailers (and the whole XLSX archive)
+            with meter.measure("sink"):
+                for sink in sinks:
+                    sink.close()
+        outputs["files"] = files
+        outputs["csv_preview"] = None
+        if "master_cleanse_csv" in files:
+            with open(files["master_cleanse_csv"], encoding="utf-8", newline="") as f:
+                outputs["csv_preview"] = f.read(CSV_PREVIEW_CHARS)
+        return outputs
+    
     def _generate_multiple_outputs_optimized(
         self,
         cleaned_csv: str,
         raw_headers: list[str],
         original_file_type: str,
         report: DataCleanReport,
-        cleaned_rows: list[list[str]] | None = None,
+        cleaned_rows: ColumnarTable | list[list[str]] | None = None,
         headers_out: list[str] | None = None,
         export_formats: list[str] | None = None,
         num_rows: int = 0,
@@ -866,42 +3882,33 @@ class ApexDataCleanEngine:
         if 'csv' in export_formats:
             outputs["master_cleanse_csv"] = cleaned_csv
         
-        # Generate JSON output (memory-intensive for large files)
+        # Generate JSON output (JsonSink layout for large files), up to the in-memory cap
         if 'json' in export_formats:
-            if num_rows <= 100000:
-                json_output = self._rows_to_json(cleaned_rows, headers_out)
-                outputs["master_cleanse_json"] = json_output
+            if num_rows <= IN_MEMORY_JSON_MAX_ROWS:
+                outputs["master_cleanse_json"] = self._rows_to_json(cleaned_rows, headers_out)
             else:
-                # For very large files, skip JSON or provide a note
-                outputs["master_cleanse_json"] = None
-                outputs["_json_skipped"] = f"JSON export skipped for files with {num_rows:,} rows to prevent memory issues"
+                outputs["_json_skipped"] = (
+                    f"JSON export skipped for files with {num_rows:,} rows to prevent memory issues; "
+                    "clean with an output_dir to stream it to disk"
+                )
         
-        # Generate Excel output (memory-intensive for large files)
+        # Generate Excel output (write-only workbook for large files), up to the in-memory cap
         if 'excel' in export_formats:
-            if num_rows <= 50000:
+            if num_rows > IN_MEMORY_EXCEL_MAX_ROWS:
+                outputs["_excel_skipped"] = (
+                    f"Excel export skipped for files with {num_rows:,} rows to prevent memory issues; "
+                    "clean with an output_dir to stream it to disk"
+                )
+            else:
                 try:
-                    excel_output = self._rows_to_excel(cleaned_rows, headers_out)
-                    outputs["master_cleanse_excel"] = excel_output
+                    outputs["master_cleanse_excel"] = self._rows_to_excel(cleaned_rows, headers_out)
                 except Exception as e:
                     outputs["master_cleanse_excel"] = None
                     outputs["_excel_error"] = str(e)
-            else:
-                outputs["master_cleanse_excel"] = None
-                outputs["_excel_skipped"] = f"Excel export skipped for files with {num_rows:,} rows to prevent memory issues"
         
-        # Generate column-based files (always generate, but limit formats for large files)
+        # Column-based files are rendered lazily; only describe them here
         if 'columns' in export_formats:
-            # For large files, only generate CSV column files to save memory
-            # For smaller files, generate all requested formats
-            if num_rows > 50000:
-                # Large files: CSV-only column files
-                column_files = self._generate_column_based_files(cleaned_rows, headers_out, original_file_type, ['csv'])
-                outputs["column_files"] = column_files
-                outputs["_columns_note"] = f"Column files limited to CSV format for files with {num_rows:,} rows"
-            else:
-                # Smaller files: generate all requested formats
-                column_files = self._generate_column_based_files(cleaned_rows, headers_out, original_file_type, export_formats)
-                outputs["column_files"] = column_files
+            outputs["column_manifest"] = self.column_file_manifest(headers_out, export_formats)
         
         return outputs
     
@@ -911,7 +3918,7 @@ class ApexDataCleanEngine:
         raw_headers: list[str],
         original_file_type: str,
         report: DataCleanReport,
-        cleaned_rows: list[list[str]] | None = None,
+        cleaned_rows: ColumnarTable | list[list[str]] | None = None,
         headers_out: list[str] | None = None,
         export_formats: list[str] | None = None,
     ) -> dict[str, t.Any]:
@@ -947,14 +3954,14 @@ class ApexDataCleanEngine:
                 # Excel generation failed, skip it
                 pass
         
-        # Always generate column-based files (one per column) - this is a core feature
-        # Column files help ensure no accidental deletions during data verification
-        column_files = self._generate_column_based_files(cleaned_rows, headers_out, original_file_type, export_formats)
-        outputs["column_files"] = column_files
+        # Always describe column-based files (one per column) - this is a core feature
+        # Column files help ensure no accidental deletions during data verification;
+        # they are rendered on demand from the stored result (see render_column_file)
+        outputs["column_manifest"] = self.column_file_manifest(headers_out, export_formats)
         
         return outputs
     
-    def _rows_to_json(self, rows: list[list[str]], headers: list[str]) -> str:
+    def _rows_to_json(self, rows: ColumnarTable | list[list[str]], headers: list[str]) -> str:
         """Convert rows to JSON format - optimized for large files"""
         # For very large files, use streaming JSON generation
         if len(rows) > 50000:
@@ -968,107 +3975,147 @@ class ApexDataCleanEngine:
             data.append(obj)
         return json.dumps(data, indent=2, ensure_ascii=False)
     
-    def _rows_to_json_streaming(self, rows: list[list[str]], headers: list[str]) -> str:
-        """Stream JSON generation for very large files to reduce memory usage"""
+    def _rows_to_json_streaming(self, rows: ColumnarTable | list[list[str]], headers: list[str]) -> str:
+        """Compact one-object-per-line JSON for very large files (see JsonSink)"""
         output = io.StringIO()
-        output.write('[\n')
-        
-        for idx, row in enumerate(rows):
-            if idx > 0:
-                output.write(',\n')
-            obj = {}
-            for i, header in enumerate(headers):
-                obj[header] = row[i] if i < len(row) else ""
-            json.dump(obj, output, ensure_ascii=False)
-        
-        output.write('\n]')
+        self.export_rows(rows, headers, "json", output)
         return output.getvalue()
     
-    def _rows_to_excel(self, rows: list[list[str]], headers: list[str]) -> bytes:
+    def _rows_to_excel(self, rows: ColumnarTable | list[list[str]], headers: list[str]) -> bytes:
         """Convert rows to Excel format - optimized for large files"""
         try:
             from openpyxl import Workbook
         except ImportError:
             raise ServiceError("Excel export requires 'openpyxl'. Install with: pip install openpyxl")
         
-        # Use write-only mode for large files to reduce memory usage
         output = io.BytesIO()
         
         if len(rows) > 10000:
-            # Use write-only workbook for large files
-            wb = Workbook(write_only=True)
-            ws = wb.create_sheet("Cleaned Data")
-            
-            # Write headers
-            ws.append(headers)
-            
-            # Write rows in chunks
-            for row in rows:
-                ws.append(row)
-        else:
-            # Use regular workbook for smaller files
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Cleaned Data"
-            
-            # Write headers
-            ws.append(headers)
-            
-            # Write rows
-            for row in rows:
-                ws.append(row)
+            # Write-only workbook for large files (rolls over to a new sheet past Excel's row limit)
+            self.export_rows(rows, headers, "excel", output)
+            return output.getvalue()
+        
+        # Use regular workbook for smaller files
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Cleaned Data"
+        
+        # Write headers
+        ws.append(headers)
+        
+        # Write rows
+        for row in rows:
+            ws.append(row)
         
         # Save to bytes
         wb.save(output)
         output.seek(0)
         return output.getvalue()
     
-    def _generate_column_based_files(
+    def column_file_manifest(
+        self, headers: list[str], export_formats: t.Iterable[str] | None = None
+    ) -> dict[str, t.Any]:
+        """
+        Describe the one-file-per-column downloads for a cleaned result without rendering them.
+        `export_formats` is filtered to the column formats (csv, json, excel); CSV is the fallback.
+        """
+        formats = [f for f in (export_formats or COLUMN_FILE_FORMATS) if f in COLUMN_FILE_FORMATS] or ["csv"]
+        return {
+            "formats": formats,
+            "columns": [
+                {
+                    "index": idx,
+                    "name": header,
+                    "files": {fmt: column_file_name(idx, header, fmt) for fmt in formats},
+                }
+                for idx, header in enumerate(headers)
+            ],
+        }
+    
+    def render_column_file(
         self,
-        rows: list[list[str]],
-        headers: list[str],
-        original_file_type: str,
-        export_formats: list[str] | None = None,
-    ) -> dict[str, dict[str, str | bytes]]:
-        """Generate one file per column to ensure no accidental deletions - optimized for large files"""
-        export_formats = export_formats or ['csv', 'json', 'excel']
-        column_files: dict[str, dict[str, str | bytes]] = {}
-        
-        num_rows = len(rows)
-        
-        # For very large files, only generate CSV column files to save memory
-        if num_rows > 50000:
-            export_formats = ['csv']
-        
-        for col_idx, header in enumerate(headers):
-            # Extract column data efficiently
-            column_data = [row[col_idx] if col_idx < len(row) else "" for row in rows]
-            column_files[header] = {}
-            
-            # Create CSV file for this column (always available)
-            if 'csv' in export_formats:
-                csv_rows = [[header]] + [[val] for val in column_data]
-                csv_content = self._rows_to_csv(csv_rows, ",")
-                column_files[header]["csv"] = csv_content
-            
-            # Create JSON file for this column (only for smaller files)
-            if 'json' in export_formats and num_rows <= 25000:
-                json_data = [{header: val} for val in column_data]
-                json_content = json.dumps(json_data, indent=2, ensure_ascii=False)
-                column_files[header]["json"] = json_content
+        result_path: str | os.PathLike[str],
+        column: int,
+        export_format: str,
+        target: SinkTarget,
+    ) -> int:
+        """
+        Render one column of a stored cleaned result (CSV written via `result_path`)
+        to `target` as csv, json or excel. Returns the number of values written.
+        """
+        if export_format not in COLUMN_FILE_FORMATS:
+            raise ServiceError(f"Unknown column file format {export_format!r}; expected csv, json or excel.")
+        with open(result_path, encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            headers = next(reader, [])
+            if not 0 <= column < len(headers):
+                raise ServiceError(f"Column {column} does not exist; the result has {len(headers)} columns.")
+            return self.export_rows(
+                ([row[column] if column < len(row) else ""] for row in reader),
+                [headers[column]], export_format, target,
+            )
+    
+    def iter_column_zip(
+        self,
+        result_path: str | os.PathLike[str],
+        export_formats: t.Iterable[str] | None = None,
+        columns: t.Iterable[int] | None = None,
+    ) -> t.Iterator[bytes]:
+        """
+        Yield a ZIP archive of column files for a stored cleaned result, piece by piece.
+        The result is split into per-column temp files in one pass, then each file is
+        deflated into the archive in COLUMN_ZIP_CHUNK_SIZE pieces.
+        """
+        with open(result_path, encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            headers = next(reader, [])
+            manifest = self.column_file_manifest(headers, export_formats)
+            wanted = sorted(set(columns)) if columns is not None else list(range(len(headers)))
+            if any(not 0 <= c < len(headers) for c in wanted):
+                raise ServiceError(f"Column index out of range; the result has {len(headers)} columns.")
             
-            # Create Excel file for this column (only for smaller files)
-            if 'excel' in export_formats and num_rows <= 10000:
-                try:
-                    csv_rows = [[header]] + [[val] for val in column_data]
-                    excel_content = self._rows_to_excel(csv_rows[1:], [header])
-                    column_files[header]["excel"] = excel_content
-                except:
-                    column_files[header]["excel"] = None
-        
-        return column_files
+            with tempfile.TemporaryDirectory(prefix="apex-columns-", dir=self.spill_dir) as tmp:
+                entries: list[tuple[str, str]] = []
+                with contextlib.ExitStack() as stack:
+                    sinks: list[tuple[int, RowSink]] = []
+                    for c in wanted:
+                        for fmt, name in manifest["columns"][c]["files"].items():
+                            path = os.path.join(tmp, name)
+                            sinks.append((c, stack.enter_context(open_sink(fmt, path, [headers[c]]))))
+                            entries.append((name, path))
+                    for row in reader:
+                        for c, sink in sinks:
+                            sink.write_rows(([row[c] if c < len(row) else ""],))
+                
+                buffer = _ZipChunkBuffer()
+                with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+                    for name, path in entries:
+                        with open(path, "rb") as src, zf.open(name, "w", force_zip64=True) as dest:
+                            while True:
+                                block = src.read(COLUMN_ZIP_CHUNK_SIZE)
+                                if not block:
+                                    break
+                                dest.write(block)
+                                data = buffer.drain()
+                                if data:
+                                    yield data
+                        os.remove(path)
+                yield buffer.drain()
+    
+    def write_column_zip(
+        self,
+        result_path: str | os.PathLike[str],
+        target: str | os.PathLike[str] | t.BinaryIO,
+        export_formats: t.Iterable[str] | None = None,
+        columns: t.Iterable[int] | None = None,
+    ) -> None:
+        """Write the ZIP from iter_column_zip to a path or writable binary stream."""
+        with contextlib.ExitStack() as stack:
+            out = stack.enter_context(open(target, "wb")) if isinstance(target, (str, os.PathLike)) else target
+            for data in self.iter_column_zip(result_path, export_formats, columns):
+                out.write(data)
     
-    def _rows_to_csv(self, rows: list[list[str]], delimiter: str) -> str:
+    def _rows_to_csv(self, rows: t.Iterable[list[str]], delimiter: str) -> str:
         """Convert rows to CSV string"""
         out = io.StringIO()
         writer = csv.writer(out, delimiter=delimiter, lineterminator="\n")
@@ -1080,28 +4127,79 @@ class ApexDataCleanEngine:
         if val is None:
             fixes["empties_to_blank"] += 1
             return ""
-        v = str(val)
+        v, applied = self._normalize_value(str(val))
+        for key in applied:
+            fixes[key] += 1
+        return v
+    
+    def _normalize_value(
+        self,
+        v: str,
+        numbers: bool = True,
+        dates: bool = True,
+        day_first: bool = False,
+    ) -> tuple[str, tuple[str, ...]]:
+        """
+        Pure normalization of one raw cell.
+        Returns the normalized value and the `fixes` counters it bumps, so results can be memoized.
+        """
         v2 = v.strip()
-        if v2 != v:
-            fixes["trimmed_cells"] += 1
+        applied: tuple[str, ...] = ("trimmed_cells",) if v2 != v else ()
         v = v2
         if not v:
-            return ""
+            return "", applied
         
         # numbers like "1,234.50" -> "1234.50"
-        if re.fullmatch(r"-?\d{1,3}(,\d{3})+(\.\d+)?", v):
-            fixes["normalized_numbers"] += 1
-            return v.replace(",", "")
+        if numbers and _THOUSANDS_NUMBER_RE.fullmatch(v):
+            return v.replace(",", ""), applied + ("normalized_numbers",)
         
         # dates
-        for pat in self._date_patterns:
-            if pat.match(v):
-                iso = self._try_parse_date_to_iso(v)
-                if iso and iso != v:
-                    fixes["normalized_dates"] += 1
-                    return iso
-                return v
-        return v
+        if dates and _DATE_CANDIDATE_RE.match(v):
+            iso = self._try_parse_date_to_iso(v, day_first=day_first)
+            if iso and iso != v:
+                return iso, applied + ("normalized_dates",)
+        return v, applied
+    
+    def _make_cell_normalizer(
+        self,
+        column: ColumnSchema | None = None,
+        cache_size: int = NORMALIZER_CACHE_SIZE,
+    ) -> t.Callable[[str, dict[str, int]], str]:
+        """
+        Build a per-column drop-in for `_norm_cell` with a bounded LRU memo of
+        raw -> normalized values. Fix counters are still bumped on every hit.
+        Given an inferred `column`, only that type's checks run: date columns skip
+        number parsing, numeric columns skip date parsing, text-like columns are only trimmed.
+        """
+        numbers = dates = True
+        day_first = False
+        if column is not None:
+            day_first = column.date_convention == "D/M"
+            if not column.mixed:
+                numbers = column.column_type == "numeric"
+                dates = column.column_type == "date"
+        normalize = functools.lru_cache(maxsize=cache_size)(
+            functools.partial(self._normalize_value, numbers=numbers, dates=dates, day_first=day_first)
+        )
+        
+        def norm_cell(val: str, fixes: dict[str, int]) -> str:
+            if val is None:
+                fixes["empties_to_blank"] += 1
+                return ""
+            v, applied = normalize(val if type(val) is str else str(val))
+            for key in applied:
+                fixes[key] += 1
+            return v
+        
+        return norm_cell
+    
+    def _make_column_normalizers(
+        self, schema: list[ColumnSchema] | None, width: int
+    ) -> list[t.Callable[[str, dict[str, int]], str]]:
+        """One memoized normalizer per column, specialized by `schema` when given"""
+        columns: list[ColumnSchema | None] = list(schema or [])[:width]
+        columns += [None] * (width - len(columns))
+        return [self._make_cell_normalizer(col) for col in columns]
     
     def _reconcile_row_length(
         self,
@@ -1117,14 +4215,11 @@ class ApexDataCleanEngine:
             return (row + [""] * target_cols)[:target_cols]
         
         rr = list(row)
-        numeric_left = re.compile(r"^-?\d{1,3}$")
-        numeric_mid = re.compile(r"^\d{3}$")
-        numeric_right = re.compile(r"^\d{3}(\.\d+)?$")
         
         i = 0
         while len(rr) > target_cols and i < len(rr) - 1:
             a, b = rr[i].strip(), rr[i + 1].strip()
-            if numeric_left.match(a) and (numeric_mid.match(b) or numeric_right.match(b)):
+            if _NUMERIC_LEFT_RE.match(a) and (_NUMERIC_MID_RE.match(b) or _NUMERIC_RIGHT_RE.match(b)):
                 rr[i : i + 2] = [f"{a},{b}"]
                 fixes["normalized_numbers"] += 1
                 continue
@@ -1137,3 +4232,61 @@ class ApexDataCleanEngine:
         return rr[:target_cols]
 
 
+def _clean_chunk_worker(
+    chunk: list[list[str]],
+    target_cols: int,
+    row_filter: RowFilter,
+    delimiter: str,
+    drop_empty_rows: bool,
+    schema: list[ColumnSchema] | None = None,
+    backend: str = "auto",
+    memory_metric: str = "rss",
+    track_kept: bool = False,
+) -> tuple[list[list[str]], dict[str, int], dict[str, StageMetrics], dict[str, int], list[int] | None]:
+    """
+    Process-pool entry point: clean one chunk and return its rows with local fix
+    counters, stage metrics, per-rule removal counts and, with `track_kept`, the
+    chunk positions of the rows kept.
+    """
+    engine = ApexDataCleanEngine(backend=backend, memory_metric=memory_metric)
+    fixes: dict[str, int] = collections.defaultdict(int)
+    metrics: dict[str, StageMetrics] = {}
+    rule_hits: dict[str, int] = collections.defaultdict(int)
+    normalizers = engine._make_column_normalizers(schema, target_cols)
+    kept: list[int] | None = [] if track_kept else None
+    rows = engine._clean_chunk(
+        chunk, target_cols, row_filter, delimiter, drop_empty_rows, fixes, normalizers,
+        _StageMeter(metrics, engine._stage_memory_metric()), rule_hits, kept,
+    )
+    return rows, dict(fixes), metrics, dict(rule_hits), kept
+
+
+def _clean_file_worker(
+    path: str,
+    filename: str,
+    options: dict[str, t.Any],
+    result_path: str | None,
+    engine_options: dict[str, t.Any],
+    output_dir: str | None = None,
+) -> tuple[dict[str, t.Any], DataCleanReport]:
+    """Process-pool entry point: clean one file of a batch (see iter_clean_files)."""
+    engine = ApexDataCleanEngine(**engine_options)
+    with open(path, "rb") as f:
+        return engine.clean_file_streaming(f, filename, result_path=result_path, output_dir=output_dir, **options)
+
+
+def _clean_sheet_worker(
+    path: str,
+    sheet_name: str,
+    options: dict[str, t.Any],
+    result_path: str | None,
+    engine_options: dict[str, t.Any],
+    output_dir: str | None = None,
+) -> tuple[dict[str, t.Any], DataCleanReport]:
+    """Process-pool entry point: clean one worksheet of the workbook at `path`."""
+    engine = ApexDataCleanEngine(**engine_options)
+    with open(path, "rb") as f:
+        return engine.clean_file_streaming(
+            f, path, file_type="excel", sheet_name=sheet_name, result_path=result_path,
+            output_dir=output_dir, **options
+        )
@@ -3,15 +3,37 @@ Flask API for Apex Automation Services
 Exposes all Python automation services as REST API endpoints
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, send_file, Response, stream_with_context, url_for
 from flask_cors import CORS
 import sys
 import os
+import re
+import json
+import time
+import threading
+import uuid
+import base64
+import shutil
+import dataclasses
+import datetime
+import sqlite3
+import gzip
+import hashlib
+import io
+import tempfile
+import concurrent.futures
+
+try:
+    import zstandard
+except ImportError:  # optional: artifact downloads are then offered gzip-encoded only
+    zstandard = None
 
 # Add parent directory to path to import services
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, parent_dir)
 
+from shared_utils import ServiceError, utc_now_iso
+
 # Import all services - using importlib to handle numeric prefixes
 import importlib.util
 
@@ -49,8 +71,26 @@ except Exception as e:
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend access
 
+# Data clean results are cached on disk by input hash + options (set the size to 0 to disable)
+DATA_CLEAN_CACHE_DIR = os.environ.get(
+    'APEX_DATA_CLEAN_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'apex-data-clean-cache')
+)
+DATA_CLEAN_CACHE_MAX_BYTES = int(os.environ.get('APEX_DATA_CLEAN_CACHE_MAX_BYTES', 1024 * 1024 * 1024))
+
+# Per-stage memory metric (off, rss or tracemalloc), and where cleans running at least
+# APEX_DATA_CLEAN_PROFILE_MIN_SECONDS leave a sampling profile (unset: no profiling)
+DATA_CLEAN_ENGINE_OPTIONS = {
+    'memory_metric': os.environ.get('APEX_DATA_CLEAN_MEMORY_METRIC', 'rss'),
+    'profile_dir': os.environ.get('APEX_DATA_CLEAN_PROFILE_DIR') or None,
+    'profile_min_seconds': float(os.environ.get('APEX_DATA_CLEAN_PROFILE_MIN_SECONDS', 30)),
+}
+
 # Initialize service instances
-data_clean_engine = ApexDataCleanEngine()
+data_clean_cache = (
+    sys.modules[ApexDataCleanEngine.__module__].ResultCache(DATA_CLEAN_CACHE_DIR, DATA_CLEAN_CACHE_MAX_BYTES)
+    if DATA_CLEAN_CACHE_MAX_BYTES > 0 else None
+)
+data_clean_engine = ApexDataCleanEngine(result_cache=data_clean_cache, **DATA_CLEAN_ENGINE_OPTIONS)
 voc_system = VoiceOfCustomerInsightsSystem()
 help_desk = AIHelpDesk()
 reputation_engine = ReputationReviewAutomationEngine()
@@ -58,6 +98,589 @@ missed_call = MissedCallAutomation()
 speed_to_lead = SpeedToLeadAutomationSystem()
 lead_nurture = AILeadFollowUpNurtureSystem()
 
+# Cleaned data-clean results, kept on disk so column files can be rendered on demand
+DATA_CLEAN_RESULTS_DIR = os.environ.get(
+    'APEX_DATA_CLEAN_RESULTS_DIR', os.path.join(tempfile.gettempdir(), 'apex-data-clean-results')
+)
+DATA_CLEAN_RESULT_TTL = int(os.environ.get('APEX_DATA_CLEAN_RESULT_TTL', 24 * 3600))
+# inline_outputs only embeds artifacts up to this size (bytes); larger ones are download-only
+DATA_CLEAN_INLINE_MAX_BYTES = int(os.environ.get('APEX_DATA_CLEAN_INLINE_MAX_BYTES', 32 * 1024 * 1024))
+
+# Multi-file uploads are cleaned in a process pool (unset: one worker per CPU) whose files'
+# estimated peak memory must fit the budget (bytes)
+DATA_CLEAN_BATCH_WORKERS = int(os.environ.get('APEX_DATA_CLEAN_BATCH_WORKERS', 0)) or None
+DATA_CLEAN_BATCH_MEMORY_BUDGET = int(os.environ.get(
+    'APEX_DATA_CLEAN_BATCH_MEMORY_BUDGET', sys.modules[ApexDataCleanEngine.__module__].BATCH_MEMORY_BUDGET
+))
+_RESULT_ID_RE = re.compile(r'^[0-9a-f]{32}$')
+_COLUMN_FILE_MIMETYPES = {
+    'csv': 'text/csv',
+    'json': 'application/json',
+    'excel': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+# Master outputs are written by the engine as files in the result directory and downloaded
+# by URL: output name -> (export format, mimetype, compressible). Text artifacts are
+# compressed per accepted encoding on first download and the encoded copy kept beside them
+_DATA_CLEAN_ARTIFACTS = {
+    'master_cleanse_csv': ('csv', 'text/csv', True),
+    'master_cleanse_json': ('json', 'application/json', True),
+    'master_cleanse_excel': ('excel', _COLUMN_FILE_MIMETYPES['excel'], False),
+}
+_ARTIFACT_ENCODINGS = {'zstd': '.zst', 'gzip': '.gz'}
+
+# Background data-clean jobs: metadata is kept in the services' SQLite file so jobs survive a
+# restart, uploads are spooled to disk until a worker has cleaned them, and progress is
+# written at most once per interval (seconds)
+DATA_CLEAN_JOBS_DB = os.environ.get('APEX_DATA_CLEAN_JOBS_DB', speed_to_lead.store.db_path)
+DATA_CLEAN_JOBS_DIR = os.environ.get(
+    'APEX_DATA_CLEAN_JOBS_DIR', os.path.join(tempfile.gettempdir(), 'apex-data-clean-jobs')
+)
+DATA_CLEAN_JOB_WORKERS = int(os.environ.get('APEX_DATA_CLEAN_JOB_WORKERS', 2))
+DATA_CLEAN_JOB_PROGRESS_INTERVAL = 0.5
+
+# Resumable uploads: default and allowed chunk sizes (bytes), and how long (seconds) an upload
+# may go without a new chunk before it is abandoned. Jobs reading chunks as they arrive run
+# on their own workers, so uploads waiting on a slow client never hold up spooled jobs
+DATA_CLEAN_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+DATA_CLEAN_UPLOAD_MIN_CHUNK_SIZE = 256 * 1024
+DATA_CLEAN_UPLOAD_MAX_CHUNK_SIZE = 64 * 1024 * 1024
+DATA_CLEAN_UPLOAD_STALL_TIMEOUT = int(os.environ.get('APEX_DATA_CLEAN_UPLOAD_STALL_TIMEOUT', 3600))
+DATA_CLEAN_UPLOAD_WORKERS = int(os.environ.get('APEX_DATA_CLEAN_UPLOAD_WORKERS', 2))
+_SHA256_RE = re.compile(r'^[0-9a-f]{64}$')
+
+
+def _result_dir(result_id):
+    """Directory of a stored data-clean result, or None for an unknown/invalid id"""
+    if not _RESULT_ID_RE.match(result_id or ''):
+        return None
+    path = os.path.join(DATA_CLEAN_RESULTS_DIR, result_id)
+    return path if os.path.isdir(path) else None
+
+
+def _load_result_manifest(result_id):
+    """(result directory, column manifest) of a stored result, or (None, None)"""
+    result_dir = _result_dir(result_id)
+    manifest_path = os.path.join(result_dir, 'manifest.json') if result_dir else None
+    if manifest_path is None or not os.path.exists(manifest_path):
+        return None, None
+    with open(manifest_path, encoding='utf-8') as f:
+        return result_dir, json.load(f)
+
+
+def _load_result_artifacts(result_id):
+    """(result directory, artifact manifest) of a stored result, or (None, None)"""
+    result_dir = _result_dir(result_id)
+    artifacts_path = os.path.join(result_dir, 'artifacts.json') if result_dir else None
+    if artifacts_path is None or not os.path.exists(artifacts_path):
+        return None, None
+    with open(artifacts_path, encoding='utf-8') as f:
+        return result_dir, json.load(f)
+
+
+def _data_clean_engine_for(filter_rules, default_filter_rules=True):
+    """The shared engine, or one with a client's irrelevant-row rules (a JSON list or string)"""
+    if not filter_rules and default_filter_rules:
+        return data_clean_engine
+    module = sys.modules[ApexDataCleanEngine.__module__]
+    if isinstance(filter_rules, str):
+        try:
+            filter_rules = json.loads(filter_rules)
+        except ValueError as e:
+            raise module.ServiceError(f'filter_rules must be a JSON list of rules: {e}')
+    if filter_rules and not isinstance(filter_rules, list):
+        raise module.ServiceError('filter_rules must be a JSON list of rules')
+    rules = module.parse_filter_rules(filter_rules or [])
+    if default_filter_rules:
+        rules = module.DEFAULT_FILTER_RULES + rules
+    return ApexDataCleanEngine(result_cache=data_clean_cache, filter_rules=rules, **DATA_CLEAN_ENGINE_OPTIONS)
+
+
+def _data_clean_form_options(form):
+    """Cleaning options from upload form fields, as JSON-serializable values (jobs persist them)"""
+    export_formats_str = form.get('export_formats', 'csv,json,excel')
+    return {
+        'delimiter': form.get('delimiter') or None,  # None: sniffed from the upload
+        'normalize_headers': form.get('normalize_headers', 'true').lower() == 'true',
+        'drop_empty_rows': form.get('drop_empty_rows', 'true').lower() == 'true',
+        'apply_crm_mappings': form.get('apply_crm_mappings', 'true').lower() == 'true',
+        'infer_types': form.get('infer_types', 'true').lower() == 'true',
+        'near_duplicates': form.get('near_duplicates', 'off').lower(),
+        'file_type': form.get('file_type') or None,
+        'sheet_name': form.get('sheet_name') or None,
+        'all_sheets': form.get('all_sheets', 'false').lower() == 'true',
+        'filter_rules': form.get('filter_rules'),
+        'default_filter_rules': form.get('default_filter_rules', 'true').lower() == 'true',
+        'export_formats': [f.strip() for f in export_formats_str.split(',')] if export_formats_str else ['csv'],
+        'inline_outputs': form.get('inline_outputs', 'false').lower() == 'true',
+    }
+
+
+def _clean_file_streaming_kwargs(options):
+    """clean_file_streaming keyword arguments for parsed form options"""
+    return {
+        'file_type': options['file_type'],
+        'delimiter': options['delimiter'],
+        'normalize_headers': options['normalize_headers'],
+        'drop_empty_rows': options['drop_empty_rows'],
+        'apply_crm_mappings': options['apply_crm_mappings'],
+        'sheet_name': options['sheet_name'],
+        'chunk_size': 10000,  # Process in 10k row chunks
+        'export_formats': options['export_formats'],  # Only generate requested formats
+        'infer_types': options['infer_types'],
+        'near_duplicates': options['near_duplicates'],
+    }
+
+
+def _prune_data_clean_results():
+    """Remove stored results older than DATA_CLEAN_RESULT_TTL"""
+    if not os.path.isdir(DATA_CLEAN_RESULTS_DIR):
+        return
+    cutoff = time.time() - DATA_CLEAN_RESULT_TTL
+    for name in os.listdir(DATA_CLEAN_RESULTS_DIR):
+        path = os.path.join(DATA_CLEAN_RESULTS_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+        except OSError:
+            pass
+
+
+def _column_manifest_with_urls(result_id, manifest):
+    """Attach download URLs to an engine column manifest"""
+    columns = []
+    for col in manifest['columns']:
+        columns.append({
+            **col,
+            'urls': {
+                fmt: url_for('data_clean_column_file', result_id=result_id, column=col['index'],
+                             export_format=fmt, _external=True)
+                for fmt in col['files']
+            },
+        })
+    return {
+        'result_id': result_id,
+        'formats': manifest['formats'],
+        'columns': columns,
+        'zip_url': url_for('data_clean_column_zip', result_id=result_id, _external=True),
+    }
+
+
+def _store_data_clean_artifacts(result_dir, filename, outputs):
+    """Record the master output files the engine wrote into the result directory; returns their manifest"""
+    stem = os.path.splitext(os.path.basename(filename))[0] or 'cleaned_data'
+    artifacts = {}
+    for name, path in outputs.get('files', {}).items():
+        export_format, mimetype, _ = _DATA_CLEAN_ARTIFACTS[name]
+        file_name = os.path.relpath(path, result_dir)
+        artifacts[name] = {
+            'format': export_format,
+            'file': file_name,
+            'download_name': f'{stem}_master_cleaned{os.path.splitext(file_name)[1]}',
+            'content_type': mimetype,
+            'size': os.path.getsize(path),
+        }
+    with open(os.path.join(result_dir, 'artifacts.json'), 'w', encoding='utf-8') as f:
+        json.dump(artifacts, f)
+    return artifacts
+
+
+def _artifacts_with_urls(result_id, artifacts):
+    """Attach download URLs to an artifact manifest"""
+    return {
+        name: {
+            **{key: value for key, value in artifact.items() if key != 'file'},
+            'url': url_for('data_clean_artifact', result_id=result_id, name=name, _external=True),
+        }
+        for name, artifact in artifacts.items()
+    }
+
+
+def _encoded_artifact(path, encoding):
+    """Path of `path` compressed with `encoding`, written on first use (temp file + rename)"""
+    encoded_path = path + _ARTIFACT_ENCODINGS[encoding]
+    if os.path.exists(encoded_path):
+        return encoded_path
+    fd, tmp_path = tempfile.mkstemp(prefix='.encoding-', dir=os.path.dirname(path))
+    try:
+        with open(path, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+            if encoding == 'zstd':
+                zstandard.ZstdCompressor(level=3).copy_stream(src, dst)
+            else:
+                with gzip.GzipFile(filename='', mode='wb', fileobj=dst, mtime=0) as gz:
+                    shutil.copyfileobj(src, gz, 1024 * 1024)
+        os.replace(tmp_path, encoded_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return encoded_path
+
+
+class _DataCleanJobStore:
+    """
+    Data-clean job metadata and progress (status: queued -> running -> succeeded | failed).
+    Jobs fed by a resumable upload start as "uploading" and are queued once their first chunk
+    arrives; the upload's chunk size and received chunks (with checksums) are kept alongside.
+    """
+    
+    def __init__(self, db_path='apex.db'):
+        self.db_path = db_path
+        self._init()
+    
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+    
+    def _init(self):
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS data_clean_jobs (
+                    id TEXT PRIMARY KEY,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    filename TEXT NOT NULL,
+                    upload_path TEXT NOT NULL,
+                    options_json TEXT NOT NULL,
+                    stage TEXT,
+                    rows_processed INTEGER NOT NULL DEFAULT 0,
+                    rows_out INTEGER NOT NULL DEFAULT 0,
+                    bytes_processed INTEGER NOT NULL DEFAULT 0,
+                    bytes_total INTEGER NOT NULL DEFAULT 0,
+                    eta_seconds REAL,
+                    started_at TEXT,
+                    finished_at TEXT,
+                    result_id TEXT,
+                    error TEXT
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_data_clean_jobs_status ON data_clean_jobs(status)")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS data_clean_uploads (
+                    job_id TEXT PRIMARY KEY,
+                    chunk_size INTEGER NOT NULL,
+                    chunks INTEGER NOT NULL,
+                    completed_at TEXT
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS data_clean_upload_chunks (
+                    job_id TEXT NOT NULL,
+                    idx INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    received_at TEXT NOT NULL,
+                    PRIMARY KEY (job_id, idx)
+                )
+                """
+            )
+    
+    def create(self, job_id, filename, upload_path, bytes_total, options):
+        now = utc_now_iso()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO data_clean_jobs (id, created_at, updated_at, status, filename, upload_path, options_json, bytes_total) VALUES (?, ?, ?, 'queued', ?, ?, ?, ?)",
+                (job_id, now, now, filename, upload_path, json.dumps(options), bytes_total),
+            )
+    
+    def get(self, job_id):
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM data_clean_jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+    
+    def update(self, job_id, **fields):
+        fields['updated_at'] = utc_now_iso()
+        with self._connect() as conn:
+            conn.execute(
+                f"UPDATE data_clean_jobs SET {', '.join(f'{name} = ?' for name in fields)} WHERE id = ?",
+                (*fields.values(), job_id),
+            )
+    
+    def claim(self, job_id):
+        """Move a queued job to running; False if another worker got there first"""
+        now = utc_now_iso()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE data_clean_jobs SET status = 'running', started_at = ?, updated_at = ? WHERE id = ? AND status = 'queued'",
+                (now, now, job_id),
+            )
+        return cursor.rowcount == 1
+    
+    def create_upload(self, job_id, filename, chunk_dir, bytes_total, chunk_size, options):
+        """Register a resumable upload and the job that will clean it (status "uploading")"""
+        now = utc_now_iso()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO data_clean_jobs (id, created_at, updated_at, status, filename, upload_path, options_json, bytes_total) VALUES (?, ?, ?, 'uploading', ?, ?, ?, ?)",
+                (job_id, now, now, filename, chunk_dir, json.dumps(options), bytes_total),
+            )
+            conn.execute(
+                "INSERT INTO data_clean_uploads (job_id, chunk_size, chunks) VALUES (?, ?, ?)",
+                (job_id, chunk_size, -(-bytes_total // chunk_size)),
+            )
+    
+    def get_upload(self, job_id):
+        """Upload row of a job with its received chunks ({index: (size, sha256)}), or None"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM data_clean_uploads WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            chunks = conn.execute(
+                "SELECT idx, size, sha256 FROM data_clean_upload_chunks WHERE job_id = ? ORDER BY idx", (job_id,)
+            ).fetchall()
+        return {**dict(row), 'received': {c['idx']: (c['size'], c['sha256']) for c in chunks}}
+    
+    def add_chunk(self, job_id, index, size, sha256):
+        """Record a stored chunk; returns the checksum on record (an earlier copy's, if any)"""
+        now = utc_now_iso()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO data_clean_upload_chunks (job_id, idx, size, sha256, received_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, index, size, sha256, now),
+            )
+            conn.execute("UPDATE data_clean_jobs SET updated_at = ? WHERE id = ?", (now, job_id))
+            row = conn.execute(
+                "SELECT sha256 FROM data_clean_upload_chunks WHERE job_id = ? AND idx = ?", (job_id, index)
+            ).fetchone()
+        return row['sha256']
+    
+    def start_upload(self, job_id):
+        """Queue an uploading job; False if it was already queued (or has finished)"""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE data_clean_jobs SET status = 'queued', updated_at = ? WHERE id = ? AND status = 'uploading'",
+                (utc_now_iso(), job_id),
+            )
+        return cursor.rowcount == 1
+    
+    def complete_upload(self, job_id):
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE data_clean_uploads SET completed_at = ? WHERE job_id = ? AND completed_at IS NULL",
+                (utc_now_iso(), job_id),
+            )
+    
+    def fail_stale_uploads(self, cutoff):
+        """Fail uploads still waiting for their first chunk since before `cutoff`; returns their rows"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM data_clean_jobs WHERE status = 'uploading' AND updated_at < ?", (cutoff,)
+            ).fetchall()
+            conn.execute(
+                "UPDATE data_clean_jobs SET status = 'failed', error = 'Upload abandoned', finished_at = ? WHERE status = 'uploading' AND updated_at < ?",
+                (utc_now_iso(), cutoff),
+            )
+        return [dict(row) for row in rows]
+    
+    def requeue_unfinished(self):
+        """Ids of jobs a previous process left queued or running, reset to queued"""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE data_clean_jobs SET status = 'queued', stage = NULL, rows_processed = 0, rows_out = 0, bytes_processed = 0, eta_seconds = NULL WHERE status = 'running'"
+            )
+            rows = conn.execute(
+                "SELECT id FROM data_clean_jobs WHERE status = 'queued' ORDER BY created_at"
+            ).fetchall()
+        return [row['id'] for row in rows]
+
+
+def _upload_chunk_path(chunk_dir, index):
+    return os.path.join(chunk_dir, f'{index:08d}.chunk')
+
+
+# Signalled whenever a chunk is stored; upload id -> when (monotonic) its latest chunk was
+_upload_chunk_stored = threading.Condition()
+_upload_last_chunk_at = {}
+
+
+def _notify_upload_chunk(upload_id):
+    """Wake the jobs waiting for chunks, recording activity on `upload_id`"""
+    with _upload_chunk_stored:
+        _upload_last_chunk_at[upload_id] = time.monotonic()
+        _upload_chunk_stored.notify_all()
+
+
+class _ChunkedUploadReader(io.RawIOBase):
+    """
+    Readable stream over a resumable upload's chunk files, in order. A chunk that hasn't
+    arrived yet is waited for (woken by the chunk route), so a job cleans the uploaded
+    prefix while the rest is still being sent; no new chunk for
+    DATA_CLEAN_UPLOAD_STALL_TIMEOUT seconds fails the read.
+    """
+    
+    def __init__(self, upload_id, chunk_dir, chunks):
+        self.upload_id = upload_id
+        self.chunk_dir = chunk_dir
+        self.chunks = chunks
+        self._index = 0
+        self._file = None
+        self._position = 0
+    
+    def readable(self):
+        return True
+    
+    def tell(self):
+        return self._position
+    
+    def _open_next_chunk(self):
+        path = _upload_chunk_path(self.chunk_dir, self._index)
+        with _upload_chunk_stored:
+            waiting_since = time.monotonic()
+            while not os.path.exists(path):
+                if not os.path.isdir(self.chunk_dir):
+                    raise ServiceError('Upload was removed before it finished')
+                # Any chunk of this upload (e.g. a later one sent out of order) counts as activity
+                last_activity = max(waiting_since, _upload_last_chunk_at.get(self.upload_id, 0.0))
+                remaining = last_activity + DATA_CLEAN_UPLOAD_STALL_TIMEOUT - time.monotonic()
+                if remaining <= 0:
+                    raise ServiceError(f'Upload stalled waiting for chunk {self._index}')
+                _upload_chunk_stored.wait(remaining)
+        self._file = open(path, 'rb')
+    
+    def readinto(self, b):
+        while self._index < self.chunks:
+            if self._file is None:
+                self._open_next_chunk()
+            n = self._file.readinto(b)
+            if n:
+                self._position += n
+                return n
+            self._file.close()
+            self._file = None
+            self._index += 1
+        return 0
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        with _upload_chunk_stored:
+            _upload_last_chunk_at.pop(self.upload_id, None)
+        super().close()
+
+
+def _open_job_upload(job):
+    """Binary stream of a job's input: its spooled upload, or a resumable upload's chunks as they arrive"""
+    upload = data_clean_jobs.get_upload(job['id'])
+    if upload is None:
+        return open(job['upload_path'], 'rb')
+    return io.BufferedReader(_ChunkedUploadReader(job['id'], job['upload_path'], upload['chunks']), 1024 * 1024)
+
+
+def _run_data_clean_job(job_id):
+    """Worker pool entry point: clean one spooled upload, recording progress and the outcome"""
+    if not data_clean_jobs.claim(job_id):
+        return
+    job = data_clean_jobs.get(job_id)
+    options = json.loads(job['options_json'])
+    result_id = uuid.uuid4().hex
+    result_dir = os.path.join(DATA_CLEAN_RESULTS_DIR, result_id)
+    started = time.monotonic()
+    last_update = 0.0
+    try:
+        engine = _data_clean_engine_for(options['filter_rules'], options['default_filter_rules'])
+        os.makedirs(result_dir)
+        # A resumable upload is cleaned as it arrives, so it can't be hashed for the result cache first
+        chunked = data_clean_jobs.get_upload(job_id) is not None
+        with _open_job_upload(job) as upload:
+            def progress(stage, report):
+                # ETA extrapolates the share of the upload read so far; later stages have none
+                nonlocal last_update
+                now = time.monotonic()
+                if stage == 'clean' and now - last_update < DATA_CLEAN_JOB_PROGRESS_INTERVAL:
+                    return
+                last_update = now
+                position = job['bytes_total'] if upload.closed else min(upload.tell(), job['bytes_total'])
+                eta = None
+                if stage == 'clean' and position:
+                    eta = round((now - started) * (job['bytes_total'] - position) / position, 1)
+                data_clean_jobs.update(
+                    job_id, stage=stage, rows_processed=report.rows_in, rows_out=report.rows_out,
+                    bytes_processed=position, eta_seconds=eta,
+                )
+            
+            outputs, report = engine.clean_file_streaming(
+                upload,
+                job['filename'],
+                result_path=os.path.join(result_dir, 'cleaned.csv'),
+                output_dir=result_dir,
+                progress=progress,
+                cache=not chunked,
+                **_clean_file_streaming_kwargs(options),
+            )
+        result = _data_clean_file_result(
+            job['filename'], result_id, result_dir, outputs, report,
+            with_urls=False, inline_outputs=options.get('inline_outputs', False),
+        )
+        with open(os.path.join(result_dir, 'job_result.json'), 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+        data_clean_jobs.update(
+            job_id, status='succeeded', stage='done', rows_processed=report.rows_in, rows_out=report.rows_out,
+            bytes_processed=job['bytes_total'], eta_seconds=0, result_id=result_id, finished_at=utc_now_iso(),
+        )
+    except Exception as e:
+        shutil.rmtree(result_dir, ignore_errors=True)
+        data_clean_jobs.update(job_id, status='failed', eta_seconds=None, error=str(e), finished_at=utc_now_iso())
+    finally:
+        shutil.rmtree(os.path.dirname(job['upload_path']), ignore_errors=True)
+
+
+def _data_clean_job_status(job):
+    """Public view of a job row: progress while it runs, a result URL once it has succeeded"""
+    percent = 100.0 if job['status'] == 'succeeded' else (
+        round(100.0 * job['bytes_processed'] / job['bytes_total'], 1) if job['bytes_total'] else 0.0
+    )
+    status = {
+        'job_id': job['id'],
+        'filename': job['filename'],
+        'status': job['status'],
+        'stage': job['stage'],
+        'rows_processed': job['rows_processed'],
+        'rows_out': job['rows_out'],
+        'bytes_processed': job['bytes_processed'],
+        'bytes_total': job['bytes_total'],
+        'percent': percent,
+        'eta_seconds': job['eta_seconds'],
+        'created_at': job['created_at'],
+        'started_at': job['started_at'],
+        'finished_at': job['finished_at'],
+        'error': job['error'],
+        'status_url': url_for('data_clean_job_status', job_id=job['id'], _external=True),
+    }
+    if job['status'] == 'succeeded':
+        status['result_id'] = job['result_id']
+        status['result_url'] = url_for('data_clean_job_result', job_id=job['id'], _external=True)
+    return status
+
+
+data_clean_jobs = _DataCleanJobStore(DATA_CLEAN_JOBS_DB)
+data_clean_job_pool = concurrent.futures.ThreadPoolExecutor(
+    max_workers=DATA_CLEAN_JOB_WORKERS, thread_name_prefix='data-clean-job'
+)
+data_clean_upload_pool = concurrent.futures.ThreadPoolExecutor(
+    max_workers=DATA_CLEAN_UPLOAD_WORKERS, thread_name_prefix='data-clean-upload'
+)
+
+
+def _submit_data_clean_job(job_id):
+    """Run a job on the pool for its input: resumable uploads wait on chunks, so they get their own"""
+    pool = data_clean_upload_pool if data_clean_jobs.get_upload(job_id) is not None else data_clean_job_pool
+    pool.submit(_run_data_clean_job, job_id)
+
+
+# Jobs interrupted by a restart run again from their spooled upload (the debug reloader's
+# watcher process serves no requests, so only the serving process resumes them)
+if __name__ != '__main__' or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+    for _job_id in data_clean_jobs.requeue_unfinished():
+        _submit_data_clean_job(_job_id)
+
 
 @app.route('/api/health', methods=['GET'])
 def health():
@@ -122,6 +745,208 @@ def list_services():
     return jsonify({'services': services})
 
 
+def _stage_metrics_json(report):
+    """Per-stage wall/CPU time, rows and memory of a report, as plain dicts"""
+    return {stage: dataclasses.asdict(m) for stage, m in getattr(report, 'stage_metrics', {}).items()}
+
+
+def _column_profiles_json(report):
+    """Per-column value profiles of a report, as plain dicts"""
+    return {header: dataclasses.asdict(p) for header, p in getattr(report, 'column_profiles', {}).items()}
+
+
+def _data_clean_file_result(
+    filename, result_id, result_dir, outputs, report, with_urls=True, inline_outputs=False
+):
+    """
+    Response entry for one cleaned file (or sheet); stores its master outputs as download
+    artifacts and its column manifest next to the result. `inline_outputs` also embeds the
+    outputs (Excel base64-encoded), as older clients expect. Background jobs pass
+    with_urls=False (no request context) and attach the URLs when served.
+    """
+    artifacts = _store_data_clean_artifacts(result_dir, filename, outputs)
+    result_data = {
+        'filename': filename,
+        'success': True,
+        'result_id': result_id,
+        'cache_hit': outputs.get('_cache_hit', False),
+        # Export warnings (e.g. a failed Excel export) are always passed through
+        'outputs': {name: value for name, value in outputs.items() if name.startswith('_') and name != '_cache_hit'},
+        'artifacts': _artifacts_with_urls(result_id, artifacts) if with_urls else artifacts,
+        'csv_preview': outputs.get('csv_preview'),
+        'column_manifest': None,
+        'report': {
+            'rows_in': report.rows_in,
+            'rows_out': report.rows_out,
+            'columns_in': report.columns_in,
+            'columns_out': report.columns_out,
+            'header_map': report.header_map,
+            'fixes': report.fixes,
+            'started_at': report.started_at,
+            'finished_at': report.finished_at,
+            'file_type': report.file_type,
+            'crm_detected': report.crm_detected,
+            'field_mappings': report.field_mappings,
+            'duplicates_removed': getattr(report, 'duplicates_removed', 0),
+            'irrelevant_rows_removed': getattr(report, 'irrelevant_rows_removed', 0),
+            'column_types': getattr(report, 'column_types', {}),
+            'date_conventions': getattr(report, 'date_conventions', {}),
+            'near_duplicate_clusters': getattr(report, 'near_duplicate_clusters', []),
+            'near_duplicates_merged': getattr(report, 'near_duplicates_merged', 0),
+            'stage_timings': getattr(report, 'stage_timings', {}),
+            'irrelevant_rows_by_rule': getattr(report, 'irrelevant_rows_by_rule', {}),
+            'stage_metrics': _stage_metrics_json(report),
+            'memory_metric': getattr(report, 'memory_metric', None),
+            'profile_path': getattr(report, 'profile_path', None),
+            'column_profiles': _column_profiles_json(report),
+        }
+    }
+    
+    # Inline copies are read back from the artifact files (only requested formats were
+    # written), up to DATA_CLEAN_INLINE_MAX_BYTES each
+    for name, path in outputs.get('files', {}).items() if inline_outputs else ():
+        export_format = _DATA_CLEAN_ARTIFACTS[name][0]
+        size = os.path.getsize(path)
+        if size > DATA_CLEAN_INLINE_MAX_BYTES:
+            result_data['outputs'][f'_{export_format}_skipped'] = (
+                f'{export_format.upper()} output ({size:,} bytes) is too large to inline; '
+                f'download the {name} artifact instead'
+            )
+            continue
+        with open(path, 'rb') as f:
+            data = f.read()
+        if export_format == 'excel':
+            result_data['outputs'][name] = base64.b64encode(data).decode('utf-8')
+        else:
+            result_data['outputs'][name] = data.decode('utf-8')
+    
+    # Column files (core feature for data verification) are listed with download
+    # URLs and rendered from the stored result only when requested
+    if outputs.get('column_manifest'):
+        with open(os.path.join(result_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump(outputs['column_manifest'], f)
+        result_data['column_manifest'] = _column_manifest_with_urls(
+            result_id, outputs['column_manifest']
+        ) if with_urls else outputs['column_manifest']
+    
+    return result_data
+
+
+def _data_clean_upload_error(filename, result_dirs, error):
+    """Failed-file entry; the file's partial results are removed"""
+    for result_dir in result_dirs:
+        shutil.rmtree(result_dir, ignore_errors=True)
+    return {
+        'filename': filename,
+        'success': False,
+        'error': str(error)
+    }
+
+
+def _iter_data_clean_uploads(files, options, engine):
+    """
+    (upload index, file result) per cleaned file or worksheet, in completion order.
+    A single upload is cleaned straight from the request stream; a batch is spooled to
+    disk and cleaned in a bounded process pool. A failed file yields an error entry.
+    """
+    export_formats = options['export_formats']
+    batch = []
+    for index, file in enumerate(files):
+        filename = file.filename
+        result_dirs = []
+        
+        # Use streaming method for large files (handles 100k+ entries);
+        # the upload stream is decoded incrementally rather than read up front
+        try:
+            detected_type = options['file_type'] or engine.detect_file_type(filename)
+            if options['all_sheets'] and detected_type == 'excel':
+                # One result per worksheet, sheets cleaned concurrently
+                sheet_names = engine.excel_sheet_names(file.stream)
+                file.stream.seek(0)
+                result_ids = {name: uuid.uuid4().hex for name in sheet_names}
+                for result_id in result_ids.values():
+                    result_dirs.append(os.path.join(DATA_CLEAN_RESULTS_DIR, result_id))
+                    os.makedirs(result_dirs[-1])
+                sheets = engine.clean_workbook(
+                    file.stream,
+                    filename,
+                    sheet_names=sheet_names,
+                    normalize_headers=options['normalize_headers'],
+                    drop_empty_rows=options['drop_empty_rows'],
+                    apply_crm_mappings=options['apply_crm_mappings'],
+                    chunk_size=10000,
+                    export_formats=export_formats,
+                    infer_types=options['infer_types'],
+                    near_duplicates=options['near_duplicates'],
+                    result_paths={
+                        name: os.path.join(DATA_CLEAN_RESULTS_DIR, result_id, 'cleaned.csv')
+                        for name, result_id in result_ids.items()
+                    },
+                    output_dirs={
+                        name: os.path.join(DATA_CLEAN_RESULTS_DIR, result_id) for name, result_id in result_ids.items()
+                    },
+                )
+                for name, (outputs, report) in sheets.items():
+                    yield index, _data_clean_file_result(
+                        f'{filename} [{name}]', result_ids[name],
+                        os.path.join(DATA_CLEAN_RESULTS_DIR, result_ids[name]),
+                        outputs, report, inline_outputs=options['inline_outputs'],
+                    )
+                continue
+            
+            result_id = uuid.uuid4().hex
+            result_dir = os.path.join(DATA_CLEAN_RESULTS_DIR, result_id)
+            result_dirs.append(result_dir)
+            os.makedirs(result_dir)
+            if len(files) > 1:
+                batch.append((index, file, result_id, result_dir))
+                continue
+            outputs, report = engine.clean_file_streaming(
+                file.stream,
+                filename,
+                result_path=os.path.join(result_dir, 'cleaned.csv'),
+                output_dir=result_dir,
+                **_clean_file_streaming_kwargs(options),
+            )
+            yield index, _data_clean_file_result(
+                filename, result_id, result_dir, outputs, report,
+                inline_outputs=options['inline_outputs'],
+            )
+            
+        except Exception as e:
+            yield index, _data_clean_upload_error(filename, result_dirs, e)
+    
+    if not batch:
+        return
+    # Spool the batch so pool workers can open each file themselves
+    spool_dir = tempfile.mkdtemp(prefix='apex-data-clean-batch-')
+    try:
+        paths = []
+        for index, file, _, _ in batch:
+            paths.append(os.path.join(spool_dir, str(index)))
+            file.save(paths[-1])
+        for position, cleaned, error in engine.iter_clean_files(
+            paths,
+            [file.filename for _, file, _, _ in batch],
+            workers=DATA_CLEAN_BATCH_WORKERS,
+            memory_budget=DATA_CLEAN_BATCH_MEMORY_BUDGET,
+            result_paths=[os.path.join(result_dir, 'cleaned.csv') for _, _, _, result_dir in batch],
+            output_dirs=[result_dir for _, _, _, result_dir in batch],
+            **_clean_file_streaming_kwargs(options),
+        ):
+            index, file, result_id, result_dir = batch[position]
+            if error is not None:
+                yield index, _data_clean_upload_error(file.filename, [result_dir], error)
+                continue
+            outputs, report = cleaned
+            yield index, _data_clean_file_result(
+                file.filename, result_id, result_dir, outputs, report,
+                inline_outputs=options['inline_outputs'],
+            )
+    finally:
+        shutil.rmtree(spool_dir, ignore_errors=True)
+
+
 @app.route('/api/services/data-clean', methods=['POST'])
 def data_clean():
     """Data Clean Engine service - supports batch file uploads, large files, and multiple formats"""
@@ -135,99 +960,20 @@ def data_clean():
             if not files:
                 return jsonify({'success': False, 'error': 'No files selected'}), 400
             
-            # Get options from form data
-            delimiter = request.form.get('delimiter', ',')
-            normalize_headers = request.form.get('normalize_headers', 'true').lower() == 'true'
-            drop_empty_rows = request.form.get('drop_empty_rows', 'true').lower() == 'true'
-            apply_crm_mappings = request.form.get('apply_crm_mappings', 'true').lower() == 'true'
-            file_type = request.form.get('file_type')
-            sheet_name = request.form.get('sheet_name')
+            # Get options (and export format preferences) from form data
+            options = _data_clean_form_options(request.form)
+            engine = _data_clean_engine_for(options['filter_rules'], options['default_filter_rules'])
             
-            # Get export format preferences
-            export_formats_str = request.form.get('export_formats', 'csv,json,excel')
-            export_formats = [f.strip() for f in export_formats_str.split(',')] if export_formats_str else ['csv']
-            
-            # Process all files
-            results = []
-            for file in files:
-                if not file.filename:
-                    continue
-                
-                filename = file.filename
-                file_content = file.read()
-                
-                # Use streaming method for large files (handles 100k+ entries)
-                try:
-                    outputs, report = data_clean_engine.clean_file_streaming(
-                        file_content,
-                        filename,
-                        file_type=file_type if file_type else None,
-                        delimiter=delimiter,
-                        normalize_headers=normalize_headers,
-                        drop_empty_rows=drop_empty_rows,
-                        apply_crm_mappings=apply_crm_mappings,
-                        sheet_name=sheet_name if sheet_name else None,
-                        chunk_size=10000,  # Process in 10k row chunks
-                        export_formats=export_formats,  # Only generate requested formats
-                    )
-                    
-                    # Filter outputs based on user's export format preferences
-                    import base64
-                    result_data = {
-                        'filename': filename,
-                        'success': True,
-                        'outputs': {},
-                        'column_files': {},
-                        'report': {
-                            'rows_in': report.rows_in,
-                            'rows_out': report.rows_out,
-                            'columns_in': report.columns_in,
-                            'columns_out': report.columns_out,
-                            'header_map': report.header_map,
-                            'fixes': report.fixes,
-                            'started_at': report.started_at,
-                            'finished_at': report.finished_at,
-                            'file_type': report.file_type,
-                            'crm_detected': report.crm_detected,
-                            'field_mappings': report.field_mappings,
-                            'duplicates_removed': getattr(report, 'duplicates_removed', 0),
-                            'irrelevant_rows_removed': getattr(report, 'irrelevant_rows_removed', 0),
-                        }
-                    }
-                    
-                    # Only include requested export formats
-                    if 'csv' in export_formats and outputs.get('master_cleanse_csv'):
-                        result_data['outputs']['master_cleanse_csv'] = outputs['master_cleanse_csv']
-                    
-                    if 'json' in export_formats and outputs.get('master_cleanse_json'):
-                        result_data['outputs']['master_cleanse_json'] = outputs['master_cleanse_json']
-                    
-                    if 'excel' in export_formats and outputs.get('master_cleanse_excel'):
-                        result_data['outputs']['master_cleanse_excel'] = base64.b64encode(
-                            outputs['master_cleanse_excel']
-                        ).decode('utf-8')
-                    
-                    # Column files (always included - core feature for data verification)
-                    if outputs.get('column_files'):
-                        for col_name, col_data in outputs['column_files'].items():
-                            result_data['column_files'][col_name] = {}
-                            if col_data.get('csv'):
-                                result_data['column_files'][col_name]['csv'] = col_data['csv']
-                            if col_data.get('json'):
-                                result_data['column_files'][col_name]['json'] = col_data['json']
-                            if col_data.get('excel'):
-                                result_data['column_files'][col_name]['excel'] = base64.b64encode(
-                                    col_data['excel']
-                                ).decode('utf-8')
-                    
-                    results.append(result_data)
-                    
-                except Exception as e:
-                    results.append({
-                        'filename': filename,
-                        'success': False,
-                        'error': str(e)
-                    })
+            # Process all files; with stream=true each file's result is sent (as an NDJSON
+            # line carrying its upload index) as soon as it finishes
+            _prune_data_clean_results()
+            results = _iter_data_clean_uploads(files, options, engine)
+            if request.form.get('stream', 'false').lower() == 'true':
+                return Response(
+                    stream_with_context(json.dumps({'index': i, **result}) + '\n' for i, result in results),
+                    mimetype='application/x-ndjson',
+                )
+            results = [result for _, result in sorted(results, key=lambda item: item[0])]
             
             # Return batch results
             if len(results) == 1:
@@ -255,8 +1001,9 @@ def data_clean():
             delimiter = data.get('delimiter', ',')
             normalize_headers = data.get('normalize_headers', True)
             drop_empty_rows = data.get('drop_empty_rows', True)
+            engine = _data_clean_engine_for(data.get('filter_rules'), data.get('default_filter_rules', True))
             
-            cleaned_csv, report = data_clean_engine.clean_csv_text(
+            cleaned_csv, report = engine.clean_csv_text(
                 csv_text,
                 delimiter=delimiter,
                 normalize_headers=normalize_headers,
@@ -280,6 +1027,14 @@ def data_clean():
                     'field_mappings': getattr(report, 'field_mappings', {}),
                     'duplicates_removed': getattr(report, 'duplicates_removed', 0),
                     'irrelevant_rows_removed': getattr(report, 'irrelevant_rows_removed', 0),
+                    'column_types': getattr(report, 'column_types', {}),
+                    'date_conventions': getattr(report, 'date_conventions', {}),
+                    'stage_timings': getattr(report, 'stage_timings', {}),
+                    'irrelevant_rows_by_rule': getattr(report, 'irrelevant_rows_by_rule', {}),
+                    'stage_metrics': _stage_metrics_json(report),
+                    'memory_metric': getattr(report, 'memory_metric', None),
+                    'profile_path': getattr(report, 'profile_path', None),
+                    'column_profiles': _column_profiles_json(report),
                 }
             })
         else:
@@ -290,6 +1045,317 @@ def data_clean():
         return jsonify({'success': False, 'error': str(e)}), 400
 
 
+@app.route('/api/services/data-clean/jobs', methods=['POST'])
+def data_clean_job_submit():
+    """Queue uploads (`file` / `files[]`, same form options as data-clean) for background cleaning"""
+    try:
+        files = request.files.getlist('files[]') or [request.files.get('file')]
+        files = [f for f in files if f and f.filename]
+        if not files:
+            return jsonify({'success': False, 'error': 'No files selected'}), 400
+        
+        options = _data_clean_form_options(request.form)
+        if options['all_sheets']:
+            return jsonify({'success': False, 'error': 'all_sheets is not supported for jobs; submit one job per sheet_name'}), 400
+        _data_clean_engine_for(options['filter_rules'], options['default_filter_rules'])  # reject bad rules now
+        
+        _prune_data_clean_results()
+        jobs = []
+        for file in files:
+            job_id = uuid.uuid4().hex
+            job_dir = os.path.join(DATA_CLEAN_JOBS_DIR, job_id)
+            os.makedirs(job_dir)
+            upload_path = os.path.join(job_dir, 'upload')
+            file.save(upload_path)
+            data_clean_jobs.create(job_id, file.filename, upload_path, os.path.getsize(upload_path), options)
+            data_clean_job_pool.submit(_run_data_clean_job, job_id)
+            jobs.append(_data_clean_job_status(data_clean_jobs.get(job_id)))
+        
+        if len(jobs) == 1:
+            return jsonify({'success': True, **jobs[0]}), 202
+        return jsonify({'success': True, 'batch': True, 'jobs': jobs}), 202
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+
+@app.route('/api/services/data-clean/jobs/<job_id>', methods=['GET'])
+def data_clean_job_status(job_id):
+    """Status of a data-clean job: stage, rows processed, percent of the upload read and ETA"""
+    job = data_clean_jobs.get(job_id) if _RESULT_ID_RE.match(job_id) else None
+    if job is None:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    return jsonify({'success': True, **_data_clean_job_status(job)})
+
+
+@app.route('/api/services/data-clean/jobs/<job_id>/result', methods=['GET'])
+def data_clean_job_result(job_id):
+    """Result of a finished data-clean job, shaped like a data-clean file response"""
+    job = data_clean_jobs.get(job_id) if _RESULT_ID_RE.match(job_id) else None
+    if job is None:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    if job['status'] == 'failed':
+        return jsonify({'success': False, 'error': job['error']}), 400
+    if job['status'] != 'succeeded':
+        return jsonify({'success': False, 'error': f"Job is {job['status']}"}), 409
+    result_dir = _result_dir(job['result_id'])
+    result_path = os.path.join(result_dir, 'job_result.json') if result_dir else None
+    if result_path is None or not os.path.exists(result_path):
+        return jsonify({'success': False, 'error': 'Result has expired'}), 404
+    with open(result_path, encoding='utf-8') as f:
+        result = json.load(f)
+    result['artifacts'] = _artifacts_with_urls(job['result_id'], result.get('artifacts', {}))
+    if result['column_manifest']:
+        result['column_manifest'] = _column_manifest_with_urls(job['result_id'], result['column_manifest'])
+    return jsonify(result)
+
+
+def _prune_stale_uploads():
+    """Fail resumable uploads whose first chunk hasn't arrived within the stall timeout"""
+    cutoff = datetime.datetime.fromtimestamp(
+        time.time() - DATA_CLEAN_UPLOAD_STALL_TIMEOUT, tz=datetime.timezone.utc
+    ).isoformat()
+    for job in data_clean_jobs.fail_stale_uploads(cutoff):
+        shutil.rmtree(os.path.dirname(job['upload_path']), ignore_errors=True)
+
+
+def _data_clean_upload_status(job, upload):
+    """Public view of a resumable upload: chunks received (with checksums) and still missing"""
+    received = upload['received']
+    return {
+        'upload_id': job['id'],
+        'filename': job['filename'],
+        'size': job['bytes_total'],
+        'chunk_size': upload['chunk_size'],
+        'chunks': upload['chunks'],
+        'received': [{'index': i, 'size': size, 'sha256': sha256} for i, (size, sha256) in received.items()],
+        'missing': [i for i in range(upload['chunks']) if i not in received],
+        'bytes_received': sum(size for size, _ in received.values()),
+        'completed': upload['completed_at'] is not None,
+        'upload_url': url_for('data_clean_upload_status', upload_id=job['id'], _external=True),
+        'complete_url': url_for('data_clean_upload_complete', upload_id=job['id'], _external=True),
+        'job': _data_clean_job_status(job),
+    }
+
+
+def _load_upload(upload_id):
+    """(job, upload) rows of a resumable upload, or (None, None)"""
+    job = data_clean_jobs.get(upload_id) if _RESULT_ID_RE.match(upload_id) else None
+    upload = data_clean_jobs.get_upload(upload_id) if job else None
+    return (job, upload) if upload else (None, None)
+
+
+@app.route('/api/services/data-clean/uploads', methods=['POST'])
+def data_clean_upload_initiate():
+    """
+    Start a resumable upload: form fields `filename`, `size` (bytes) and optional `chunk_size`,
+    plus the data-clean form options. Chunks are then PUT to `<upload_url>/chunks/<index>`.
+    """
+    try:
+        filename = (request.form.get('filename') or '').strip()
+        if not filename:
+            return jsonify({'success': False, 'error': 'filename is required'}), 400
+        try:
+            size = int(request.form.get('size', ''))
+            chunk_size = int(request.form.get('chunk_size') or DATA_CLEAN_UPLOAD_CHUNK_SIZE)
+        except ValueError:
+            return jsonify({'success': False, 'error': 'size and chunk_size must be integers'}), 400
+        if size <= 0:
+            return jsonify({'success': False, 'error': 'size must be positive'}), 400
+        if not DATA_CLEAN_UPLOAD_MIN_CHUNK_SIZE <= chunk_size <= DATA_CLEAN_UPLOAD_MAX_CHUNK_SIZE:
+            return jsonify({'success': False, 'error': (
+                f'chunk_size must be between {DATA_CLEAN_UPLOAD_MIN_CHUNK_SIZE} and {DATA_CLEAN_UPLOAD_MAX_CHUNK_SIZE} bytes'
+            )}), 400
+        
+        options = _data_clean_form_options(request.form)
+        if options['all_sheets']:
+            return jsonify({'success': False, 'error': 'all_sheets is not supported for jobs; submit one job per sheet_name'}), 400
+        _data_clean_engine_for(options['filter_rules'], options['default_filter_rules'])  # reject bad rules now
+        
+        _prune_data_clean_results()
+        _prune_stale_uploads()
+        job_id = uuid.uuid4().hex
+        chunk_dir = os.path.join(DATA_CLEAN_JOBS_DIR, job_id, 'chunks')
+        os.makedirs(chunk_dir)
+        data_clean_jobs.create_upload(job_id, filename, chunk_dir, size, chunk_size, options)
+        job, upload = _load_upload(job_id)
+        return jsonify({'success': True, **_data_clean_upload_status(job, upload)}), 201
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+
+@app.route('/api/services/data-clean/uploads/<upload_id>', methods=['GET'])
+def data_clean_upload_status(upload_id):
+    """Chunks a resumable upload has received and is missing, so an interrupted client can resume"""
+    job, upload = _load_upload(upload_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Upload not found'}), 404
+    return jsonify({'success': True, **_data_clean_upload_status(job, upload)})
+
+
+@app.route('/api/services/data-clean/uploads/<upload_id>/chunks/<int:index>', methods=['PUT'])
+def data_clean_upload_chunk(upload_id, index):
+    """
+    Store chunk `index` (the raw request body) of a resumable upload. The `X-Chunk-SHA256`
+    header (hex) is required and verified; resending a stored chunk is a no-op. Chunk 0
+    queues the cleaning job, which then reads each chunk as it arrives.
+    """
+    job, upload = _load_upload(upload_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Upload not found'}), 404
+    if job['status'] in ('succeeded', 'failed'):
+        return jsonify({'success': False, 'error': f"Upload's job has {job['status']}", 'job': _data_clean_job_status(job)}), 409
+    if not 0 <= index < upload['chunks']:
+        return jsonify({'success': False, 'error': f"Chunk index must be below {upload['chunks']}"}), 400
+    checksum = (request.headers.get('X-Chunk-SHA256') or '').strip().lower()
+    if not _SHA256_RE.match(checksum):
+        return jsonify({'success': False, 'error': 'X-Chunk-SHA256 header (hex SHA-256 of the chunk) is required'}), 400
+    if index in upload['received']:
+        if upload['received'][index][1] != checksum:
+            return jsonify({'success': False, 'error': f'Chunk {index} was already stored with a different checksum'}), 409
+        return jsonify({'success': True, 'index': index, 'size': upload['received'][index][0], 'sha256': checksum})
+    
+    expected_size = min(upload['chunk_size'], job['bytes_total'] - index * upload['chunk_size'])
+    chunk_path = _upload_chunk_path(job['upload_path'], index)
+    part_path = f'{chunk_path}.{uuid.uuid4().hex}.part'
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(part_path, 'wb') as f:
+            while size <= expected_size:
+                block = request.stream.read(1024 * 1024)
+                if not block:
+                    break
+                size += len(block)
+                digest.update(block)
+                f.write(block)
+        if size != expected_size:
+            return jsonify({'success': False, 'error': f'Chunk {index} must be {expected_size} bytes'}), 400
+        if digest.hexdigest() != checksum:
+            return jsonify({'success': False, 'error': f'Chunk {index} does not match its X-Chunk-SHA256'}), 422
+        # The rename publishes the verified chunk to a job reading the upload
+        os.replace(part_path, chunk_path)
+    except OSError as e:
+        return jsonify({'success': False, 'error': str(e)}), 409
+    finally:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+    if data_clean_jobs.add_chunk(upload_id, index, size, checksum) != checksum:
+        return jsonify({'success': False, 'error': f'Chunk {index} was already stored with a different checksum'}), 409
+    _notify_upload_chunk(upload_id)
+    if index == 0 and data_clean_jobs.start_upload(upload_id):
+        data_clean_upload_pool.submit(_run_data_clean_job, upload_id)
+    return jsonify({'success': True, 'index': index, 'size': size, 'sha256': checksum}), 201
+
+
+@app.route('/api/services/data-clean/uploads/<upload_id>/complete', methods=['POST'])
+def data_clean_upload_complete(upload_id):
+    """Finish a resumable upload once every chunk is stored; returns its cleaning job's status"""
+    job, upload = _load_upload(upload_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Upload not found'}), 404
+    missing = [i for i in range(upload['chunks']) if i not in upload['received']]
+    if missing:
+        return jsonify({'success': False, 'error': 'Upload is missing chunks', 'missing': missing}), 409
+    data_clean_jobs.complete_upload(upload_id)
+    return jsonify({'success': True, **_data_clean_job_status(data_clean_jobs.get(upload_id))}), 202
+
+
+@app.route('/api/services/data-clean/cache', methods=['GET'])
+def data_clean_cache_stats():
+    """Hit/miss counters and disk usage of the data clean result cache"""
+    if data_clean_cache is None:
+        return jsonify({'success': True, 'enabled': False})
+    return jsonify({'success': True, 'enabled': True, 'stats': data_clean_cache.stats()})
+
+
+@app.route('/api/services/data-clean/results/<result_id>/artifacts/<name>', methods=['GET'])
+def data_clean_artifact(result_id, name):
+    """
+    Download a stored master output. Text artifacts are sent zstd- or gzip-encoded when
+    the client accepts it; Range and conditional requests are answered from the file.
+    """
+    result_dir, artifacts = _load_result_artifacts(result_id)
+    if artifacts is None or name not in artifacts:
+        return jsonify({'success': False, 'error': 'Artifact not found'}), 404
+    artifact = artifacts[name]
+    path = os.path.join(result_dir, artifact['file'])
+    encoding = None
+    if _DATA_CLEAN_ARTIFACTS[name][2]:
+        offered = ['zstd', 'gzip'] if zstandard is not None else ['gzip']
+        encoding = request.accept_encodings.best_match(offered)
+    try:
+        if encoding:
+            path = _encoded_artifact(path, encoding)
+        response = send_file(
+            path,
+            mimetype=artifact['content_type'],
+            as_attachment=True,
+            download_name=artifact['download_name'],
+            conditional=True,
+        )
+    except OSError:
+        return jsonify({'success': False, 'error': 'Artifact not found'}), 404
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+@app.route('/api/services/data-clean/results/<result_id>/columns', methods=['GET'])
+def data_clean_column_manifest(result_id):
+    """Column file manifest (with download URLs) of a stored data-clean result"""
+    _, manifest = _load_result_manifest(result_id)
+    if manifest is None:
+        return jsonify({'success': False, 'error': 'Result not found'}), 404
+    return jsonify({'success': True, 'column_manifest': _column_manifest_with_urls(result_id, manifest)})
+
+
+@app.route('/api/services/data-clean/results/<result_id>/columns/<int:column>/<export_format>', methods=['GET'])
+def data_clean_column_file(result_id, column, export_format):
+    """Render one column file (csv, json or excel) from a stored data-clean result"""
+    result_dir, manifest = _load_result_manifest(result_id)
+    if manifest is None:
+        return jsonify({'success': False, 'error': 'Result not found'}), 404
+    if not 0 <= column < len(manifest['columns']) or export_format not in manifest['columns'][column]['files']:
+        return jsonify({'success': False, 'error': 'Column file not found'}), 404
+    try:
+        buffer = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+        data_clean_engine.render_column_file(os.path.join(result_dir, 'cleaned.csv'), column, export_format, buffer)
+        buffer.seek(0)
+        return send_file(
+            buffer,
+            mimetype=_COLUMN_FILE_MIMETYPES[export_format],
+            as_attachment=True,
+            download_name=manifest['columns'][column]['files'][export_format],
+        )
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+
+@app.route('/api/services/data-clean/results/<result_id>/columns.zip', methods=['GET'])
+def data_clean_column_zip(result_id):
+    """Stream a ZIP of column files; optional ?formats=csv,json and ?columns=0,3 narrow it down"""
+    result_dir, manifest = _load_result_manifest(result_id)
+    if manifest is None:
+        return jsonify({'success': False, 'error': 'Result not found'}), 404
+    formats_str = request.args.get('formats')
+    columns_str = request.args.get('columns')
+    try:
+        formats = [f.strip() for f in formats_str.split(',')] if formats_str else manifest['formats']
+        columns = [int(c) for c in columns_str.split(',')] if columns_str else None
+    except ValueError:
+        return jsonify({'success': False, 'error': 'columns must be a comma-separated list of indexes'}), 400
+    if columns and any(not 0 <= c < len(manifest['columns']) for c in columns):
+        return jsonify({'success': False, 'error': 'Column file not found'}), 404
+    
+    chunks = data_clean_engine.iter_column_zip(os.path.join(result_dir, 'cleaned.csv'), formats, columns)
+    return Response(
+        stream_with_context(chunks),
+        mimetype='application/zip',
+        headers={'Content-Disposition': f'attachment; filename="columns-{result_id}.zip"'},
+    )
+
+
 @app.route('/api/services/voice-of-customer', methods=['POST'])
 def voice_of_customer():
     """Voice of Customer analysis service"""
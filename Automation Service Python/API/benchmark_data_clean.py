@@ -0,0 +1,281 @@
+"""Benchmark the data clean engine on synthetic, deliberately dirty CRM exports
+
+Each (CRM, row count, method) run happens in a fresh process so peak RSS is per run.
+Results are written as JSON; pass an earlier file with --compare to see rows/sec changes.
+
+    python benchmark_data_clean.py --rows 10000,100000 --output bench.json
+    python benchmark_data_clean.py --output bench-new.json --compare bench.json
+"""
+import sys
+import os
+import csv
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import subprocess
+import multiprocessing
+import importlib.util
+import concurrent.futures
+
+# Add parent directory to path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+spec = importlib.util.spec_from_file_location(
+    'service_1datacleanengine', os.path.join(parent_dir, '1_data_clean_engine.py')
+)
+module = importlib.util.module_from_spec(spec)
+sys.modules['service_1datacleanengine'] = module
+spec.loader.exec_module(module)
+
+try:
+    import resource
+except ImportError:  # Windows: peak RSS is not reported
+    resource = None
+
+DEFAULT_ROWS = '10000,100000,1000000,5000000'
+METHODS = ('clean_csv_text', 'clean_file', 'clean_file_streaming')
+
+# Column layouts of each CRM's contact export; the engine detects the CRM from these headers
+CRM_HEADERS = {
+    'salesforce': [
+        'FirstName', 'LastName', 'Email', 'Phone', 'Company', 'Title', 'Lead_Source', 'Status',
+        'MailingCity', 'MailingState', 'CreatedDate', 'AnnualRevenue',
+    ],
+    'hubspot': [
+        'firstname', 'lastname', 'email', 'phone', 'company', 'jobtitle', 'leadsource',
+        'lifecyclestage', 'city', 'state', 'createdate', 'annualrevenue',
+    ],
+    'pipedrive': [
+        'first_name', 'last_name', 'email', 'phone', 'org_name', 'owner_name', 'label',
+        'status', 'city', 'state', 'add_time', 'value',
+    ],
+}
+FIRST_NAMES = ['James', 'Maria', ' Wei ', 'Aisha', 'Liam', 'Sofía', 'Noah', 'Priya', 'Olivia', 'Mateo']
+LAST_NAMES = ['Smith', 'Garcia', 'Chen', 'Okafor', "O'Brien", 'Müller', 'Nguyen', 'Patel', 'Rossi', 'Kim']
+COMPANIES = ['Acme Corp', 'Globex, Inc.', 'Initech', 'Umbrella LLC', 'Stark Industries', 'Wayne Enterprises']
+TITLES = ['VP Sales', 'CEO', 'Office Manager', 'Director of Ops', '', 'Buyer']
+SOURCES = ['Web', 'Referral', 'Trade Show', 'Cold Call', 'Partner', '']
+STATUSES = {
+    'salesforce': ['Open - Not Contacted', 'Working - Contacted', 'Closed - Converted', 'closed - converted '],
+    'hubspot': ['lead', 'subscriber', 'marketingqualifiedlead', 'customer', 'Lead '],
+    'pipedrive': ['open', 'won', 'lost', 'Open'],
+}
+CITIES = [('Austin', 'TX'), ('Denver', 'CO'), ('Boston', 'MA'), ('Seattle', 'WA'), ('Miami', 'FL')]
+
+
+def _dirty_date(rng, day):
+    """One date in a randomly chosen export format"""
+    year, month, dom = 2019 + day // 365 % 6, 1 + day // 28 % 12, 1 + day % 28
+    return rng.choice([
+        f'{year}-{month:02d}-{dom:02d}',
+        f'{month}/{dom}/{year}',
+        f'{month:02d}/{dom:02d}/{year % 100:02d}',
+        f'{dom}-{month}-{year}',
+        f'{year}-{month:02d}-{dom:02d}T{rng.randrange(24):02d}:{rng.randrange(60):02d}:00Z',
+        '',
+    ])
+
+
+def _dirty_amount(rng):
+    """A currency amount, often with thousands separators or padding"""
+    value = rng.randrange(100, 5_000_000) / rng.choice([1, 100])
+    return rng.choice([f'{value:,.2f}', f'{value:,.0f}', f'{value:.2f}', f' {value:.0f} ', ''])
+
+
+def iter_export_rows(crm, rows, seed=42):
+    """
+    Deterministic `crm`-shaped export of `rows` data rows (header first). Dirt is injected at
+    fixed rates: thousands separators, mixed date formats, padded cells, ragged rows, empty
+    rows, exact duplicates and test-data rows.
+    """
+    rng = random.Random(f'{crm}:{seed}')
+    headers = CRM_HEADERS[crm]
+    statuses = STATUSES[crm]
+    yield headers
+    previous = None
+    for i in range(rows):
+        roll = rng.random()
+        if previous is not None and roll < 0.03:
+            row = list(previous)  # exact duplicate
+        elif roll < 0.04:
+            row = [''] * len(headers)  # empty row
+        elif roll < 0.05:
+            row = ['Test', 'User', 'test@test.com', '123-456-7890', 'Example Co'] + [''] * (len(headers) - 5)
+        else:
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            city, state = rng.choice(CITIES)
+            row = [
+                first,
+                last,
+                f'{first.strip().lower()}.{last.lower()}{i}@example-mail.com'.replace("'", ''),
+                rng.choice(['(512) 555-{:04d}', '512.555.{:04d}', '+1 512 555 {:04d}']).format(i % 10000),
+                rng.choice(COMPANIES),
+                rng.choice(TITLES),
+                rng.choice(SOURCES),
+                rng.choice(statuses),
+                city,
+                state,
+                _dirty_date(rng, i),
+                _dirty_amount(rng),
+            ]
+            if rng.random() < 0.02:
+                row = row[:rng.randrange(3, len(row))]  # short row
+            elif rng.random() < 0.01:
+                row = row + ['', 'extra']  # long row
+            previous = row
+        yield row
+
+
+def write_export(path, crm, rows, seed=42):
+    """Write iter_export_rows to `path` as CSV (skipped if it is already there)"""
+    if os.path.exists(path):
+        return path
+    partial = f'{path}.partial'
+    with open(partial, 'w', encoding='utf-8', newline='') as f:
+        csv.writer(f).writerows(iter_export_rows(crm, rows, seed))
+    os.replace(partial, path)
+    return path
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def run_one(path, method, rows, backend, export_formats, workers):
+    """Clean one generated file with one engine method; runs in its own process"""
+    engine = module.ApexDataCleanEngine(backend=backend)
+    cpu0, t0 = time.process_time(), time.perf_counter()
+    if method == 'clean_csv_text':
+        with open(path, encoding='utf-8', newline='') as f:
+            _, report = engine.clean_csv_text(f.read())
+    elif method == 'clean_file':
+        with open(path, 'rb') as f:
+            _, report = engine.clean_file(f.read(), os.path.basename(path))
+    else:
+        with open(path, 'rb') as f:
+            _, report = engine.clean_file_streaming(
+                f, os.path.basename(path), export_formats=export_formats, workers=workers
+            )
+    seconds = time.perf_counter() - t0
+    return {
+        'seconds': round(seconds, 3),
+        'cpu_seconds': round(time.process_time() - cpu0, 3),
+        'rows_per_sec': round(rows / seconds) if seconds else None,
+        'peak_rss_mb': _peak_rss_mb(),
+        'rows_in': report.rows_in,
+        'rows_out': report.rows_out,
+        'stage_timings': {stage: round(s, 3) for stage, s in report.stage_timings.items()},
+        'stage_metrics': {
+            stage: {**vars(m), 'wall_seconds': round(m.wall_seconds, 3), 'cpu_seconds': round(m.cpu_seconds, 3)}
+            for stage, m in report.stage_metrics.items()
+        },
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=parent_dir, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(previous, current):
+    """Print the rows/sec change of every run present in both result files"""
+    def key(r):
+        return r['crm'], r['rows'], r['method']
+    before = {key(r): r for r in previous['results'] if 'rows_per_sec' in r}
+    print(f"\nvs {previous.get('git_commit') or 'previous run'}:")
+    for r in current['results']:
+        old = before.get(key(r))
+        if old and old['rows_per_sec'] and r.get('rows_per_sec'):
+            change = 100.0 * (r['rows_per_sec'] - old['rows_per_sec']) / old['rows_per_sec']
+            print(f"  {r['crm']:<10} {r['rows']:>9} {r['method']:<21} {old['rows_per_sec']:>9} -> "
+                  f"{r['rows_per_sec']:>9} rows/s ({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', default=DEFAULT_ROWS, help='comma-separated data row counts')
+    parser.add_argument('--crm', default=','.join(CRM_HEADERS), help='comma-separated export shapes')
+    parser.add_argument('--methods', default=','.join(METHODS), help='comma-separated engine methods')
+    parser.add_argument('--max-in-memory-rows', type=int, default=1_000_000,
+                        help='largest input given to clean_csv_text/clean_file, which load it whole')
+    parser.add_argument('--backend', default='auto', choices=module.CLEAN_BACKENDS)
+    parser.add_argument('--workers', type=int, default=1, help='clean_file_streaming process pool size')
+    parser.add_argument('--export-formats', default='csv', help='clean_file_streaming outputs')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'apex-benchmark-data'),
+                        help='where generated exports are kept between runs')
+    parser.add_argument('--output', default='benchmark-results.json')
+    parser.add_argument('--compare', help='earlier results JSON to compare rows/sec against')
+    args = parser.parse_args()
+
+    row_counts = [int(n) for n in args.rows.split(',')]
+    crms = args.crm.split(',')
+    methods = args.methods.split(',')
+    for name in crms:
+        if name not in CRM_HEADERS:
+            parser.error(f'unknown --crm {name!r}; choose from {", ".join(CRM_HEADERS)}')
+    for name in methods:
+        if name not in METHODS:
+            parser.error(f'unknown method {name!r}; choose from {", ".join(METHODS)}')
+    export_formats = [f.strip() for f in args.export_formats.split(',')]
+    os.makedirs(args.data_dir, exist_ok=True)
+
+    results = []
+    context = multiprocessing.get_context('spawn')
+    for rows in row_counts:
+        for crm in crms:
+            path = write_export(os.path.join(args.data_dir, f'{crm}-{rows}-{args.seed}.csv'), crm, rows, args.seed)
+            for method in methods:
+                if method != 'clean_file_streaming' and rows > args.max_in_memory_rows:
+                    continue
+                entry = {'crm': crm, 'rows': rows, 'method': method, 'input_bytes': os.path.getsize(path)}
+                # A fresh process per run keeps ru_maxrss from carrying over between runs
+                with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    try:
+                        entry.update(pool.submit(
+                            run_one, path, method, rows, args.backend, export_formats, args.workers
+                        ).result())
+                    except Exception as e:
+                        entry['error'] = str(e)
+                results.append(entry)
+                if 'error' in entry:
+                    print(f"ERROR: {crm:<10} {rows:>9} {method:<21} {entry['error']}")
+                else:
+                    print(f"{crm:<10} {rows:>9} {method:<21} {entry['rows_per_sec']:>9} rows/s  "
+                          f"{entry['seconds']:>8.2f}s  peak {entry['peak_rss_mb']} MB")
+
+    current = {
+        'git_commit': _git_commit(),
+        'generated_at': module.utc_now_iso(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'backend': args.backend,
+        'vectorized': module.ApexDataCleanEngine(backend=args.backend).vectorized,
+        'workers': args.workers,
+        'seed': args.seed,
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(current, f, indent=2)
+    print(f'\nWrote {args.output}')
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare(json.load(f), current)
+    return 1 if any('error' in r for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""Shared setup for the check scripts: loading the data clean engine and reporting OK/ERROR lines"""
+import sys
+import os
+import importlib.util
+
+# Add parent directory to path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+ENGINE_MODULE = 'service_1datacleanengine'
+
+
+def load_engine():
+    """The 1_data_clean_engine module, registered under the name api.py gives it"""
+    if ENGINE_MODULE in sys.modules:
+        return sys.modules[ENGINE_MODULE]
+    spec = importlib.util.spec_from_file_location(ENGINE_MODULE, os.path.join(parent_dir, '1_data_clean_engine.py'))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[ENGINE_MODULE] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class Checks:
+    """Prints one OK/ERROR line per check; exit() ends the script with status 1 if any failed"""
+
+    def __init__(self):
+        self.failures = 0
+
+    def __call__(self, label, ok):
+        print(f"{'OK' if ok else 'ERROR'}: {label}")
+        self.failures += not ok
+
+    def exit(self):
+        sys.exit(1 if self.failures else 0)
@@ -0,0 +1,123 @@
+"""Upload check: resumable chunked uploads must survive out-of-order chunks, resume and stall correctly"""
+import sys
+import os
+import io
+import time
+import shutil
+import hashlib
+import tempfile
+
+api_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, api_dir)
+
+# Jobs, uploads, results and the services' SQLite files all go to a scratch directory
+work_dir = tempfile.mkdtemp(prefix='apex-upload-test-')
+os.environ['APEX_DATA_CLEAN_JOBS_DB'] = os.path.join(work_dir, 'jobs.db')
+os.environ['APEX_DATA_CLEAN_JOBS_DIR'] = os.path.join(work_dir, 'jobs')
+os.environ['APEX_DATA_CLEAN_RESULTS_DIR'] = os.path.join(work_dir, 'results')
+os.environ['APEX_DATA_CLEAN_CACHE_DIR'] = os.path.join(work_dir, 'cache')
+os.chdir(work_dir)
+
+import api  # noqa: E402
+from check_support import Checks  # noqa: E402
+
+client = api.app.test_client()
+check = Checks()
+
+
+def build_fixture(rows=30000):
+    lines = ['First Name,Last Name,Email,Amount,Status']
+    for i in range(rows):
+        lines.append(f' Person{i} ,Last{i % 97},p{i}@x.com,"1,{i % 1000:03d}.50",{"Open" if i % 3 else "closed"}')
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def initiate(data, chunk_size):
+    response = client.post('/api/services/data-clean/uploads', data={
+        'filename': 'big.csv', 'size': str(len(data)), 'chunk_size': str(chunk_size), 'export_formats': 'csv',
+    })
+    return response.status_code, response.get_json()
+
+
+def put_chunk(upload_id, index, body, checksum=None):
+    headers = {'X-Chunk-SHA256': checksum or hashlib.sha256(body).hexdigest()}
+    return client.put(f'/api/services/data-clean/uploads/{upload_id}/chunks/{index}', data=body, headers=headers)
+
+
+def job_status(job_id):
+    return client.get(f'/api/services/data-clean/jobs/{job_id}').get_json()
+
+
+def wait_for_job(job_id, timeout=120):
+    deadline = time.time() + timeout
+    status = job_status(job_id)
+    while status['status'] not in ('succeeded', 'failed') and time.time() < deadline:
+        time.sleep(0.2)
+        status = job_status(job_id)
+    return status
+
+
+try:
+    data = build_fixture()
+    chunk_size = api.DATA_CLEAN_UPLOAD_MIN_CHUNK_SIZE
+    chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+    code, upload = initiate(data, chunk_size)
+    upload_id = upload['upload_id']
+    check(f'initiate lists all {len(chunks)} chunks as missing', code == 201 and upload['missing'] == list(range(len(chunks))))
+
+    # Chunk validation
+    check('a wrong checksum is rejected', put_chunk(upload_id, 1, chunks[1], '0' * 64).status_code == 422)
+    check('a short chunk is rejected', put_chunk(upload_id, 1, chunks[1][:10]).status_code == 400)
+    check('an out-of-range index is rejected', put_chunk(upload_id, len(chunks), b'x').status_code == 400)
+
+    # Out of order: later chunks are stored, but cleaning waits for chunk 0
+    for index in (3, 1):
+        check(f'chunk {index} stored out of order', put_chunk(upload_id, index, chunks[index]).status_code == 201)
+    check('no job runs before chunk 0', job_status(upload_id)['status'] == 'uploading')
+    complete = client.post(f'/api/services/data-clean/uploads/{upload_id}/complete')
+    check('completing early lists the missing chunks', complete.status_code == 409 and 0 in complete.get_json()['missing'])
+
+    # Chunk 0 starts the job, which cleans the prefix while the rest is still missing
+    put_chunk(upload_id, 0, chunks[0])
+    time.sleep(1)
+    check('chunk 0 starts the job', job_status(upload_id)['status'] in ('queued', 'running'))
+
+    # While the upload job waits for chunk 2, spooled jobs still run on the job workers
+    spooled = client.post('/api/services/data-clean/jobs', data={
+        'file': (io.BytesIO(chunks[0].rsplit(b'\n', 1)[0] + b'\n'), 'small.csv'), 'export_formats': 'csv',
+    }).get_json()
+    check('a spooled job finishes while the upload waits', wait_for_job(spooled['job_id'], 30)['status'] == 'succeeded')
+    check('the upload job is still waiting for chunk 2', job_status(upload_id)['status'] == 'running')
+
+    # Resume: a reconnecting client asks what is missing and sends only that
+    status = client.get(f'/api/services/data-clean/uploads/{upload_id}').get_json()
+    check('status lists received chunks with checksums', {c['index'] for c in status['received']} == {0, 1, 3})
+    check('resending a stored chunk is a no-op', put_chunk(upload_id, 1, chunks[1]).status_code == 200)
+    check('resending with another checksum conflicts', put_chunk(upload_id, 1, chunks[2][:len(chunks[1])]).status_code == 409)
+    for index in status['missing']:
+        put_chunk(upload_id, index, chunks[index])
+    complete = client.post(f'/api/services/data-clean/uploads/{upload_id}/complete')
+    check('complete is accepted once every chunk is stored', complete.status_code == 202)
+    final = wait_for_job(upload_id)
+    check(f"the upload job succeeds ({final.get('error')})", final['status'] == 'succeeded')
+
+    result = client.get(f'/api/services/data-clean/jobs/{upload_id}/result').get_json()
+    uploaded_csv = client.get(result['artifacts']['master_cleanse_csv']['url']).data
+    sync = client.post('/api/services/data-clean', data={
+        'file': (io.BytesIO(data), 'big.csv'), 'export_formats': 'csv', 'inline_outputs': 'true',
+    }).get_json()
+    check('chunked upload cleans like a single upload', uploaded_csv.decode('utf-8') == sync['outputs']['master_cleanse_csv'])
+    check('chunks are removed once cleaned', not os.path.exists(os.path.join(api.DATA_CLEAN_JOBS_DIR, upload_id)))
+    check('chunks are refused after the job finished', put_chunk(upload_id, 1, chunks[1]).status_code == 409)
+
+    # Stall: a job waiting longer than the stall timeout for its next chunk fails
+    api.DATA_CLEAN_UPLOAD_STALL_TIMEOUT = 1
+    _, stalled = initiate(data, chunk_size)
+    put_chunk(stalled['upload_id'], 0, chunks[0])
+    final = wait_for_job(stalled['upload_id'], 30)
+    check(f"a stalled upload fails ({final.get('error')})", final['status'] == 'failed' and 'stalled' in final['error'])
+finally:
+    os.chdir(api_dir)
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+check.exit()
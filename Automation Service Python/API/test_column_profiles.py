@@ -0,0 +1,104 @@
+"""Profile check: column profile sketches must stay within their accuracy bounds"""
+import math
+import random
+import collections
+
+from check_support import Checks, load_engine
+
+module = load_engine()
+check = Checks()
+
+
+def chunks(values, size):
+    return [values[i:i + size] for i in range(0, len(values), size)]
+
+
+# HyperLogLog: within 3 standard errors (1.04 / sqrt(2**p)) at every scale, exact-ish when small
+standard_error = 1.04 / math.sqrt(1 << module.COLUMN_PROFILE_HLL_PRECISION)
+for cardinality in (10, 1000, 20000, 200000):
+    hll = module._HyperLogLog()
+    values = [f'user{i}@example.com' for i in range(cardinality)]
+    for chunk in chunks(values, 5000):
+        hll.add_many(chunk)
+    estimate = hll.count()
+    error = abs(estimate - cardinality) / cardinality
+    check(f'HLL counts {cardinality} distinct as {estimate} ({error:.2%} off)', error <= 3 * standard_error)
+
+hll = module._HyperLogLog()
+hll.add_many(['a', 'b', 'c'] * 1000)
+check('HLL ignores repeats', hll.count() == 3)
+again = module._HyperLogLog()
+again.add_many(['c', 'b', 'a'])
+check('HLL registers do not depend on insertion order', hll.registers == again.registers)
+
+# Space-Saving: over a Zipf stream fed as per-chunk counts, every reported count is an upper
+# bound within `error` of the truth, and every value above N / capacity is reported
+rng = random.Random(7)
+weights = [1 / rank for rank in range(1, 5001)]
+stream = [f'v{i}' for i in rng.choices(range(5000), weights=weights, k=200000)]
+truth = collections.Counter(stream)
+top = module._SpaceSaving()
+for chunk in chunks(stream, 10000):
+    top.update(collections.Counter(chunk))
+check(f'Space-Saving keeps at most {top.capacity} counters', len(top.counts) <= top.capacity)
+check(
+    f'Space-Saving error bound {top.error} is within N / capacity',
+    top.error <= len(stream) // top.capacity,
+)
+check(
+    'every Space-Saving count overstates the true count by at most the error bound',
+    all(truth[value] <= n <= truth[value] + top.error for value, n in top.counts.items()),
+)
+heavy = {value for value, n in truth.items() if n > top.error}
+check(f'all {len(heavy)} values above the error bound are monitored', heavy <= set(top.counts))
+reported = [value for value, _ in top.top(module.COLUMN_PROFILE_TOP_VALUES)]
+expected = [value for value, _ in truth.most_common(module.COLUMN_PROFILE_TOP_VALUES)]
+check('Space-Saving reports the true top values in order', reported == expected)
+
+exact = module._SpaceSaving()
+exact.update(collections.Counter(['x'] * 5 + ['y'] * 3))
+check('Space-Saving under capacity is exact', exact.top(2) == [('x', 5), ('y', 3)] and exact.error == 0)
+
+# Reservoir: the sample is full-sized, drawn from the stream, and every position is equally
+# likely to be kept however the stream is chunked
+size, length, trials = 10, 200, 4000
+kept = collections.Counter()
+for seed in range(trials):
+    reservoir = module._Reservoir(size=size, seed=seed)
+    stream = [str(i) for i in range(length)]
+    for chunk in chunks(stream, 1 + seed % 37):
+        reservoir.extend(chunk)
+    kept.update(reservoir.items)
+    if len(reservoir.items) != size or len(set(reservoir.items)) != size or reservoir.seen != length:
+        check(f'reservoir with seed {seed} keeps {size} distinct stream values', False)
+        break
+else:
+    check(f'every reservoir keeps {size} distinct stream values', True)
+expected_hits = trials * size / length
+chi_square = sum((kept[str(i)] - expected_hits) ** 2 / expected_hits for i in range(length))
+# 199 degrees of freedom: mean 199, standard deviation ~20; 300 is beyond the 99.99th percentile
+check(f'reservoir inclusion is uniform (chi-square {chi_square:.0f} on {length - 1} dof)', chi_square < 300)
+first_half = sum(kept[str(i)] for i in range(length // 2)) / (trials * size)
+check(f'early and late values are kept equally ({first_half:.3f} from the first half)', abs(first_half - 0.5) < 0.02)
+
+small = module._Reservoir(size=size)
+small.extend(['a', 'b', 'c'])
+check('a stream shorter than the reservoir is kept whole', small.items == ['a', 'b', 'c'])
+
+# Profiler: exact row and null counts, sketch fields filled, numeric bounds by value not text
+headers = ['email', 'amount', 'status']
+rows = [[f'p{i % 500}@x.com', f'{i % 1000},5' if i % 1000 >= 1 else '', 'Open' if i % 4 else 'Closed'] for i in range(10000)]
+profiler = module._ColumnProfiler(headers, {'amount': 'numeric'})
+for chunk in chunks(rows, 3000):
+    profiler.add(chunk)
+profiles = profiler.profiles()
+check('rows and nulls are exact', profiles['amount'].rows == 10000 and profiles['amount'].nulls == 10)
+check(f"distinct emails estimated at {profiles['email'].distinct}", abs(profiles['email'].distinct - 500) <= 500 * 3 * standard_error)
+check('status top values are exact', profiles['status'].top_values == [('Open', 7500), ('Closed', 2500)])
+check(
+    'numeric bounds compare by value',
+    (profiles['amount'].min_value, profiles['amount'].max_value) == ('1,5', '999,5'),
+)
+check('samples hold only non-empty values', len(profiles['amount'].sample) == module.COLUMN_PROFILE_SAMPLE_SIZE and '' not in profiles['amount'].sample)
+
+check.exit()
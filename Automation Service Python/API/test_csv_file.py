@@ -0,0 +1,67 @@
+"""CSV file check: clean_csv_file must clean a file on disk exactly like clean_csv_text cleans its decoded text"""
+import os
+import shutil
+import tempfile
+
+from check_support import Checks, load_engine
+
+module = load_engine()
+engine = module.ApexDataCleanEngine(backend='python')
+check = Checks()
+
+
+def build_fixture(rows=3000):
+    lines = ['First Name,Email,Amount,Notes']
+    for i in range(rows):
+        lines.append(f' Zoë{i} ,p{i}@x.com,"1,{i % 1000:03d}.50",café – {i % 7}')
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def expected(data):
+    """What the in-memory path makes of the file, decoded the way clean_csv_file always has"""
+    cleaned, report = engine.clean_csv_text(data.decode('utf-8-sig', errors='replace'))
+    return cleaned.encode('utf-8'), report
+
+
+# Small windows so multi-byte characters and bad bytes straddle window edges
+module.CSV_FILE_WINDOW_BYTES = 4096
+fixture = build_fixture()
+bad = bytearray(fixture)
+for pos in (len(fixture) // 3, len(fixture) // 2, len(fixture) - 20):
+    bad[pos] = 0xFF  # invalid anywhere in UTF-8
+cases = (
+    ('a UTF-8 file', fixture),
+    ('a UTF-8 file with BOM', b'\xef\xbb\xbf' + fixture),
+    ('a file with invalid UTF-8 bytes', bytes(bad)),
+    ('a file with a latin-1 row', fixture + 'Zoë,z@x.com,1,ok\n'.encode('latin-1')),
+)
+
+work_dir = tempfile.mkdtemp(prefix='apex-csv-file-test-')
+try:
+    for label, data in cases:
+        input_path = os.path.join(work_dir, 'input.csv')
+        with open(input_path, 'wb') as f:
+            f.write(data)
+        output_path = os.path.join(work_dir, 'output.csv')
+        report = engine.clean_csv_file(input_path, output_path, chunk_size=500)
+        with open(output_path, 'rb') as f:
+            written = f.read()
+        cleaned, expected_report = expected(data)
+        check(
+            f'{label} cleans like the decoded text',
+            written == cleaned and report.fixes == expected_report.fixes and report.rows_out == expected_report.rows_out,
+        )
+    check('invalid bytes become U+FFFD', '�'.encode('utf-8') in written)
+
+    # Strict decoding fails on the first bad byte and leaves no output behind
+    strict_output = os.path.join(work_dir, 'strict.csv')
+    try:
+        engine.clean_csv_file(input_path, strict_output, strict_encoding=True)
+        check('strict decoding rejects invalid UTF-8', False)
+    except module.ServiceError as e:
+        check(f'strict decoding rejects invalid UTF-8 ({e})', 'not valid UTF-8' in str(e))
+    check('a rejected file leaves no output', sorted(os.listdir(work_dir)) == ['input.csv', 'output.csv'])
+finally:
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+check.exit()
@@ -0,0 +1,71 @@
+"""Dedup check: digests spilled to disk runs must dedup exactly like the in-memory table"""
+import os
+import shutil
+import hashlib
+import tempfile
+
+from check_support import Checks, load_engine
+
+module = load_engine()
+check = Checks()
+
+
+def digest(i):
+    return hashlib.blake2b(str(i).encode('utf-8'), digest_size=16).digest()
+
+
+def build_fixture(rows=20000):
+    """CSV with every tenth row repeated later in a different case, so it only dedups case-insensitively"""
+    lines = ['Name,Email,Status']
+    for i in range(rows):
+        lines.append(f'Person {i},p{i}@x.com,Open')
+        if i % 10 == 0 and i >= 100:
+            lines.append(f'PERSON {i - 100},P{i - 100}@X.COM,open')
+    return '\n'.join(lines) + '\n'
+
+
+spill_root = tempfile.mkdtemp(prefix='apex-dedup-test-')
+try:
+    # A 4 KB budget spills the table to disk runs many times over
+    index = module.RowDigestIndex(memory_limit=4096, spill_dir=spill_root, partitions=8)
+    with index:
+        n = 20000
+        added = [index.add(digest(i)) for i in range(n)]
+        check('every new digest is added', all(added))
+        check('the table spilled to disk runs', index.spills > 0)
+        check('len counts spilled and in-memory digests', len(index) == n)
+        check('repeats are rejected across runs', not any(index.add(digest(i)) for i in range(0, n, 7)))
+        check('every added digest is found', all(digest(i) in index for i in range(n)))
+        check('unseen digests are not found', not any(digest(i) in index for i in range(n, n + 5000)))
+        spill_dir = index._spill_dir
+    check('closing removes the spill directory', spill_dir is not None and not os.path.exists(spill_dir))
+
+    # Bloom filter of one run: no false negatives, false positives near the ~1% design rate
+    run_path = os.path.join(spill_root, 'run.bin')
+    members = [digest(i) for i in range(10000)]
+    run = module._SpilledRun(run_path, list(members))
+    try:
+        def bloom_hit(d):
+            return all(run._bloom[pos >> 3] & (1 << (pos & 7)) for pos in run._positions(d))
+        check('Bloom filter has no false negatives', all(bloom_hit(d) for d in members))
+        false_positives = sum(bloom_hit(digest(i)) for i in range(10000, 30000))
+        check(f'Bloom filter false-positive rate {false_positives / 20000:.2%} is under 2%', false_positives < 400)
+        check('run lookups agree with membership', all(d in run for d in members[::13]) and digest(-1) not in run)
+    finally:
+        run.close()
+
+    # End to end: a spilling engine cleans exactly like one deduping in memory
+    fixture = build_fixture().encode('utf-8')
+    in_memory = module.ApexDataCleanEngine(backend='python')
+    spilling = module.ApexDataCleanEngine(backend='python', dedup_memory_limit=4096, spill_dir=spill_root)
+    expected_csv, expected_report = in_memory.clean_file(fixture, 'fixture.csv')
+    actual_csv, actual_report = spilling.clean_file(fixture, 'fixture.csv')
+    check('spilled dedup output matches in-memory dedup', expected_csv == actual_csv)
+    check(
+        f"duplicates removed match ({actual_report.fixes['duplicates_removed']})",
+        expected_report.fixes['duplicates_removed'] == actual_report.fixes['duplicates_removed'] == 1990,
+    )
+finally:
+    shutil.rmtree(spill_root, ignore_errors=True)
+
+check.exit()
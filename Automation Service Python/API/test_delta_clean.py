@@ -0,0 +1,159 @@
+"""Delta check: cleaning against a prior snapshot must report exactly the rows added, changed and removed"""
+import os
+import io
+import csv
+import json
+import shutil
+import tempfile
+
+from check_support import Checks, load_engine
+
+module = load_engine()
+engine = module.ApexDataCleanEngine(backend='python')
+check = Checks()
+
+
+def to_csv(rows):
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator='\n').writerows([['Name', 'Email', 'Amount', 'Status']] + rows)
+    return buffer.getvalue().encode('utf-8')
+
+
+def read_rows(path):
+    with open(path, encoding='utf-8', newline='') as f:
+        return list(csv.reader(f))[1:]
+
+
+# Night 1: 1000 contacts, with padding and a duplicate the cleaner removes
+night1 = [[f' Person {i} ', f'p{i}@x.com', f'"{i},000"', 'Open'] for i in range(1000)]
+night1.append(list(night1[5]))
+
+# Night 2: 50 removed, 30 edited (amount changed), 20 added, the rest untouched, in a new order
+removed = set(range(0, 1000, 20))
+changed = set(range(3, 1000, 33)) - removed
+night2 = []
+for i in range(1000):
+    if i in removed:
+        continue
+    row = list(night1[i])
+    if i in changed:
+        row[2] = f'"{i},999"'
+    night2.append(row)
+night2.reverse()
+night2 += [[f'New Person {i}', f'new{i}@x.com', '1', 'New'] for i in range(20)]
+
+work_dir = tempfile.mkdtemp(prefix='apex-delta-test-')
+try:
+    first = engine.clean_delta(to_csv(night1), 'crm.csv', os.path.join(work_dir, 'night1'))
+    check(f'first run inserts every distinct row ({first.inserted})', first.inserted == 1000 and first.deleted == 0)
+    check('first run reports the duplicate', first.report.fixes['duplicates_removed'] == 1)
+
+    full_csv, full_report = engine.clean_file(to_csv(night2), 'crm.csv')
+    delta = engine.clean_delta(
+        to_csv(night2), 'crm.csv', os.path.join(work_dir, 'night2'), os.path.join(work_dir, 'night1')
+    )
+    check('merged output equals a full clean', open(delta.merged_path, encoding='utf-8').read() == full_csv)
+    check(
+        'report row counts equal a full clean',
+        (delta.report.rows_in, delta.report.rows_out) == (full_report.rows_in, full_report.rows_out),
+    )
+    unchanged = 1000 - len(removed) - len(changed)
+    check(
+        f'only added and changed rows are cleaned ({delta.rows_cleaned} cleaned, {delta.rows_reused} reused)',
+        delta.rows_cleaned == 20 + len(changed) and delta.rows_reused == unchanged,
+    )
+    check(f'unchanged rows are recognized ({delta.unchanged})', delta.unchanged == unchanged)
+    check(f'added and changed rows are inserted ({delta.inserted})', delta.inserted == 20 + len(changed))
+    check(f'removed and changed rows are deleted ({delta.deleted})', delta.deleted == len(removed) + len(changed))
+    check('no updates without a key', delta.updated == 0)
+    check(
+        'change-set files hold the counted rows',
+        len(read_rows(delta.inserted_path)) == delta.inserted and len(read_rows(delta.deleted_path)) == delta.deleted,
+    )
+
+    # Reused rows skip normalization: only the cleaned rows' cells reach a normalizer
+    class CountingEngine(module.ApexDataCleanEngine):
+        calls = 0
+
+        def _make_column_normalizers(self, schema, width):
+            def counted(normalize):
+                def wrapper(value, fixes):
+                    CountingEngine.calls += 1
+                    return normalize(value, fixes)
+                return wrapper
+            return [counted(n) for n in super()._make_column_normalizers(schema, width)]
+
+    counting = CountingEngine(backend='python')
+    counted = counting.clean_delta(
+        to_csv(night2), 'crm.csv', os.path.join(work_dir, 'counted'), os.path.join(work_dir, 'night1')
+    )
+    check(
+        f'unchanged rows are not re-normalized ({CountingEngine.calls} normalizer calls)',
+        CountingEngine.calls == counted.rows_cleaned * 4,
+    )
+    parallel = engine.clean_delta(
+        to_csv(night2), 'crm.csv', os.path.join(work_dir, 'parallel'), os.path.join(work_dir, 'night1'),
+        workers=2, chunk_size=100,
+    )
+    check(
+        'worker processes clean the same delta',
+        open(parallel.merged_path, 'rb').read() == open(delta.merged_path, 'rb').read()
+        and (parallel.inserted, parallel.deleted, parallel.rows_cleaned) == (delta.inserted, delta.deleted, delta.rows_cleaned),
+    )
+
+    # With a key, an edited row is one update (new and previous version) instead of insert + delete
+    keyed = engine.clean_delta(
+        to_csv(night2), 'crm.csv', os.path.join(work_dir, 'keyed'), os.path.join(work_dir, 'night1'), key='email'
+    )
+    check(
+        f'keyed delta counts added {keyed.inserted}, changed {keyed.updated}, removed {keyed.deleted}',
+        (keyed.inserted, keyed.updated, keyed.deleted) == (20, len(changed), len(removed)),
+    )
+    updated, previous = read_rows(keyed.updated_path), read_rows(keyed.updated_previous_path)
+    check(
+        'updated rows pair with their previous version by key',
+        len(updated) == len(previous) == len(changed)
+        and all(new[1] == old[1] and new[2] != old[2] for new, old in zip(updated, previous)),
+    )
+
+    # Re-running the same export against its own snapshot changes nothing
+    again = engine.clean_delta(
+        to_csv(night2), 'crm.csv', os.path.join(work_dir, 'again'), os.path.join(work_dir, 'night2')
+    )
+    check(
+        'an unchanged export is all unchanged',
+        (again.inserted, again.updated, again.deleted) == (0, 0, 0) and again.unchanged == again.report.rows_out,
+    )
+
+    # A snapshot cleaned with other options is refused
+    try:
+        engine.clean_delta(
+            to_csv(night2), 'crm.csv', os.path.join(work_dir, 'other'), os.path.join(work_dir, 'night2'),
+            normalize_headers=False,
+        )
+        check('a snapshot with other options is refused', False)
+    except module.ServiceError:
+        check('a snapshot with other options is refused', True)
+
+    # Snapshots from an older layout, or with files missing, are refused with a clear error
+    older, partial = os.path.join(work_dir, 'v1'), os.path.join(work_dir, 'partial')
+    for copy in (older, partial):
+        shutil.copytree(os.path.join(work_dir, 'night1'), copy)
+    with open(os.path.join(older, 'snapshot.json'), encoding='utf-8') as f:
+        meta = json.load(f)
+    with open(os.path.join(older, 'snapshot.json'), 'w', encoding='utf-8') as f:
+        json.dump({**meta, 'version': 1}, f)
+    os.remove(os.path.join(partial, 'index.bin'))
+    for label, snapshot, expected in (
+        ('a version 1 snapshot', older, 'layout version 1'),
+        ('an incomplete snapshot', partial, 'missing index.bin'),
+    ):
+        try:
+            engine.clean_delta(to_csv(night2), 'crm.csv', os.path.join(work_dir, 'refused'), snapshot)
+            check(f'{label} is refused', False)
+        except module.ServiceError as e:
+            check(f'{label} is refused ({e})', expected in str(e) and 'run a full clean' in str(e))
+finally:
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+check.exit()
@@ -0,0 +1,66 @@
+"""JSON ingest check: the incremental JSON/NDJSON parser must read split input exactly like json.loads"""
+import io
+import json
+
+from check_support import Checks, load_engine
+
+module = load_engine()
+engine = module.ApexDataCleanEngine(backend='python')
+check = Checks()
+
+
+def blocks(data, size):
+    """The input as `size`-byte blocks, splitting tokens, escapes and UTF-8 sequences"""
+    return iter([data[i:i + size] for i in range(0, len(data), size)])
+
+
+# Escapes, surrogate pairs, multi-byte UTF-8, long numbers and nested objects, all of which
+# land across block edges at some block size
+records = [
+    {'name': 'Zoë "Z" O\'Neil', 'note': 'tab\tnew\nline back\\slash', 'amount': 1234567.125},
+    {'name': 'emoji 😀 and é', 'address': {'city': 'Köln', 'geo': {'lat': -12.5e-3}}},
+    {'name': 'Lee', 'tags': ['a', 'b'], 'active': True, 'missing': None, 'id': 98765432109876543210},
+    {'late_key': 'only here', 'name': ' separator'},
+]
+array_doc = json.dumps(records, indent=1).encode('utf-8')
+escaped_doc = json.dumps(records, ensure_ascii=True).encode('utf-8')
+ndjson_doc = b'\n'.join(json.dumps(r, ensure_ascii=False).encode('utf-8') for r in records) + b'\n'
+
+for label, doc in (('array', array_doc), ('ASCII-escaped array', escaped_doc), ('NDJSON', ndjson_doc)):
+    for size in (1, 2, 3, 7, 64):
+        parsed = list(engine.iter_json_records(blocks(doc, size)))
+        check(f'{label} in {size}-byte blocks parses like json.loads', parsed == records)
+
+# The pull parser itself, refilling one character at a time
+reader = module._IncrementalJsonReader(io.StringIO('  [12345, "a\\"b\\u00e9", {"k": [1, 2.5e10]}]'), read_size=1)
+reader.take('[')
+values = [reader.value()]
+while reader.peek() == ',':
+    reader.take(',')
+    values.append(reader.value())
+reader.take(']')
+reader.finish()
+check('a number split at every character is read whole', values[0] == 12345)
+check('escapes split across refills decode', values[1] == 'a"bé')
+check('nested values split across refills decode', values[2] == {'k': [1, 2.5e10]})
+
+# Rows: header discovery picks up keys that first appear late, nested objects are dotted
+rows = list(engine.iter_json_rows(blocks(ndjson_doc, 5)))
+headers = rows[0]
+check(
+    'late keys and dotted nested columns join the header',
+    'late_key' in headers and 'address.city' in headers and 'address.geo.lat' in headers,
+)
+check('every row is padded to the full header', all(len(row) == len(headers) for row in rows[1:]))
+check('late key fills only its record', [row[headers.index('late_key')] for row in rows[1:]] == ['', '', '', 'only here'])
+check('nested value is flattened', rows[2][headers.index('address.city')] == 'Köln')
+
+# Malformed input fails with the character position, whatever the block size
+for size in (1, 4096):
+    try:
+        list(engine.iter_json_records(blocks(b'[{"a": 1}, {"a": 2,}]', size)))
+        check(f'malformed JSON in {size}-byte blocks raises', False)
+    except module.ServiceError as e:
+        check(f'malformed JSON in {size}-byte blocks raises with its position ({e})', 'char 19' in str(e))
+
+check.exit()
@@ -0,0 +1,135 @@
+"""Result cache check: keys must change with any input byte or option, and hits must return the stored result"""
+import os
+import json
+import shutil
+import tempfile
+
+from check_support import Checks, load_engine
+
+module = load_engine()
+check = Checks()
+
+
+def build_fixture(rows=2000, tag=''):
+    lines = ['First Name,Email,Amount,Status']
+    for i in range(rows):
+        lines.append(f' Person{tag}{i} ,p{i}@x.com,"1,{i % 1000:03d}.50",{"Open" if i % 3 else "closed"}')
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+work_dir = tempfile.mkdtemp(prefix='apex-cache-test-')
+try:
+    cache = module.ResultCache(os.path.join(work_dir, 'cache'))
+
+    # Keys: canonical over option order, distinct for any changed option or input digest
+    options = {'delimiter': ',', 'normalize_headers': True, 'export_formats': ['csv', 'json']}
+    base_key = cache.key('ab' * 32, options)
+    check('key ignores option order', base_key == cache.key('ab' * 32, dict(reversed(list(options.items())))))
+    check('key changes with the input digest', base_key != cache.key('cd' * 32, options))
+    for name, value in (('delimiter', ';'), ('normalize_headers', False), ('export_formats', ['csv'])):
+        check(f'key changes with {name}', base_key != cache.key('ab' * 32, {**options, name: value}))
+
+    # Engine: a repeat is a hit returning the same outputs and report; any change is a miss
+    engine = module.ApexDataCleanEngine(backend='python', result_cache=cache)
+    fixture = build_fixture()
+    first, first_report = engine.clean_file_streaming(fixture, 'fixture.csv', export_formats=['csv', 'json'])
+    second, second_report = engine.clean_file_streaming(fixture, 'fixture.csv', export_formats=['csv', 'json'])
+    check('first clean is a miss', first['_cache_hit'] is False and cache.misses == 1)
+    check('repeat clean is a hit', second['_cache_hit'] is True and cache.hits == 1)
+    check(
+        'hit returns the stored outputs',
+        all(first[name] == second[name] for name in ('master_cleanse_csv', 'master_cleanse_json', 'column_manifest')),
+    )
+    check(
+        'hit returns the stored report',
+        first_report.fixes == second_report.fixes and first_report.rows_out == second_report.rows_out
+        and set(first_report.column_profiles) == set(second_report.column_profiles),
+    )
+
+    def is_hit(engine, content, export_formats=('csv', 'json'), **kwargs):
+        outputs, _ = engine.clean_file_streaming(content, 'fixture.csv', export_formats=list(export_formats), **kwargs)
+        return outputs['_cache_hit']
+
+    edited = bytearray(fixture)
+    edited[-3] ^= 1
+    check('a one-byte edit invalidates', not is_hit(engine, bytes(edited)))
+    check('another delimiter invalidates', not is_hit(engine, fixture, delimiter=';'))
+    check('another header option invalidates', not is_hit(engine, fixture, normalize_headers=False))
+    check('another export format set invalidates', not is_hit(engine, fixture, export_formats=['csv']))
+    ruled = module.ApexDataCleanEngine(
+        backend='python', result_cache=cache, filter_rules=[module.FilterRule(name='closed', pattern='closed')]
+    )
+    check('other filter rules invalidate', not is_hit(ruled, fixture))
+    check('the original clean still hits', is_hit(engine, fixture))
+
+    # Output files: a hit copies the cached files into the new output directory
+    out_a, out_b = os.path.join(work_dir, 'a'), os.path.join(work_dir, 'b')
+    os.makedirs(out_a)
+    os.makedirs(out_b)
+    files_a, _ = engine.clean_file_streaming(fixture, 'fixture.csv', export_formats=['csv', 'json'], output_dir=out_a)
+    files_b, _ = engine.clean_file_streaming(fixture, 'fixture.csv', export_formats=['csv', 'json'], output_dir=out_b)
+    check('output_dir clean hits on repeat', files_a['_cache_hit'] is False and files_b['_cache_hit'] is True)
+    check(
+        'hit writes the cached files into the new output_dir',
+        all(
+            os.path.dirname(files_b['files'][name]) == out_b
+            and open(files_a['files'][name], 'rb').read() == open(files_b['files'][name], 'rb').read()
+            for name in files_a['files']
+        ),
+    )
+
+    # The entry holds its own copies: removing the caller's output_dir doesn't break hits
+    shutil.rmtree(out_a)
+    shutil.rmtree(out_b)
+    os.makedirs(out_b)
+    files_c, _ = engine.clean_file_streaming(fixture, 'fixture.csv', export_formats=['csv', 'json'], output_dir=out_b)
+    check(
+        'hit after the first output_dir is deleted',
+        files_c['_cache_hit'] is True and all(os.path.isfile(path) for path in files_c['files'].values()),
+    )
+
+    # A damaged entry is a miss, not an error
+    key = next(name for name in os.listdir(cache.cache_dir) if not name.startswith('.'))
+    with open(os.path.join(cache.cache_dir, key, 'entry.json'), 'w', encoding='utf-8') as f:
+        f.write('{not json')
+    check('a damaged entry reads as a miss', cache.get(key) is None)
+
+    # An entry with a file missing is a miss too; it is dropped and cached again by the clean
+    partial = module.ResultCache(os.path.join(work_dir, 'partial'))
+    partial_engine = module.ApexDataCleanEngine(backend='python', result_cache=partial)
+    partial_engine.clean_file_streaming(fixture, 'fixture.csv', export_formats=['csv', 'json'], output_dir=out_b)
+    (key,) = os.listdir(partial.cache_dir)
+    os.remove(os.path.join(partial.cache_dir, key, 'cleaned.csv'))
+    files_d, _ = partial_engine.clean_file_streaming(
+        fixture, 'fixture.csv', export_formats=['csv', 'json'], output_dir=out_b
+    )
+    check(
+        'an entry with a missing file is cleaned again, not copied',
+        files_d['_cache_hit'] is False and os.path.isfile(os.path.join(partial.cache_dir, key, 'cleaned.csv')),
+    )
+
+    # LRU eviction: room for two entries; touching A before adding C makes B the one evicted
+    def clean_tagged(engine, tag):
+        outputs, _ = engine.clean_file_streaming(build_fixture(tag=tag), f'{tag}.csv', export_formats=['csv'])
+        return outputs['_cache_hit']
+
+    probe = module.ResultCache(os.path.join(work_dir, 'probe'))
+    clean_tagged(module.ApexDataCleanEngine(backend='python', result_cache=probe), 'a')
+    entry_bytes = probe.stats()['bytes']
+    lru = module.ResultCache(os.path.join(work_dir, 'lru'), max_bytes=entry_bytes * 2 + entry_bytes // 2)
+    lru_engine = module.ApexDataCleanEngine(backend='python', result_cache=lru)
+    clean_tagged(lru_engine, 'a')
+    clean_tagged(lru_engine, 'b')
+    check('entries within max_bytes are kept', lru.stats()['entries'] == 2 and lru.evictions == 0)
+    for name in os.listdir(lru.cache_dir):
+        os.utime(os.path.join(lru.cache_dir, name), (0, 0))  # age both entries ...
+    check('a repeat of A hits', clean_tagged(lru_engine, 'a'))  # ... then A is used again
+    clean_tagged(lru_engine, 'c')
+    stats = lru.stats()
+    check(f"adding C past max_bytes evicts one entry ({json.dumps(stats)})", stats['evictions'] == 1 and stats['entries'] == 2)
+    check('the recently used entry survives', clean_tagged(lru_engine, 'a'))
+    check('the least recently used entry was evicted', not clean_tagged(lru_engine, 'b'))
+finally:
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+check.exit()
@@ -0,0 +1,89 @@
+"""Sniffing check: encoding, delimiter, quoting and header row must be settled from a bounded sample"""
+import io
+import csv
+
+from check_support import Checks, load_engine
+
+module = load_engine()
+engine = module.ApexDataCleanEngine(backend='python')
+check = Checks()
+
+
+def build_rows(rows=200):
+    out = [['Name', 'Company', 'Email', 'Amount', 'Notes']]
+    for i in range(rows):
+        out.append([f'Zoë {i}', f'Café; Bar, Inc {i % 7}', f'z{i}@x.com', f'{i}.50', '“quoted” €5 – ok'])
+    return out
+
+
+def to_text(rows, delimiter=',', quotechar='"'):
+    buffer = io.StringIO()
+    csv.writer(buffer, delimiter=delimiter, quotechar=quotechar, lineterminator='\r\n').writerows(rows)
+    return buffer.getvalue()
+
+
+def sniff(data, filename='upload.csv', **kwargs):
+    return engine.sniff_source(data, filename, **kwargs)[1]
+
+
+rows = build_rows()
+text = to_text(rows)
+latin_text = text.translate(str.maketrans('', '', '“”€–'))  # only characters latin-1 can encode
+
+# Encodings: a BOM wins, then UTF-16 NUL layout, strict UTF-8, and cp1252 / latin-1 for Windows exports
+encodings = (
+    ('UTF-8', text.encode('utf-8'), 'utf-8'),
+    ('UTF-8 with BOM', text.encode('utf-8-sig'), 'utf-8-sig'),
+    ('UTF-16 with BOM', text.encode('utf-16'), 'utf-16'),
+    ('UTF-16-LE without BOM', text.encode('utf-16-le'), 'utf-16-le'),
+    ('UTF-16-BE without BOM', text.encode('utf-16-be'), 'utf-16-be'),
+    ('cp1252', text.encode('cp1252'), 'cp1252'),
+    ('latin-1 with cp1252-undefined bytes', latin_text.encode('latin-1') + b'x\x81,y,z,1,n\r\n', 'latin-1'),
+)
+for label, data, expected in encodings:
+    fmt = sniff(data)
+    check(f'{label} sniffs as {expected} (got {fmt.encoding})', fmt.encoding == expected)
+
+# A multi-byte UTF-8 character cut by the sample boundary is still UTF-8
+padding = 'a' * (module.SNIFF_SAMPLE_BYTES - len('h\r\n') - 1)
+split_doc = ('h\r\n' + padding + 'é\r\n' * 10).encode('utf-8')
+check('UTF-8 split at the sample edge stays UTF-8', sniff(split_doc).encoding == 'utf-8')
+
+# Delimiters and quoting
+for delimiter, quotechar in ((',', '"'), (';', '"'), ('\t', '"'), ('|', '"'), (';', "'")):
+    fmt = sniff(to_text(rows, delimiter, quotechar).encode('utf-8'))
+    check(
+        f'delimiter {delimiter!r} with quote {quotechar!r} is sniffed',
+        fmt.delimiter == delimiter and fmt.quotechar == quotechar and fmt.columns == 5,
+    )
+check('an explicit delimiter is kept', sniff(text.encode('utf-8'), delimiter=';').delimiter == ';')
+check('.tsv files are tab-delimited', sniff(to_text(rows, '\t').encode('utf-8'), 'upload.tsv').delimiter == '\t')
+
+# Header row: labels vs typed values in the first row
+check('a label row is a header', sniff(text.encode('utf-8')).has_header)
+headerless = to_text(rows[1:]).encode('utf-8')
+check('a typed first row is data', not sniff(headerless).has_header)
+outputs, report = engine.clean_file_streaming(headerless, 'upload.csv', export_formats=['csv'])
+check(
+    'headerless files keep every row under column_N headers',
+    outputs['master_cleanse_csv'].startswith('column_1,column_2') and report.rows_in == len(rows) - 1,
+)
+
+# The sniffed source still yields every byte, seekable or not
+data = text.encode('cp1252') * 200
+for label, source in (('bytes', data), ('file', io.BytesIO(data)), ('block iterator', iter([data[:1000], data[1000:]]))):
+    replay, fmt = engine.sniff_source(source, 'upload.csv')
+    stream = engine._open_binary_stream(replay)
+    check(f'{label} source replays every byte after sniffing', stream.read() == data)
+
+# End to end: a cp1252 export cleans to the right characters; bad bytes past the sample fail clearly
+outputs, _ = engine.clean_file_streaming(text.encode('cp1252'), 'upload.csv', export_formats=['csv'])
+check('cp1252 upload decodes €, “ ” and ë', '“quoted” €5 – ok' in outputs['master_cleanse_csv'] and 'Zoë 1' in outputs['master_cleanse_csv'])
+late_garbage = text.encode('utf-8') * 60 + b'bad \xff\xfe row,x,y,1,n\r\n'
+try:
+    engine.clean_file_streaming(late_garbage, 'upload.csv', export_formats=['csv'])
+    check('invalid UTF-8 past the sample raises', False)
+except module.ServiceError as e:
+    check(f'invalid UTF-8 past the sample raises ({e})', 'past the sniffed sample' in str(e))
+
+check.exit()
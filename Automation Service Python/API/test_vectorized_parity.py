@@ -0,0 +1,71 @@
+"""Parity check: the NumPy/pandas backend must clean exactly like the pure-Python path"""
+import sys
+import random
+
+from check_support import Checks, load_engine
+
+module = load_engine()
+
+
+def build_fixture(rows=5000, seed=7):
+    """Messy CRM-style export: padding, thousands separators, mixed date formats,
+    short/long rows, empty rows, test data and exact duplicates"""
+    rng = random.Random(seed)
+    names = ['Bob', ' Amy ', 'Zoë', 'test user', 'Sample', 'Lee', '', 'xxx']
+    statuses = ['Open', 'Closed ', 'open', 'Won', '']
+    lines = ['First Name,Last Name,Email,Amount,Created Date,Status,Notes']
+    for i in range(rows):
+        first = rng.choice(names)
+        amount = rng.choice(['"1,234.50"', '1,234.50', '42', ' 7 ', '', '"12,000"'])
+        date = rng.choice(['12/29/2025', '2025-01-02', '3-4-24', '2024-02-03T10:00:00Z', '31/12/2024', 'soon'])
+        notes = rng.choice(['', 'call back', 'example row', '"multi\nline"', 'ok 123'])
+        line = f'{first},Last{i % 97},u{i % 300}@x.com,{amount},{date},{rng.choice(statuses)},{notes}'
+        if i % 53 == 0:
+            line = ',,,,,,'
+        if i % 41 == 0:
+            line = f'{first},Short'
+        lines.append(line)
+        if i % 17 == 0:
+            lines.append(line)
+    return '\n'.join(lines) + '\n'
+
+
+if module._vector_modules() is None:
+    print('SKIP: numpy is not installed; only the pure-Python backend is available')
+    sys.exit(0)
+
+python_engine = module.ApexDataCleanEngine(backend='python')
+vector_engine = module.ApexDataCleanEngine(backend='numpy')
+fixture = build_fixture()
+check = Checks()
+
+
+def same_result(expected, actual):
+    (expected_csv, expected_report), (actual_csv, actual_report) = expected, actual
+    same = expected_csv == actual_csv and expected_report.fixes == actual_report.fixes
+    return same and expected_report.rows_out == actual_report.rows_out
+
+
+for infer_types in (True, False):
+    check(f'clean_csv_text infer_types={infer_types}', same_result(
+        python_engine.clean_csv_text(fixture, infer_types=infer_types),
+        vector_engine.clean_csv_text(fixture, infer_types=infer_types),
+    ))
+    check(f'clean_file infer_types={infer_types}', same_result(
+        python_engine.clean_file(fixture.encode('utf-8'), 'fixture.csv', infer_types=infer_types),
+        vector_engine.clean_file(fixture.encode('utf-8'), 'fixture.csv', infer_types=infer_types),
+    ))
+
+for chunk_size in (100, 10000):
+    expected, actual = [
+        engine.clean_file_streaming(
+            fixture.encode('utf-8'), 'fixture.csv', chunk_size=chunk_size, export_formats=['csv']
+        )
+        for engine in (python_engine, vector_engine)
+    ]
+    check(f'clean_file_streaming chunk_size={chunk_size}', same_result(
+        (expected[0]['master_cleanse_csv'], expected[1]),
+        (actual[0]['master_cleanse_csv'], actual[1]),
+    ))
+
+check.exit()
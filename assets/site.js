@@ -2599,7 +2599,7 @@ function displayProcessingSummary(results, resultDiv, button, originalText) {
           </div>
           
           ${buildFileExportSection(result.data, result.exportFormats, result.filename)}
-          ${result.data.column_files ? buildColumnFilesSection(result.data.column_files, result.filename.replace(/\.[^/.]+$/, '')) : ''}
+          ${result.data.column_manifest ? buildColumnFilesSection(result.data.column_manifest, result.filename.replace(/\.[^/.]+$/, '')) : ''}
         </div>
       `;
     } else {
@@ -2624,27 +2624,21 @@ function displayProcessingSummary(results, resultDiv, button, originalText) {
 
 function buildFileExportSection(data, exportFormats, filename) {
   const outputs = data.outputs || {};
-  const columnFiles = data.column_files || {};
   const baseFilename = filename.replace(/\.[^/.]+$/, '');
   
   // Check for skipped exports due to file size
   const warnings = [];
   if (outputs._json_skipped) warnings.push(outputs._json_skipped);
   if (outputs._excel_skipped) warnings.push(outputs._excel_skipped);
+  if (outputs._csv_skipped) warnings.push(outputs._csv_skipped);
   if (outputs._excel_error) warnings.push(`Excel export failed: ${outputs._excel_error}`);
-  if (outputs._columns_note) warnings.push(outputs._columns_note);
   
-  // Build available downloads
-  const availableDownloads = [];
-  if (exportFormats.includes('csv') && outputs.master_cleanse_csv) {
-    availableDownloads.push({type: 'csv', label: '📄 Master CSV', data: outputs.master_cleanse_csv, filename: `${baseFilename}_master_cleaned.csv`, mime: 'text/csv'});
-  }
-  if (exportFormats.includes('json') && outputs.master_cleanse_json) {
-    availableDownloads.push({type: 'json', label: '📋 Master JSON', data: outputs.master_cleanse_json, filename: `${baseFilename}_master_cleaned.json`, mime: 'application/json'});
-  }
-  if (exportFormats.includes('excel') && outputs.master_cleanse_excel) {
-    availableDownloads.push({type: 'excel', label: '📊 Master Excel', data: outputs.master_cleanse_excel, filename: `${baseFilename}_master_cleaned.xlsx`, mime: 'excel'});
-  }
+  // Build available downloads (stored artifacts are fetched by URL when downloaded)
+  const availableDownloads = buildMasterDownloads(data, exportFormats, {
+    csv: {label: '📄 Master CSV', filename: `${baseFilename}_master_cleaned.csv`},
+    json: {label: '📋 Master JSON', filename: `${baseFilename}_master_cleaned.json`},
+    excel: {label: '📊 Master Excel', filename: `${baseFilename}_master_cleaned.xlsx`},
+  });
   
   const downloadId = `download-${baseFilename.replace(/[^a-zA-Z0-9]/g, '_')}`;
   
@@ -2671,8 +2665,7 @@ function buildFileExportSection(data, exportFormats, filename) {
               <label style="display:flex;align-items:center;gap:8px;cursor:pointer;font-size:13px;color:#000000;padding:6px;border-radius:4px;transition:background 0.2s;" 
                      onmouseover="this.style.background='rgba(59,130,246,0.1)'" 
                      onmouseout="this.style.background='transparent'">
-                <input type="checkbox" class="download-checkbox" data-type="${dl.type}" data-filename="${dl.filename}" data-mime="${dl.mime}" 
-                       data-content="${dl.type === 'excel' ? dl.data : dl.data.replace(/'/g, '&apos;').replace(/\n/g, '\\n')}">
+                ${downloadCheckbox(dl)}
                 <span style="color:#000000;">${dl.label}</span>
               </label>
             `).join('')}
@@ -2717,11 +2710,12 @@ function displaySingleFileResult(data, resultDiv, exportFormats) {
   
   // Build export buttons based on available outputs and selected formats
   const outputs = data.outputs || {};
-  const exportButtons = buildExportButtons(outputs, data.report.file_type, exportFormats);
+  const csvPreview = data.csv_preview || outputs.master_cleanse_csv;
+  const exportButtons = buildExportButtons(data, data.report.file_type, exportFormats);
   
   // Column files section (always show - core feature)
-  const columnFilesSection = data.column_files ? 
-    buildColumnFilesSection(data.column_files, 'cleaned_data') : '';
+  const columnFilesSection = data.column_manifest ? 
+    buildColumnFilesSection(data.column_manifest, 'cleaned_data') : '';
   
   resultDiv.innerHTML = `
     <div style="background:rgba(34,197,94,0.1);border:1px solid rgba(34,197,94,0.3);border-radius:8px;padding:16px;margin-bottom:16px;">
@@ -2744,10 +2738,10 @@ function displaySingleFileResult(data, resultDiv, exportFormats) {
     
     ${columnFilesSection}
     
-    ${outputs.master_cleanse_csv ? `
+    ${csvPreview ? `
     <div style="margin-bottom:16px;">
       <label style="display:block;margin-bottom:8px;font-weight:500;">Preview (CSV):</label>
-      <textarea readonly rows="8" id="cleaned-csv-output" style="width:100%;padding:12px;border:1px solid var(--border);border-radius:8px;font-family:monospace;background:var(--bg);font-size:12px;">${outputs.master_cleanse_csv.substring(0, 2000)}${outputs.master_cleanse_csv.length > 2000 ? '...' : ''}</textarea>
+      <textarea readonly rows="8" id="cleaned-csv-output" style="width:100%;padding:12px;border:1px solid var(--border);border-radius:8px;font-family:monospace;background:var(--bg);font-size:12px;">${csvPreview.substring(0, 2000)}${csvPreview.length >= 2000 ? '...' : ''}</textarea>
     </div>
     ` : ''}
   `;
@@ -2776,8 +2770,12 @@ function downloadSelectedFiles(downloadId) {
       const filename = checkbox.getAttribute('data-filename');
       const mime = checkbox.getAttribute('data-mime');
       const content = checkbox.getAttribute('data-content');
+      const url = checkbox.getAttribute('data-url');
       
-      if (type === 'excel') {
+      if (url) {
+        // Rendered on demand by the API
+        downloadFromUrl(url, filename);
+      } else if (type === 'excel') {
         downloadExcelFromBase64(content, filename);
       } else {
         // Decode the content (it was escaped for HTML)
@@ -2793,18 +2791,39 @@ function downloadSelectedFiles(downloadId) {
   }, checkboxes.length * 200 + 100);
 }
 
-function buildExportButtons(outputs, originalFileType, exportFormats) {
-  // Build available downloads
-  const availableDownloads = [];
-  if (exportFormats.includes('csv') && outputs.master_cleanse_csv) {
-    availableDownloads.push({type: 'csv', label: '📄 CSV', data: outputs.master_cleanse_csv, filename: 'cleaned_data.csv', mime: 'text/csv'});
-  }
-  if (exportFormats.includes('json') && outputs.master_cleanse_json) {
-    availableDownloads.push({type: 'json', label: '📋 JSON', data: outputs.master_cleanse_json, filename: 'cleaned_data.json', mime: 'application/json'});
+function buildMasterDownloads(data, exportFormats, labels) {
+  // Master outputs are stored artifacts with download URLs; inline outputs (inline_outputs=true) still work
+  const artifacts = data.artifacts || {};
+  const outputs = data.outputs || {};
+  const mimes = {csv: 'text/csv', json: 'application/json', excel: 'excel'};
+  const downloads = [];
+  for (const type of ['csv', 'json', 'excel']) {
+    const name = `master_cleanse_${type}`;
+    if (!exportFormats.includes(type)) continue;
+    if (artifacts[name]) {
+      downloads.push({type: type, label: labels[type].label, url: artifacts[name].url, filename: labels[type].filename, mime: mimes[type]});
+    } else if (outputs[name]) {
+      downloads.push({type: type, label: labels[type].label, data: outputs[name], filename: labels[type].filename, mime: mimes[type]});
+    }
   }
-  if (exportFormats.includes('excel') && outputs.master_cleanse_excel) {
-    availableDownloads.push({type: 'excel', label: '📊 Excel', data: outputs.master_cleanse_excel, filename: 'cleaned_data.xlsx', mime: 'excel'});
+  return downloads;
+}
+
+function downloadCheckbox(dl) {
+  if (dl.url) {
+    return `<input type="checkbox" class="download-checkbox" data-type="${dl.type}" data-filename="${dl.filename}" data-url="${dl.url}">`;
   }
+  return `<input type="checkbox" class="download-checkbox" data-type="${dl.type}" data-filename="${dl.filename}" data-mime="${dl.mime}" 
+                       data-content="${dl.type === 'excel' ? dl.data : dl.data.replace(/'/g, '&apos;').replace(/\n/g, '\\n')}">`;
+}
+
+function buildExportButtons(data, originalFileType, exportFormats) {
+  // Build available downloads
+  const availableDownloads = buildMasterDownloads(data, exportFormats, {
+    csv: {label: '📄 CSV', filename: 'cleaned_data.csv'},
+    json: {label: '📋 JSON', filename: 'cleaned_data.json'},
+    excel: {label: '📊 Excel', filename: 'cleaned_data.xlsx'},
+  });
   
   const downloadId = 'download-single';
   
@@ -2821,8 +2840,7 @@ function buildExportButtons(outputs, originalFileType, exportFormats) {
             <label style="display:flex;align-items:center;gap:8px;cursor:pointer;font-size:13px;color:#000000;padding:6px;border-radius:4px;transition:background 0.2s;" 
                    onmouseover="this.style.background='rgba(59,130,246,0.1)'" 
                    onmouseout="this.style.background='transparent'">
-              <input type="checkbox" class="download-checkbox" data-type="${dl.type}" data-filename="${dl.filename}" data-mime="${dl.mime}" 
-                     data-content="${dl.type === 'excel' ? dl.data : dl.data.replace(/'/g, '&apos;').replace(/\n/g, '\\n')}">
+              ${downloadCheckbox(dl)}
               <span style="color:#000000;">${dl.label}</span>
             </label>
           `).join('')}
@@ -2837,21 +2855,17 @@ function buildExportButtons(outputs, originalFileType, exportFormats) {
   `;
 }
 
-function buildColumnFilesSection(columnFiles, baseFilename = 'cleaned_data') {
+function buildColumnFilesSection(columnManifest, baseFilename = 'cleaned_data') {
   const columnId = `columns-${baseFilename.replace(/[^a-zA-Z0-9]/g, '_')}`;
+  const formatLabels = {csv: 'CSV', json: 'JSON', excel: 'Excel'};
+  const formatExtensions = {csv: 'csv', json: 'json', excel: 'xlsx'};
   
-  // Build all available column downloads
+  // Column files are rendered by the API when downloaded; the manifest only lists them
   const columnDownloads = [];
-  for (const [colName, colData] of Object.entries(columnFiles)) {
-    const safeColName = colName.replace(/[^a-zA-Z0-9]/g, '_');
-    if (colData.csv) {
-      columnDownloads.push({type: 'csv', label: `${colName} (CSV)`, data: colData.csv, filename: `${baseFilename}_column_${safeColName}.csv`, mime: 'text/csv'});
-    }
-    if (colData.json) {
-      columnDownloads.push({type: 'json', label: `${colName} (JSON)`, data: colData.json, filename: `${baseFilename}_column_${safeColName}.json`, mime: 'application/json'});
-    }
-    if (colData.excel) {
-      columnDownloads.push({type: 'excel', label: `${colName} (Excel)`, data: colData.excel, filename: `${baseFilename}_column_${safeColName}.xlsx`, mime: 'excel'});
+  for (const col of columnManifest.columns || []) {
+    const safeColName = col.name.replace(/[^a-zA-Z0-9]/g, '_');
+    for (const [format, url] of Object.entries(col.urls || {})) {
+      columnDownloads.push({type: format, label: `${col.name} (${formatLabels[format] || format})`, url: url, filename: `${baseFilename}_column_${safeColName}.${formatExtensions[format] || format}`});
     }
   }
   
@@ -2871,8 +2885,7 @@ function buildColumnFilesSection(columnFiles, baseFilename = 'cleaned_data') {
               <label style="display:flex;align-items:center;gap:8px;cursor:pointer;font-size:13px;color:#000000;padding:6px;border-radius:4px;transition:background 0.2s;" 
                      onmouseover="this.style.background='rgba(59,130,246,0.1)'" 
                      onmouseout="this.style.background='transparent'">
-                <input type="checkbox" class="download-checkbox" data-type="${dl.type}" data-filename="${dl.filename}" data-mime="${dl.mime}" 
-                       data-content="${dl.type === 'excel' ? dl.data : dl.data.replace(/'/g, '&apos;').replace(/\n/g, '\\n')}">
+                <input type="checkbox" class="download-checkbox" data-type="${dl.type}" data-filename="${dl.filename}" data-url="${dl.url}">
                 <span style="color:#000000;">${dl.label}</span>
               </label>
             `).join('')}
@@ -2882,6 +2895,12 @@ function buildColumnFilesSection(columnFiles, baseFilename = 'cleaned_data') {
                   style="width:100%;margin-top:12px;padding:10px;background:#3b82f6;color:#ffffff;border:none;border-radius:6px;cursor:pointer;font-weight:500;font-size:14px;">
             Download Selected
           </button>
+          ${columnManifest.zip_url ? `
+            <a href="${columnManifest.zip_url}" download="${baseFilename}_columns.zip"
+               style="display:block;margin-top:8px;padding:10px;text-align:center;border:1px solid #3b82f6;color:#3b82f6;border-radius:6px;text-decoration:none;font-weight:500;font-size:14px;">
+              Download All (ZIP)
+            </a>
+          ` : ''}
         </div>
       </div>
     </div>
@@ -2928,6 +2947,15 @@ function displayBatchResults(results, resultDiv, button, originalText) {
   button.textContent = originalText;
 }
 
+function downloadFromUrl(url, filename) {
+  const a = document.createElement('a');
+  a.href = url;
+  a.download = filename;
+  document.body.appendChild(a);
+  a.click();
+  document.body.removeChild(a);
+}
+
 function downloadFile(content, filename, mimeType) {
   try {
     const blob = new Blob([content], { type: mimeType + ';charset=utf-8;' });